@@ -1,16 +1,16 @@
-import json
-import psycopg2.extras
-from utils.db_connection import get_db_connection
+import psycopg2
+from utils.db_connection import get_db_connection, dict_cursor
 from utils.validation import validate_category_event_body
-from utils.json_default import json_default
 from utils.custom_exceptions import DatabaseInsertError
 from utils.logger import logger
+from utils.serializer import dumps
+from utils.table_versions import bump_table_version
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
 def post_category_to_db(category):
     try:
         with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with dict_cursor(conn) as cursor:
                 cursor.execute(
                     """
                     INSERT INTO categories (name)
@@ -24,7 +24,8 @@ def post_category_to_db(category):
                 if not response:
                     logger.error("Failed to insert category - no result returned")
                     raise DatabaseInsertError("Failed to create category", status_code=500)
-                
+
+                bump_table_version(cursor, 'categories')
                 return response
            
     except psycopg2.Error as e:
@@ -42,5 +43,5 @@ def lambda_handler(event, context):
     logger.info(f'Create category successful: {category_data}')
     return {
         'statusCode': 201,
-        'body': json.dumps(category_data, default=json_default)
+        'body': dumps(category_data)
     }
\ No newline at end of file
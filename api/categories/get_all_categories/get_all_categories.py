@@ -1,14 +1,16 @@
-import json
-import psycopg2.extras
+import psycopg2
 from utils.logger import logger
-from utils.db_connection import get_db_connection
-from utils.json_default import json_default
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
+from utils.cache import read_through_cache
+from utils.conditional_get import conditional_get
+from utils.pg_json import postgres_rendering_enabled, json_timestamp, json_array
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
 def get_all_categories_from_db():
     try:
-        with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+        with get_db_connection(readonly=True) as conn:
+            with dict_cursor(conn) as cursor:
                 cursor.execute(
                     """
                     SELECT id, name, created_at FROM categories
@@ -33,13 +35,46 @@ def get_all_categories_from_db():
         logger.error(f"Unexpected error while fetching all categories: {e}")
         raise
 
+def get_all_categories_json_from_db():
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT {json_array('row_to_json(rendered)', 'categories.created_at DESC')}, count(*)
+                    FROM categories
+                    CROSS JOIN LATERAL (
+                        SELECT categories.id, categories.name, {json_timestamp('categories.created_at')} AS created_at
+                    ) AS rendered
+                    WHERE categories.deleted = false;
+                    """
+                    )
+                body, count = cursor.fetchone()
+
+                logger.info(f"Successfully rendered {count} categories in the database")
+                return body
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error while fetching all categories: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while fetching all categories: {e}")
+        raise
+
 @lambda_exception_handler_wrapper
+@conditional_get(('categories',))
 def lambda_handler(event, context):
-    categories = get_all_categories_from_db()
+    if postgres_rendering_enabled():
+        return {
+            'statusCode': 200,
+            'body': read_through_cache(('get_all_categories_json',), ('categories',), get_all_categories_json_from_db)
+        }
+
+    categories = read_through_cache(('get_all_categories',), ('categories',), get_all_categories_from_db)
     
     logger.info(f"Successfully processed request, returning {len(categories)} categories")
 
     return {
         'statusCode': 200,
-        'body': json.dumps(categories, default=json_default)
+        'body': dumps(categories)
     }
@@ -3,6 +3,7 @@ from utils.logger import logger
 from utils.db_connection import get_db_connection
 from utils.validation import extract_id_path_param
 from utils.custom_exceptions import ResourceNotFoundError
+from utils.table_versions import bump_table_version
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
 def delete_category_from_db(category_id):
@@ -24,7 +25,9 @@ def delete_category_from_db(category_id):
                 if not deleted:
                     logger.info(f"Category with ID {category_id} not found for deletion.")
                     raise ResourceNotFoundError(f"Category with ID {category_id} not found")
-                
+
+                bump_table_version(cursor, 'categories')
+
                 deleted_id = deleted[0]
                 return deleted_id
             
@@ -1,16 +1,16 @@
-import json
-import psycopg2.extras
+import psycopg2
 from utils.logger import logger
-from utils.db_connection import get_db_connection
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
 from utils.validation import validate_category_event_body, extract_id_path_param
-from utils.json_default import json_default
 from utils.custom_exceptions import ActiveResourceNotFoundError
+from utils.table_versions import bump_table_version
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
 def update_category_in_db(category_id, category):
     try:
         with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            with dict_cursor(conn) as cursor:
                 cursor.execute(
                     """
                     UPDATE categories
@@ -25,6 +25,8 @@ def update_category_in_db(category_id, category):
                     logger.info(f"Category with ID {category_id} not found.")
                     raise ActiveResourceNotFoundError(f"Category with ID {category_id} not found")
 
+                bump_table_version(cursor, 'categories')
+
                 return row
         
     except psycopg2.Error as e:
@@ -44,5 +46,5 @@ def lambda_handler(event, context):
 
     return {
         'statusCode': 200,
-        'body': json.dumps(update_category_response, default=json_default)
+        'body': dumps(update_category_response)
     }
\ No newline at end of file
@@ -1,48 +1,85 @@
-import json
+import os
 import psycopg2
 from utils.logger import logger
-from utils.db_connection import get_db_connection
-from utils.validation import extract_id_path_param, extract_item_id_from_query_param, get_active_row_from_table
-from utils.custom_exceptions import ValidationError
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, database_errors
+from utils.pipeline import execute_pipeline
+from utils.validation import extract_id_path_param, extract_item_id_from_query_param, active_row_query, require_active_row, validate_item_ids_event_body
+from utils.custom_exceptions import ValidationError, ActiveResourceNotFoundError
+from utils.cache import invalidate_table
+from utils.statements import register_statement, execute_statement
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
+MAX_BULK_ITEMS = int(os.environ.get('MAX_BULK_ITEMS', 500))
+
 def extract_and_validate_ids(event):
-    category_id = extract_id_path_param(event, logger)
-    item_id = extract_item_id_from_query_param(event, logger)
+    category_id = extract_id_path_param(event)
+    item_id = extract_item_id_from_query_param(event)
 
     return category_id, item_id
     
-def validate_entities_exist(cursor, category_id, item_id):
-    get_active_row_from_table(cursor, table_name='items', id=item_id)
-    get_active_row_from_table(cursor, table_name='categories', id=category_id)
-
-def create_item_category_association(cursor, category_id, item_id):
-    try:
-        cursor.execute(
-        """
+# Checks both rows, inserts the link and bumps the item_categories version in
+# a single statement. FOR SHARE holds the item and category rows until commit
+# so neither can be soft-deleted between the check and the insert.
+ADD_ITEM_TO_CATEGORY_STATEMENT = register_statement(
+    'add_item_to_category',
+    """
+    WITH active_item AS (
+        SELECT id FROM items WHERE id = %s AND deleted = FALSE FOR SHARE
+    ),
+    active_category AS (
+        SELECT id FROM categories WHERE id = %s AND deleted = FALSE FOR SHARE
+    ),
+    inserted AS (
         INSERT INTO item_categories (item_id, category_id)
-        VALUES (%s, %s)
-        """,
-        (item_id, category_id))
-            
-    except psycopg2.errors.UniqueViolation as e:
+        SELECT active_item.id, active_category.id FROM active_item, active_category
+        ON CONFLICT (item_id, category_id) DO NOTHING
+        RETURNING item_id
+    ),
+    bumped AS (
+        INSERT INTO table_versions (table_name, version)
+        SELECT 'item_categories', 1 FROM inserted
+        ON CONFLICT (table_name) DO UPDATE
+        SET version = table_versions.version + 1
+    )
+    SELECT CASE
+        WHEN NOT EXISTS (SELECT 1 FROM active_item) THEN 'item_missing'
+        WHEN NOT EXISTS (SELECT 1 FROM active_category) THEN 'category_missing'
+        WHEN EXISTS (SELECT 1 FROM inserted) THEN 'created'
+        ELSE 'already_linked'
+    END;
+    """)
+
+def add_item_to_category_in_db(cursor, category_id, item_id):
+    execute_statement(cursor, ADD_ITEM_TO_CATEGORY_STATEMENT, (item_id, category_id))
+    status = cursor.fetchone()[0]
+
+    if status == 'item_missing':
+        logger.error(f'No Active items found at ID: {item_id}')
+        raise ActiveResourceNotFoundError(f'No Active items found at ID: {item_id}')
+
+    if status == 'category_missing':
+        logger.error(f'No Active categories found at ID: {category_id}')
+        raise ActiveResourceNotFoundError(f'No Active categories found at ID: {category_id}')
+
+    if status == 'already_linked':
         message = f"Item at ID {item_id} is already added to Category with ID {category_id}"
         logger.error(message)
         raise ValidationError(message)
 
+    invalidate_table('item_categories')
+
 def post_item_to_category_in_db(category_id, item_id):
     try:        
         with get_db_connection() as conn:
             with conn.cursor() as cursor:
-                validate_entities_exist(cursor, category_id, item_id)
-                
-                create_item_category_association(cursor, category_id, item_id)
+                add_item_to_category_in_db(cursor, category_id, item_id)
                                 
                 message = f'Successfully added Item at ID {item_id} to Category at ID {category_id}'
                 logger.info(message)   
                 return {
                     'statusCode': 201,
-                    'body': json.dumps({
+                    'body': dumps({
                         'message' : message
                     })
                 }
@@ -54,8 +91,83 @@ def post_item_to_category_in_db(category_id, item_id):
         logger.error(f"Unexpected error while adding item to category: {e}")
         raise
 
+ACTIVE_ITEM_IDS_STATEMENT = register_statement(
+    'get_active_item_ids',
+    """
+    SELECT id FROM items
+    WHERE id = ANY(%s::int[]) AND deleted = FALSE;
+    """)
+
+# Inserts whichever requested items are active, provided the category is,
+# and bumps the item_categories version only when something was inserted.
+# Guarding in SQL rather than on the earlier results lets the bulk path send
+# all of its statements at once.
+ADD_ITEMS_TO_CATEGORY_STATEMENT = register_statement(
+    'add_items_to_category',
+    """
+    WITH inserted AS (
+        INSERT INTO item_categories (item_id, category_id)
+        SELECT items.id, categories.id
+        FROM unnest(%s::int[]) AS requested(item_id)
+        INNER JOIN items ON items.id = requested.item_id AND items.deleted = FALSE
+        INNER JOIN categories ON categories.id = %s AND categories.deleted = FALSE
+        FOR SHARE OF items, categories
+        ON CONFLICT (item_id, category_id) DO NOTHING
+        RETURNING item_id
+    ),
+    bumped AS (
+        INSERT INTO table_versions (table_name, version)
+        SELECT 'item_categories', 1 WHERE EXISTS (SELECT 1 FROM inserted)
+        ON CONFLICT (table_name) DO UPDATE
+        SET version = table_versions.version + 1
+    )
+    SELECT item_id FROM inserted;
+    """)
+
+def post_items_to_category_in_db(category_id, item_ids):
+    try:
+        category_rows, active_rows, added_rows = execute_pipeline([
+            active_row_query('categories', category_id),
+            (ACTIVE_ITEM_IDS_STATEMENT, (item_ids,)),
+            (ADD_ITEMS_TO_CATEGORY_STATEMENT, (item_ids, category_id))
+        ])
+
+        require_active_row(category_rows, 'categories', category_id)
+
+        active_ids = {row['id'] for row in active_rows}
+        added_ids = {row['item_id'] for row in added_rows}
+
+        if added_ids:
+            invalidate_table('item_categories')
+
+        result = {
+            'added': [item_id for item_id in item_ids if item_id in added_ids],
+            'already_present': [item_id for item_id in item_ids if item_id in active_ids and item_id not in added_ids],
+            'missing': [item_id for item_id in item_ids if item_id not in active_ids]
+        }
+
+        logger.info(f"Bulk add to Category at ID {category_id}: {len(result['added'])} added, "
+                    f"{len(result['already_present'])} already present, {len(result['missing'])} missing")
+        return {
+            'statusCode': 201 if added_ids else 200,
+            'body': dumps(result)
+        }
+
+    except database_errors() as e:
+        logger.error(f"Database error while adding items to category: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while adding items to category: {e}")
+        raise
+
 @lambda_exception_handler_wrapper
 def lambda_handler(event, context):
+    if event.get('body'):
+        category_id = extract_id_path_param(event)
+        item_ids = validate_item_ids_event_body(event, MAX_BULK_ITEMS)
+
+        return post_items_to_category_in_db(category_id, item_ids)
+
     category_id, item_id = extract_and_validate_ids(event)
 
     return post_item_to_category_in_db(category_id, item_id)
\ No newline at end of file
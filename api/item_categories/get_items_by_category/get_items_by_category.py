@@ -1,33 +1,69 @@
-import json
-import psycopg2.extras
 from utils.logger import logger
-from utils.db_connection import get_db_connection
-from utils.validation import extract_id_path_param, get_active_row_from_table
-from utils.json_default import json_default
+from utils.serializer import dumps
+from utils.db_connection import database_errors
+from utils.pipeline import execute_pipeline
+from utils.statements import register_statement
+from utils.validation import extract_id_path_param, active_row_query, require_active_row
+from utils.cache import read_through_cache
+from utils.conditional_get import conditional_get
+from utils.pg_json import postgres_rendering_enabled, json_price, json_array
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
+ITEMS_BY_CATEGORY_STATEMENT = register_statement(
+    'get_items_by_category',
+    """
+    SELECT items.id, items.name, items.price 
+    FROM item_categories
+    INNER JOIN items ON item_categories.item_id = items.id
+    WHERE item_categories.category_id = %s AND items.deleted = FALSE
+    ORDER BY items.name;
+    """)
+
+ITEMS_BY_CATEGORY_JSON_STATEMENT = register_statement(
+    'get_items_by_category_json',
+    f"""
+    SELECT {json_array('row_to_json(rendered)', 'items.name')} AS body, count(*) AS count
+    FROM item_categories
+    INNER JOIN items ON item_categories.item_id = items.id
+    CROSS JOIN LATERAL (
+        SELECT items.id, items.name, {json_price('items.price')} AS price
+    ) AS rendered
+    WHERE item_categories.category_id = %s AND items.deleted = FALSE;
+    """)
+
+# The category check and the items query do not depend on each other, so
+# both are sent together and the check is applied to the first result.
+def fetch_category_rows(statement, category_id):
+    category_rows, rows = execute_pipeline([
+        active_row_query('categories', category_id),
+        (statement, (category_id,))
+    ], readonly=True)
+
+    require_active_row(category_rows, 'categories', category_id)
+    return rows
+
 def fetch_items_by_category_from_db(category_id):
     try:
-        with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                get_active_row_from_table(cursor, table_name='categories', id=category_id)
-
-                cursor.execute(
-                    """
-                    SELECT items.id, items.name, items.price 
-                    FROM item_categories
-                    INNER JOIN items ON item_categories.item_id = items.id
-                    WHERE item_categories.category_id = %s AND items.deleted = FALSE
-                    ORDER BY items.name;
-                    """,
-                    (category_id,))
-                
-                rows = cursor.fetchall()
-
-                logger.info(f"Successfully fetched {len(rows)} items for category {category_id}")
-                return rows
+        rows = fetch_category_rows(ITEMS_BY_CATEGORY_STATEMENT, category_id)
+
+        logger.info(f"Successfully fetched {len(rows)} items for category {category_id}")
+        return rows
             
-    except psycopg2.Error as e:
+    except database_errors() as e:
+        logger.error(f"Database error while fetching all items in a category: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while fetching all items in a category: {e}")
+        raise
+
+def fetch_items_by_category_json_from_db(category_id):
+    try:
+        row = fetch_category_rows(ITEMS_BY_CATEGORY_JSON_STATEMENT, category_id)[0]
+
+        logger.info(f"Successfully rendered {row['count']} items for category {category_id} in the database")
+        return row['body']
+
+    except database_errors() as e:
         logger.error(f"Database error while fetching all items in a category: {e}")
         raise
     except Exception as e:
@@ -35,12 +71,25 @@ def fetch_items_by_category_from_db(category_id):
         raise
 
 @lambda_exception_handler_wrapper  
+@conditional_get(('categories', 'items', 'item_categories'))
 def lambda_handler(event, context):
     category_id = extract_id_path_param(event)
 
-    items = fetch_items_by_category_from_db(category_id)
+    if postgres_rendering_enabled():
+        return {
+            'statusCode': 200,
+            'body': read_through_cache(
+                ('get_items_by_category_json', category_id),
+                ('categories', 'items', 'item_categories'),
+                lambda: fetch_items_by_category_json_from_db(category_id))
+        }
+
+    items = read_through_cache(
+        ('get_items_by_category', category_id),
+        ('categories', 'items', 'item_categories'),
+        lambda: fetch_items_by_category_from_db(category_id))
 
     return {
         'statusCode': 200,
-        'body': json.dumps(items, default=json_default)
+        'body': dumps(items)
     }
@@ -1,23 +1,26 @@
-import json
-import psycopg2.extras
+import psycopg2
 from utils.logger import logger
-from utils.db_connection import get_db_connection
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
 from utils.validation import validate_item_event_body
-from utils.json_default import json_default
+from utils.statements import register_statement, execute_statement
 from utils.custom_exceptions import DatabaseInsertError
+from utils.table_versions import bump_table_version
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
+CREATE_ITEM_STATEMENT = register_statement(
+    'create_item',
+    """
+    INSERT INTO items (name, price, description)
+    VALUES (%s, %s, %s)
+    RETURNING id, name, price, description, created_at
+    """)
+
 def post_item_to_db(item):
     try:
         with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(
-                    """
-                    INSERT INTO items (name, price, description)
-                    VALUES (%s, %s, %s)
-                    RETURNING id, name, price, description, created_at
-                    """,
-                    (item.name, item.price, item.description))
+            with dict_cursor(conn) as cursor:
+                execute_statement(cursor, CREATE_ITEM_STATEMENT, (item.name, item.price, item.description))
                 
                 response = cursor.fetchone()
 
@@ -25,6 +28,8 @@ def post_item_to_db(item):
                     logger.error("Failed to insert item - no result returned")
                     raise DatabaseInsertError("Failed to insert item - no result returned")
 
+                bump_table_version(cursor, 'items')
+
                 logger.info(f"Successfully created item: {item.name}")
                 return response
                 
@@ -43,5 +48,5 @@ def lambda_handler(event, context):
     logger.info(f"Successfully created item: {item.name}")
     return {
         'statusCode': 201,
-        'body': json.dumps(created_item, default=json_default)
+        'body': dumps(created_item)
     } 
\ No newline at end of file
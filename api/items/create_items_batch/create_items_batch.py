@@ -0,0 +1,69 @@
+import os
+import psycopg2.extras
+from utils.logger import logger
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
+from utils.validation import validate_item_batch_event_body
+from utils.custom_exceptions import ValidationError, BatchValidationError, DatabaseInsertError
+from utils.table_versions import bump_table_version
+from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
+
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 500))
+BATCH_MODES = ('atomic', 'partial')
+
+def extract_batch_mode(event):
+    query_params = event.get('queryStringParameters') or {}
+    mode = (query_params.get('mode') or 'atomic').lower()
+
+    if mode not in BATCH_MODES:
+        raise ValidationError(f"Invalid mode: {mode}. Must be one of {', '.join(BATCH_MODES)}")
+
+    return mode
+
+def post_items_to_db(items):
+    try:
+        with get_db_connection() as conn:
+            with dict_cursor(conn) as cursor:
+                rows = psycopg2.extras.execute_values(
+                    cursor,
+                    """
+                    INSERT INTO items (name, price, description)
+                    VALUES %s
+                    RETURNING id, name, price, description, created_at
+                    """,
+                    [(item.name, item.price, item.description) for item in items],
+                    page_size=len(items),
+                    fetch=True)
+
+                if len(rows) != len(items):
+                    logger.error(f"Batch insert returned {len(rows)} rows for {len(items)} items")
+                    raise DatabaseInsertError("Failed to insert items - unexpected result returned")
+
+                bump_table_version(cursor, 'items')
+
+                logger.info(f"Successfully created {len(rows)} items")
+                return rows
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error while creating items: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while creating items: {e}")
+        raise
+
+@lambda_exception_handler_wrapper
+def lambda_handler(event, context):
+    mode = extract_batch_mode(event)
+    valid_items, errors = validate_item_batch_event_body(event, MAX_BATCH_SIZE)
+
+    if errors and (mode == 'atomic' or not valid_items):
+        raise BatchValidationError(f'{len(errors)} of {len(errors) + len(valid_items)} items failed validation', errors)
+
+    created_items = post_items_to_db([item for _, item in valid_items])
+    created = [{'index': index, **row} for (index, _), row in zip(valid_items, created_items)]
+
+    logger.info(f"Batch create ({mode}) created {len(created)} items, rejected {len(errors)}")
+    return {
+        'statusCode': 207 if errors else 201,
+        'body': dumps({'created': created, 'errors': errors})
+    }
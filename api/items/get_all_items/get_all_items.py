@@ -1,30 +1,152 @@
-import json
-import psycopg2.extras
+import psycopg2
 from utils.logger import logger
-from utils.db_connection import get_db_connection
-from utils.json_default import json_default
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
+from utils.cache import read_through_cache
+from utils.statements import register_statement, execute_statement
+from utils.pagination import extract_pagination_params, encode_cursor, pagination_headers
+from utils.custom_exceptions import ValidationError
+from utils.validation import extract_ids_query_param
+from utils.item_lookup import MAX_LOOKUP_QUERY_IDS, get_items_by_ids_from_db
+from utils.query_builder import (
+    Filter, Sort, parse_price, parse_timestamp, parse_positive_int, parse_filters, parse_sort, build_listing_query
+)
+from utils.pg_json import postgres_rendering_enabled, json_price, json_timestamp, json_array
+from utils.conditional_get import conditional_get
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
-def get_all_items_from_db():
+GET_ITEMS_PAGE_STATEMENT = register_statement(
+    'get_items_page',
+    """
+    SELECT id, name, price, description, created_at
+    FROM items
+    WHERE deleted = FALSE
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s;
+    """)
+
+GET_ITEMS_PAGE_AFTER_STATEMENT = register_statement(
+    'get_items_page_after',
+    """
+    SELECT id, name, price, description, created_at
+    FROM items
+    WHERE deleted = FALSE
+    AND (created_at, id) < (%s, %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s;
+    """)
+
+# Renders the page as a JSON array in Postgres. The page is fetched one row
+# past the limit as above; only the first `limit` rows go into the body and
+# the last of them supplies the next cursor.
+ITEMS_PAGE_JSON_SQL = """
+    WITH page AS (
+        SELECT id, name, price, description, created_at
+        FROM items
+        WHERE deleted = FALSE
+        {after_clause}
+        ORDER BY created_at DESC, id DESC
+        LIMIT %s
+    ),
+    numbered AS (
+        SELECT page.*, row_number() OVER (ORDER BY created_at DESC, id DESC) AS position
+        FROM page
+    )
+    SELECT
+        {body} AS body,
+        count(*) AS fetched,
+        max(numbered.created_at) FILTER (WHERE numbered.position = %s) AS last_created_at,
+        max(numbered.id) FILTER (WHERE numbered.position = %s) AS last_id
+    FROM numbered
+    CROSS JOIN LATERAL (
+        SELECT numbered.id, numbered.name, {price} AS price, numbered.description, {created_at} AS created_at
+    ) AS rendered;
+    """
+
+GET_ITEMS_PAGE_JSON_STATEMENT = register_statement(
+    'get_items_page_json',
+    ITEMS_PAGE_JSON_SQL.format(
+        after_clause='',
+        body=json_array('row_to_json(rendered)', 'numbered.position', 'numbered.position <= %s'),
+        price=json_price('numbered.price'),
+        created_at=json_timestamp('numbered.created_at')))
+
+GET_ITEMS_PAGE_AFTER_JSON_STATEMENT = register_statement(
+    'get_items_page_after_json',
+    ITEMS_PAGE_JSON_SQL.format(
+        after_clause='AND (created_at, id) < (%s, %s)',
+        body=json_array('row_to_json(rendered)', 'numbered.position', 'numbered.position <= %s'),
+        price=json_price('numbered.price'),
+        created_at=json_timestamp('numbered.created_at')))
+
+ITEM_FILTERS = {
+    'min_price': Filter(parse_price, 'price >= %s::numeric'),
+    'max_price': Filter(parse_price, 'price <= %s::numeric'),
+    'created_after': Filter(parse_timestamp, 'created_at > %s::timestamp'),
+    'category_id': Filter(
+        parse_positive_int,
+        'id IN (SELECT item_id FROM item_categories WHERE category_id = %s AND deleted = FALSE)')
+}
+
+ITEM_SORTS = {
+    'created_at': Sort('created_at', 'timestamp'),
+    'name': Sort('name', 'text'),
+    'price': Sort('price', 'numeric')
+}
+
+DEFAULT_ITEM_SORT = '-created_at'
+
+FILTERED_ITEMS_SQL = """
+    SELECT id, name, price, description, created_at
+    FROM items
+    WHERE deleted = FALSE"""
+
+def get_all_items_from_db(limit, after=None):
     try:
-        with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute("""
-                               SELECT id, name, price, description, created_at 
-                               FROM items 
-                               WHERE deleted = FALSE 
-                               ORDER BY created_at DESC;
-
-                               """)
+        with get_db_connection(readonly=True) as conn:
+            with dict_cursor(conn) as cursor:
+                if after:
+                    execute_statement(cursor, GET_ITEMS_PAGE_AFTER_STATEMENT, (after[0], after[1], limit + 1))
+                else:
+                    execute_statement(cursor, GET_ITEMS_PAGE_STATEMENT, (limit + 1,))
                 rows = cursor.fetchall()
 
                 if not rows:
                     logger.info('No items found in databse')
-                    return []
+                    return [], None
+
+                next_cursor = None
+                if len(rows) > limit:
+                    rows = rows[:limit]
+                    next_cursor = encode_cursor([rows[-1]['created_at'], rows[-1]['id']])
 
                 logger.info(f"Successfully retrieved {len(rows)} items")
-                return rows
-                
+                return rows, next_cursor
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error while fetching all items: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while fetching all: {e}")
+        raise
+
+def get_all_items_json_from_db(limit, after=None):
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with conn.cursor() as cursor:
+                if after:
+                    execute_statement(cursor, GET_ITEMS_PAGE_AFTER_JSON_STATEMENT, (after[0], after[1], limit + 1, limit, limit, limit))
+                else:
+                    execute_statement(cursor, GET_ITEMS_PAGE_JSON_STATEMENT, (limit + 1, limit, limit, limit))
+                body, fetched, last_created_at, last_id = cursor.fetchone()
+
+                next_cursor = None
+                if fetched > limit:
+                    next_cursor = encode_cursor([last_created_at, last_id])
+
+                logger.info(f"Successfully rendered {min(fetched, limit)} items in the database")
+                return body, next_cursor
+
     except psycopg2.Error as e:
         logger.error(f"Database error while fetching all items: {e}")
         raise
@@ -32,12 +154,98 @@ def get_all_items_from_db():
         logger.error(f"Unexpected error while fetching all: {e}")
         raise
 
+def get_filtered_items_from_db(filters, sort, limit, after=None):
+    name, sql, params = build_listing_query(
+        'get_items_filtered', FILTERED_ITEMS_SQL, ITEM_FILTERS, filters, ITEM_SORTS, sort, after, limit + 1)
+    register_statement(name, sql)
+
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with dict_cursor(conn) as cursor:
+                execute_statement(cursor, name, params)
+                rows = cursor.fetchall()
+
+                if not rows:
+                    logger.info('No items found matching filters')
+                    return [], None
+
+                next_cursor = None
+                if len(rows) > limit:
+                    rows = rows[:limit]
+                    column = ITEM_SORTS[sort[0]].column
+                    next_cursor = encode_cursor([sort[0], rows[-1][column], rows[-1]['id']])
+
+                logger.info(f"Successfully retrieved {len(rows)} filtered items")
+                return rows, next_cursor
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error while fetching filtered items: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while fetching filtered items: {e}")
+        raise
+
+def filtered_listing(event, filters, sort):
+    # The cursor carries its sort key so a page from one ordering is never
+    # used to continue another.
+    limit, after = extract_pagination_params(event, key_length=3)
+    if after:
+        if after[0] != sort[0]:
+            raise ValidationError('Invalid pagination cursor')
+        after = after[1:]
+
+    items, next_cursor = read_through_cache(
+        ('get_filtered_items', filters, sort, limit, tuple(after or ())),
+        ('items', 'item_categories'),
+        lambda: get_filtered_items_from_db(filters, sort, limit, after))
+
+    logger.info(f"Successfully processed request, returning {len(items)} items")
+    return {
+        'statusCode': 200,
+        'headers': pagination_headers(event, limit, next_cursor),
+        'body': dumps(items)
+    }
+
 @lambda_exception_handler_wrapper
+@conditional_get(('items', 'item_categories'))
 def lambda_handler(event, context):
-    items = get_all_items_from_db()
+    query_params = event.get('queryStringParameters') or {}
+    if 'ids' in query_params:
+        item_ids = extract_ids_query_param(event, MAX_LOOKUP_QUERY_IDS)
+        result = read_through_cache(('get_items_by_ids', tuple(item_ids)), ('items',), lambda: get_items_by_ids_from_db(item_ids))
+        return {
+            'statusCode': 200,
+            'body': dumps(result)
+        }
+
+    filters = parse_filters(query_params, ITEM_FILTERS)
+    sort = parse_sort(query_params, ITEM_SORTS, DEFAULT_ITEM_SORT)
+
+    if filters or sort != parse_sort({}, ITEM_SORTS, DEFAULT_ITEM_SORT):
+        return filtered_listing(event, filters, sort)
+
+    limit, after = extract_pagination_params(event)
+
+    if postgres_rendering_enabled():
+        body, next_cursor = read_through_cache(
+            ('get_all_items_json', limit, tuple(after or ())),
+            ('items',),
+            lambda: get_all_items_json_from_db(limit, after))
+
+        return {
+            'statusCode': 200,
+            'headers': pagination_headers(event, limit, next_cursor),
+            'body': body
+        }
+
+    items, next_cursor = read_through_cache(
+        ('get_all_items', limit, tuple(after or ())),
+        ('items',),
+        lambda: get_all_items_from_db(limit, after))
 
     logger.info(f"Successfully processed request, returning {len(items)} items")
     return {
         'statusCode': 200,
-        'body': json.dumps(items, default=json_default)
+        'headers': pagination_headers(event, limit, next_cursor),
+        'body': dumps(items)
     }
\ No newline at end of file
@@ -1,24 +1,27 @@
-import json
-import psycopg2.extras
+import psycopg2
 from utils.logger import logger
-from utils.db_connection import get_db_connection
-from utils.json_default import json_default
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
+from utils.cache import read_through_cache
+from utils.statements import register_statement, execute_statement
 from utils.validation import extract_id_path_param
 from utils.custom_exceptions import ActiveResourceNotFoundError
+from utils.conditional_get import conditional_get
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
+GET_ITEM_STATEMENT = register_statement(
+    'get_item_by_id',
+    """
+    SELECT id, name, price, description, created_at
+    FROM items
+    WHERE id = %s AND deleted = FALSE;
+    """)
+
 def get_item_from_db(item_id):
     try:
-        with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(
-                    """
-                    SELECT id, name, price, description, created_at 
-                    FROM items
-                    WHERE id = %s AND deleted = FALSE;
-                    """,
-                    (item_id,)
-                )
+        with get_db_connection(readonly=True) as conn:
+            with dict_cursor(conn) as cursor:
+                execute_statement(cursor, GET_ITEM_STATEMENT, (item_id,))
                 row = cursor.fetchone()
                 
                 if not row:
@@ -36,10 +39,13 @@ def get_item_from_db(item_id):
         raise
 
 @lambda_exception_handler_wrapper  
+@conditional_get(('items',))
 def lambda_handler(event, context):
     item_id = extract_id_path_param(event)
 
+    item = read_through_cache(('get_item_by_id', item_id), ('items',), lambda: get_item_from_db(item_id))
+
     return {
         'statusCode': 200,
-        'body': json.dumps(get_item_from_db(item_id), default=json_default)
+        'body': dumps(item)
     }
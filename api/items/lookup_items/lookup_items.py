@@ -0,0 +1,19 @@
+from utils.logger import logger
+from utils.serializer import dumps
+from utils.cache import read_through_cache
+from utils.validation import validate_lookup_event_body
+from utils.item_lookup import MAX_LOOKUP_BODY_IDS, get_items_by_ids_from_db
+from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
+
+# POST form of GET /item?ids= for lists too long for a query string.
+@lambda_exception_handler_wrapper
+def lambda_handler(event, context):
+    item_ids = validate_lookup_event_body(event, MAX_LOOKUP_BODY_IDS)
+
+    result = read_through_cache(('get_items_by_ids', tuple(item_ids)), ('items',), lambda: get_items_by_ids_from_db(item_ids))
+
+    logger.info(f"Successfully processed lookup, returning {len(result['items'])} items and {len(result['missing'])} missing IDs")
+    return {
+        'statusCode': 200,
+        'body': dumps(result)
+    }
@@ -4,6 +4,7 @@ from utils.logger import logger
 from utils.db_connection import get_db_connection
 from utils.validation import extract_id_path_param
 from utils.custom_exceptions import ValidationError, ResourceNotFoundError
+from utils.table_versions import bump_table_version
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
 def remove_item_from_db(item_id):
@@ -24,7 +25,8 @@ def remove_item_from_db(item_id):
                 if not deleted:
                     logger.info(f"Item with ID {item_id} not found.")
                     raise ResourceNotFoundError(f"Item with ID {item_id} not found")
-                                
+
+                bump_table_version(cursor, 'items')
                 logger.info(f'Successfully processed DELETE request for item ID: {item_id}')
 
     except psycopg2.Error as e:
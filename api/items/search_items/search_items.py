@@ -0,0 +1,139 @@
+import os
+import math
+import psycopg2
+from utils.logger import logger
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
+from utils.cache import read_through_cache
+from utils.statements import register_statement, execute_statement
+from utils.pagination import extract_pagination_params, encode_cursor, pagination_headers
+from utils.validation import extract_search_query_param, id_in_range
+from utils.custom_exceptions import ValidationError
+from utils.conditional_get import conditional_get
+from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
+
+MAX_SEARCH_LENGTH = int(os.environ.get('MAX_SEARCH_LENGTH', 100))
+
+# Full-text matches on name (weight A) and description (weight B), ranked by
+# ts_rank_cd. Both queries page on (score, id) so the cursor stays stable
+# while rows are added. The score is a real and the cursor value is cast back
+# to real: with PREPARED_STATEMENTS=off it arrives as a numeric literal, and
+# real < numeric compares in float8, which skips or repeats tied rows.
+TEXT_SEARCH_SQL = """
+    SELECT id, name, price, description, created_at, score
+    FROM (
+        SELECT id, name, price, description, created_at, ts_rank_cd(search_vector, query) AS score
+        FROM items, websearch_to_tsquery('english', %s) AS query
+        WHERE deleted = FALSE
+        AND search_vector @@ query
+    ) AS matches
+    {after_clause}
+    ORDER BY score DESC, id DESC
+    LIMIT %s;
+    """
+
+# Typos and partial words ("chese", "burg") find nothing in the text search,
+# so the name is matched by trigram word similarity instead.
+SIMILAR_SEARCH_SQL = """
+    SELECT id, name, price, description, created_at, score
+    FROM (
+        SELECT id, name, price, description, created_at, word_similarity(%s, name) AS score
+        FROM items
+        WHERE deleted = FALSE
+        AND %s <%% name
+    ) AS matches
+    {after_clause}
+    ORDER BY score DESC, id DESC
+    LIMIT %s;
+    """
+
+AFTER_CLAUSE = 'WHERE (score, id) < (%s::real, %s)'
+
+SEARCH_STATEMENTS = {
+    'text': (
+        register_statement('search_items_text', TEXT_SEARCH_SQL.format(after_clause='')),
+        register_statement('search_items_text_after', TEXT_SEARCH_SQL.format(after_clause=AFTER_CLAUSE))
+    ),
+    'similar': (
+        register_statement('search_items_similar', SIMILAR_SEARCH_SQL.format(after_clause='')),
+        register_statement('search_items_similar_after', SIMILAR_SEARCH_SQL.format(after_clause=AFTER_CLAUSE))
+    )
+}
+
+def search_params(mode, query):
+    return (query,) if mode == 'text' else (query, query)
+
+def fetch_search_page(cursor, mode, query, limit, after):
+    first_statement, after_statement = SEARCH_STATEMENTS[mode]
+    if after:
+        execute_statement(cursor, after_statement, search_params(mode, query) + (after[0], after[1], limit + 1))
+    else:
+        execute_statement(cursor, first_statement, search_params(mode, query) + (limit + 1,))
+    return cursor.fetchall()
+
+def search_items_in_db(query, limit, after=None):
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with dict_cursor(conn) as cursor:
+                if after:
+                    mode = after[0]
+                    rows = fetch_search_page(cursor, mode, query, limit, after[1:])
+                else:
+                    mode = 'text'
+                    rows = fetch_search_page(cursor, mode, query, limit, None)
+                    if not rows:
+                        logger.info(f"No text matches for '{query}', falling back to similar names")
+                        mode = 'similar'
+                        rows = fetch_search_page(cursor, mode, query, limit, None)
+
+                if not rows:
+                    logger.info(f"No items found matching '{query}'")
+                    return [], None
+
+                next_cursor = None
+                if len(rows) > limit:
+                    rows = rows[:limit]
+                    next_cursor = encode_cursor([mode, rows[-1]['score'], rows[-1]['id']])
+
+                items = [{key: value for key, value in row.items() if key != 'score'} for row in rows]
+
+                logger.info(f"Successfully found {len(items)} items matching '{query}' by {mode} search")
+                return items, next_cursor
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error while searching items: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while searching items: {e}")
+        raise
+
+# The cursor is signed, but its values still go straight into the keyset
+# comparison, so check their types before they reach the query.
+def valid_search_cursor(after):
+    mode, score, item_id = after
+    return (
+        mode in SEARCH_STATEMENTS
+        and isinstance(score, (int, float)) and not isinstance(score, bool) and math.isfinite(score)
+        and isinstance(item_id, int) and not isinstance(item_id, bool) and id_in_range(item_id)
+    )
+
+@lambda_exception_handler_wrapper
+@conditional_get(('items',))
+def lambda_handler(event, context):
+    query = extract_search_query_param(event, MAX_SEARCH_LENGTH)
+    limit, after = extract_pagination_params(event, key_length=3)
+
+    if after and not valid_search_cursor(after):
+        raise ValidationError('Invalid pagination cursor')
+
+    items, next_cursor = read_through_cache(
+        ('search_items', query, limit, tuple(after or ())),
+        ('items',),
+        lambda: search_items_in_db(query, limit, after))
+
+    logger.info(f"Successfully processed request, returning {len(items)} items")
+    return {
+        'statusCode': 200,
+        'headers': pagination_headers(event, limit, next_cursor),
+        'body': dumps(items)
+    }
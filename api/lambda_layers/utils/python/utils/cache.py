@@ -0,0 +1,147 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from .logger import logger
+from .table_versions import get_table_versions, known_table_versions
+
+DEFAULT_TTL_SECONDS = float(os.environ.get('CACHE_TTL_SECONDS', 5))
+MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 256))
+
+class CacheEntry:
+    __slots__ = ('value', 'tables', 'versions', 'ttl', 'expires_at')
+
+    def __init__(self, value, tables, versions, ttl):
+        self.value = value
+        self.tables = tables
+        self.versions = versions
+        self.ttl = ttl
+        self.expires_at = time.monotonic() + ttl
+
+class ReadCache:
+    # Lives at module level so it survives across warm invocations of the
+    # same Lambda container. Entries are served without touching the DB
+    # until their TTL runs out, after which they are revalidated against
+    # the table_versions counters rather than reloaded.
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        # table_name -> (version, expires_at) for the last versions read from
+        # the DB, so conditional GETs inside the TTL skip that round trip too.
+        self.table_versions = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        # Only contended when a threaded host (local_server) shares the
+        # module; a Lambda container handles one request at a time.
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, value, tables, versions, ttl):
+        with self.lock:
+            self.entries[key] = CacheEntry(value, tables, versions, ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def remember_versions(self, tables, versions, ttl):
+        expires_at = time.monotonic() + ttl
+        with self.lock:
+            for table_name, version in zip(tables, versions):
+                self.table_versions[table_name] = (version, expires_at)
+
+    def held_versions(self, tables):
+        now = time.monotonic()
+        with self.lock:
+            held = [self.table_versions.get(table_name) for table_name in tables]
+        if any(entry is None or entry[1] <= now for entry in held):
+            return None
+        return tuple(version for version, _ in held)
+
+    def invalidate_table(self, table_name):
+        with self.lock:
+            self.table_versions.pop(table_name, None)
+            for key in [key for key, entry in self.entries.items() if table_name in entry.tables]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.table_versions.clear()
+            self.hits = self.misses = self.stale = 0
+
+    def log_stats(self, outcome, key):
+        logger.info(
+            f'Read cache {outcome} for {key[0]}: hits={self.hits} misses={self.misses} '
+            f'stale={self.stale} entries={len(self.entries)}'
+        )
+
+_read_cache = ReadCache()
+
+def invalidate_table(table_name):
+    _read_cache.invalidate_table(table_name)
+
+def clear_cache():
+    _read_cache.clear()
+
+def held_table_versions(tables, ttl=None):
+    ttl = DEFAULT_TTL_SECONDS if ttl is None else ttl
+    if ttl <= 0:
+        return None
+    return _read_cache.held_versions(tables)
+
+def remember_versions(tables, versions, ttl=None):
+    ttl = DEFAULT_TTL_SECONDS if ttl is None else ttl
+    if ttl > 0 and versions is not None:
+        _read_cache.remember_versions(tables, versions, ttl)
+
+def read_through_cache(key, tables, loader, ttl=None):
+    ttl = DEFAULT_TTL_SECONDS if ttl is None else ttl
+    if ttl <= 0:
+        return loader()
+
+    entry = _read_cache.get(key)
+    known_versions = known_table_versions(tables)
+
+    # When this request has already read the versions (e.g. for an ETag) the
+    # entry must match them exactly, otherwise the ETag could be paired with
+    # an older body.
+    if entry is not None and known_versions is None and time.monotonic() < entry.expires_at:
+        _read_cache.hits += 1
+        _read_cache.log_stats('hit', key)
+        return entry.value
+
+    # Versions are read before the loader runs so a write landing in between
+    # can only make the cached copy look older than it is, never newer.
+    if known_versions is not None:
+        versions = known_versions
+    else:
+        versions = get_table_versions(tables)
+        remember_versions(tables, versions, ttl)
+
+    if entry is not None and versions is not None and entry.versions == versions:
+        entry.expires_at = time.monotonic() + entry.ttl
+        _read_cache.hits += 1
+        _read_cache.log_stats('revalidated', key)
+        return entry.value
+
+    if entry is not None:
+        _read_cache.stale += 1
+        outcome = 'stale'
+    else:
+        _read_cache.misses += 1
+        outcome = 'miss'
+
+    value = loader()
+    if versions is not None:
+        _read_cache.put(key, value, tuple(tables), versions, ttl)
+
+    _read_cache.log_stats(outcome, key)
+    return value
@@ -0,0 +1,107 @@
+import os
+import time
+import base64
+import importlib.util
+from .logger import logger
+from .metrics import record_metric
+from .conditional_get import get_header
+
+# The codecs are imported on first use: most responses are below the
+# threshold and zlib alone is several milliseconds of cold start.
+BROTLI_AVAILABLE = importlib.util.find_spec('brotli') is not None
+
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', 1024))
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', 6))
+# Brotli's default quality (11) is meant for static assets; 4-5 compresses
+# better than gzip at a similar CPU cost for per-request bodies.
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', 4))
+
+def _compress_gzip(data):
+    import gzip
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+def _compress_brotli(data):
+    import brotli
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+ENCODERS = {'gzip': _compress_gzip}
+if BROTLI_AVAILABLE:
+    ENCODERS['br'] = _compress_brotli
+
+# Preferred first when the client weights them equally.
+PREFERENCE = ('br', 'gzip')
+
+def parse_accept_encoding(header):
+    weights = {}
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        weight = 1.0
+        params = params.strip()
+        if params.lower().startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    return weights
+
+def choose_encoding(header):
+    weights = parse_accept_encoding(header)
+    wildcard = weights.get('*', 0.0)
+
+    best = None
+    best_weight = 0.0
+    for coding in PREFERENCE:
+        if coding not in ENCODERS:
+            continue
+        weight = weights.get(coding, wildcard)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+
+    return best
+
+def compress_response(event, response):
+    body = response.get('body')
+    if not isinstance(body, str) or response.get('isBase64Encoded'):
+        return response
+
+    headers = response.get('headers') or {}
+    if any(key.lower() == 'content-encoding' for key in headers):
+        return response
+
+    data = body.encode('utf-8')
+    if len(data) < COMPRESSION_MIN_BYTES:
+        return response
+
+    encoding = choose_encoding(get_header(event, 'Accept-Encoding'))
+    if encoding is None:
+        return {**response, 'headers': {**headers, 'Vary': 'Accept-Encoding'}}
+
+    start = time.perf_counter()
+    compressed = ENCODERS[encoding](data)
+    record_metric('CompressionTime', (time.perf_counter() - start) * 1000)
+
+    if len(compressed) >= len(data):
+        return {**response, 'headers': {**headers, 'Vary': 'Accept-Encoding'}}
+
+    record_metric('BytesCompressed', len(compressed))
+    logger.info(f'Compressed response with {encoding}: {len(data)} -> {len(compressed)} bytes')
+
+    headers = {**headers, 'Content-Encoding': encoding, 'Vary': 'Accept-Encoding'}
+    # A strong ETag promises byte-identical bodies, which no longer holds
+    # across encodings; the weak form still works for If-None-Match.
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        headers['ETag'] = f'W/{etag}'
+
+    return {
+        **response,
+        'headers': headers,
+        'body': base64.b64encode(compressed).decode('ascii'),
+        'isBase64Encoded': True
+    }
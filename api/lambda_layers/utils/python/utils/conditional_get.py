@@ -0,0 +1,85 @@
+import json
+import hashlib
+from .logger import logger
+from .cache import held_table_versions, remember_versions
+from .table_versions import get_table_versions, remember_table_versions
+
+def get_header(event, name):
+    headers = event.get('headers') or {}
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+def compute_etag(event, tables, versions):
+    fingerprint = json.dumps([
+        event.get('resource') or event.get('path'),
+        sorted((event.get('pathParameters') or {}).items()),
+        sorted((event.get('queryStringParameters') or {}).items()),
+        list(tables),
+        list(versions)
+    ], separators=(',', ':'))
+
+    return '"' + hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:32] + '"'
+
+# '*' is left to the caller: it only matches once the handler has shown the
+# resource exists, otherwise a missing item would get 304 instead of 404.
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
+
+def matches_any(if_none_match):
+    return bool(if_none_match) and any(candidate.strip() == '*' for candidate in if_none_match.split(','))
+
+def not_modified(etag):
+    logger.info(f'ETag {etag} matched, returning 304')
+    return {
+        'statusCode': 304,
+        'headers': {'ETag': etag},
+        'body': ''
+    }
+
+def conditional_get(tables):
+    tables = tuple(tables)
+
+    def decorator(handler_func):
+
+        def wrapped_handler(event, context):
+            # Inside the cache TTL the versions read by an earlier request are
+            # reused, so a warm repeat GET does not touch the DB at all.
+            versions = held_table_versions(tables)
+            if versions is None:
+                versions = get_table_versions(tables)
+                remember_versions(tables, versions)
+            if versions is None:
+                return handler_func(event, context)
+
+            etag = compute_etag(event, tables, versions)
+            if_none_match = get_header(event, 'If-None-Match')
+
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+            with remember_table_versions(tables, versions):
+                response = handler_func(event, context)
+
+            if response.get('statusCode') == 200:
+                if matches_any(if_none_match):
+                    return not_modified(etag)
+                response['headers'] = {**(response.get('headers') or {}), 'ETag': etag}
+
+            return response
+
+        return wrapped_handler
+
+    return decorator
@@ -4,6 +4,11 @@ class ValidationError(Exception):
         self.status_code = status_code
         super().__init__(message)
 
+class BatchValidationError(ValidationError):
+    def __init__(self, message, errors, status_code=400):
+        self.errors = errors
+        super().__init__(message, status_code)
+
 class DatabaseInsertError(ValidationError):
     def __init__(self, message, status_code=500):
         self.message = message
@@ -1,36 +1,336 @@
 import os
+import sys
+import time
+import threading
+import weakref
 import psycopg2
-from contextlib import contextmanager
+import psycopg2.extensions
 import psycopg2.pool
+from contextlib import contextmanager
 from .logger import logger
+from .metrics import record_metric, instrument_connection
+
+IDLE_CHECK_SECONDS = float(os.environ.get('DB_IDLE_CHECK_SECONDS', 30))
+MAX_LIFETIME_SECONDS = float(os.environ.get('DB_MAX_LIFETIME_SECONDS', 1800))
+CHECKOUT_TIMEOUT_SECONDS = float(os.environ.get('DB_CHECKOUT_TIMEOUT_SECONDS', 5))
+CONNECT_RETRIES = int(os.environ.get('DB_CONNECT_RETRIES', 3))
+CONNECT_RETRY_BACKOFF_SECONDS = 0.1
+
+# 'psycopg' sends multi-statement handlers through psycopg 3 pipelines (see
+# utils.pipeline); everything else stays on psycopg2.
+DB_DRIVER = os.environ.get('DB_DRIVER', 'psycopg2').lower()
+
+# Milliseconds; 0 leaves the limit disabled, matching the Postgres default.
+DEFAULT_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+DEFAULT_LOCK_TIMEOUT_MS = int(os.environ.get('DB_LOCK_TIMEOUT_MS', 0))
+
+# Keepalives let the kernel notice a dead RDS socket instead of a query
+# hanging on it, which matters after the container has been frozen.
+KEEPALIVE_SETTINGS = {
+    'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 5)),
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 3
+}
+
+# NUMERIC columns (prices, totals) are decoded straight to float in C so the
+# serializer can emit them as JSON numbers without a Decimal conversion per
+# value. NUMERIC(10, 2) fits a double exactly enough for display.
+DEC2FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values, 'DEC2FLOAT', psycopg2.extensions.FLOAT)
+psycopg2.extensions.register_type(DEC2FLOAT)
 
 _connection_pool = None
+# Threaded hosts (local_server) can send their first requests at once; without
+# this each would build, and leak, a pool of DB_POOL_MAX connections.
+_pool_lock = threading.Lock()
+_session_settings = weakref.WeakKeyDictionary()
+
+class PoolTimeoutError(psycopg2.pool.PoolError):
+    pass
+
+def database_errors():
+    # psycopg is only imported when the pipeline driver is in use, so its
+    # errors are only worth catching once it has been loaded.
+    psycopg = sys.modules.get('psycopg')
+    if psycopg is None:
+        return (psycopg2.Error,)
+    return (psycopg2.Error, psycopg.Error)
+
+class PooledConnection:
+    __slots__ = ('conn', 'created_at', 'last_used_at')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+class ResilientConnectionPool:
+    # Drop-in replacement for psycopg2's SimpleConnectionPool that survives
+    # Lambda freeze/thaw: idle connections are pinged before reuse, old ones
+    # are recycled, connects are retried and checkout waits for a free slot.
+    # driver is the DB-API module to connect with: psycopg2 or psycopg.
+
+    def __init__(
+        self,
+        minconn,
+        maxconn,
+        idle_check_seconds=IDLE_CHECK_SECONDS,
+        max_lifetime_seconds=MAX_LIFETIME_SECONDS,
+        checkout_timeout=CHECKOUT_TIMEOUT_SECONDS,
+        connect_retries=CONNECT_RETRIES,
+        driver=psycopg2,
+        **connect_kwargs
+    ):
+        self.driver = driver
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.idle_check_seconds = idle_check_seconds
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.checkout_timeout = checkout_timeout
+        self.connect_retries = connect_retries
+        self.connect_kwargs = {**KEEPALIVE_SETTINGS, **connect_kwargs}
+
+        self._idle = []
+        self._in_use = {}
+        self._total = 0
+        self._condition = threading.Condition()
+
+        for _ in range(minconn):
+            self._idle.append(PooledConnection(self._connect()))
+            self._total += 1
+
+    def _connect(self):
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                conn = self.driver.connect(**self.connect_kwargs)
+                record_metric('ConnectTime', (time.perf_counter() - start) * 1000)
+                return conn
+            except self.driver.OperationalError as e:
+                attempt += 1
+                if attempt > self.connect_retries:
+                    logger.error(f'Giving up connecting to DB after {attempt} attempts: {e}')
+                    raise
+                delay = CONNECT_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+                logger.warning(f'DB connect attempt {attempt} failed, retrying in {delay}s: {e}')
+                time.sleep(delay)
+
+    def _is_expired(self, pooled, now):
+        return now - pooled.created_at > self.max_lifetime_seconds
+
+    def _is_alive(self, pooled):
+        if pooled.conn.closed:
+            return False
+        # Ping in autocommit so the check is a single round trip rather than
+        # BEGIN / SELECT / ROLLBACK.
+        autocommit = pooled.conn.autocommit
+        try:
+            pooled.conn.autocommit = True
+            with pooled.conn.cursor() as cursor:
+                cursor.execute('SELECT 1;')
+            pooled.conn.autocommit = autocommit
+            return True
+        except self.driver.Error as e:
+            logger.warning(f'Discarding dead pooled connection: {e}')
+            return False
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except self.driver.Error:
+            pass
+
+    def _checkout_slot(self):
+        deadline = time.monotonic() + self.checkout_timeout
+
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._total < self.maxconn:
+                    self._total += 1
+                    return None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f'No DB connection available after {self.checkout_timeout}s ({self.maxconn} in use)')
+                self._condition.wait(remaining)
+
+    def _release_slot(self):
+        with self._condition:
+            self._total -= 1
+            self._condition.notify()
+
+    def getconn(self):
+        start = time.perf_counter()
+        pooled = self._checkout_slot()
+        record_metric('PoolWaitTime', (time.perf_counter() - start) * 1000)
+
+        try:
+            if pooled is not None:
+                now = time.monotonic()
+                if self._is_expired(pooled, now):
+                    logger.info('Recycling DB connection that reached its max lifetime')
+                    self._close_quietly(pooled.conn)
+                    pooled = None
+                elif now - pooled.last_used_at > self.idle_check_seconds and not self._is_alive(pooled):
+                    self._close_quietly(pooled.conn)
+                    pooled = None
+
+            if pooled is None:
+                pooled = PooledConnection(self._connect())
+        except BaseException:
+            self._release_slot()
+            raise
+
+        with self._condition:
+            self._in_use[id(pooled.conn)] = pooled
+
+        return pooled.conn
+
+    def putconn(self, conn, close=False):
+        with self._condition:
+            pooled = self._in_use.pop(id(conn), None)
+
+        if pooled is None:
+            raise psycopg2.pool.PoolError('Trying to put unkeyed connection')
+
+        if not close and not conn.closed:
+            # Both drivers report libpq's PQtransactionStatus values.
+            status = conn.info.transaction_status
+            if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                close = True
+            elif status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except self.driver.Error:
+                    close = True
+
+        if close or conn.closed or self._is_expired(pooled, time.monotonic()):
+            self._close_quietly(conn)
+            self._release_slot()
+            return
+
+        pooled.last_used_at = time.monotonic()
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def closeall(self):
+        with self._condition:
+            for pooled in self._idle:
+                self._close_quietly(pooled.conn)
+            self._total -= len(self._idle)
+            self._idle = []
 
 def init_connection_pool(minconn=1, maxconn=3):
     global _connection_pool
     if _connection_pool is None:
-        _connection_pool = psycopg2.pool.SimpleConnectionPool(
-            minconn,
-            maxconn,
-            user=os.environ['DB_USER'],
-            password=os.environ['DB_PASS'],
-            host=os.environ['DB_HOST'],
-            port=os.environ['DB_PORT'],
-            dbname=os.environ['DB_NAME']
-        )
-    
+        with _pool_lock:
+            if _connection_pool is None:
+                _connection_pool = ResilientConnectionPool(
+                    minconn,
+                    int(os.environ.get('DB_POOL_MAX', maxconn)),
+                    user=os.environ['DB_USER'],
+                    password=os.environ['DB_PASS'],
+                    host=os.environ['DB_HOST'],
+                    port=os.environ['DB_PORT'],
+                    dbname=os.environ['DB_NAME']
+                )
+
     return _connection_pool
 
+class DictCursor(psycopg2.extensions.cursor):
+    # Returns each row as a plain dict like psycopg2.extras.RealDictCursor,
+    # without pulling psycopg2.extras into every handler's cold start.
+
+    def _column_names(self):
+        return [column.name for column in self.description]
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is None:
+            return None
+        return dict(zip(self._column_names(), row))
+
+    def fetchmany(self, size=None):
+        rows = super().fetchmany() if size is None else super().fetchmany(size)
+        names = self._column_names() if rows else None
+        return [dict(zip(names, row)) for row in rows]
+
+    def fetchall(self):
+        rows = super().fetchall()
+        names = self._column_names() if rows else None
+        return [dict(zip(names, row)) for row in rows]
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+def dict_cursor(conn):
+    return conn.cursor(cursor_factory=DictCursor)
+
+def _configure_session(conn, settings):
+    # Session settings are only sent when they differ from what this
+    # connection already has, so a container serving one route pays for
+    # them once rather than on every transaction. They are applied in
+    # autocommit so a rollback cannot undo them and the read-only default
+    # is in force before the next transaction begins.
+    if _session_settings.get(conn) == settings:
+        return
+
+    read_only, statement_timeout, lock_timeout = settings
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(
+            'SET default_transaction_read_only = %s; SET statement_timeout = %s; SET lock_timeout = %s;',
+            (read_only, statement_timeout, lock_timeout))
+
+    _session_settings[conn] = settings
+
 @contextmanager
-def get_db_connection():
+def get_db_connection(readonly=False, statement_timeout=None, lock_timeout=None):
     pool = init_connection_pool()
     conn = pool.getconn()
 
+    settings = (
+        readonly,
+        DEFAULT_STATEMENT_TIMEOUT_MS if statement_timeout is None else int(statement_timeout),
+        DEFAULT_LOCK_TIMEOUT_MS if lock_timeout is None else int(lock_timeout)
+    )
+
     try:
-        yield conn
+        _configure_session(conn, settings)
+        # Reads run in autocommit: every statement is its own read-only
+        # transaction, so there is no BEGIN/COMMIT round trip to pay for.
+        # Writes run as one explicit unit of work.
+        conn.autocommit = readonly
+
+        yield instrument_connection(conn)
+
+        if not readonly:
+            conn.commit()
     except psycopg2.Error as e:
         logger.error(f"DB error, discarding connection: {e}")
+        _session_settings.pop(conn, None)
         pool.putconn(conn, close=True)
         raise
+    except BaseException:
+        if not readonly:
+            try:
+                conn.rollback()
+            except psycopg2.Error as e:
+                logger.error(f"Rollback failed, discarding connection: {e}")
+                _session_settings.pop(conn, None)
+                pool.putconn(conn, close=True)
+                raise
+        pool.putconn(conn)
+        raise
     else:
-        pool.putconn(conn)
\ No newline at end of file
+        pool.putconn(conn)
@@ -0,0 +1,40 @@
+import os
+import psycopg2
+from .logger import logger
+from .db_connection import get_db_connection, dict_cursor
+from .statements import register_statement, execute_statement
+
+# Shared by GET /item?ids= and POST /items/lookup, so a basket resolves in
+# one query instead of one GET /item/{id} per line. Each route has its own
+# cap, since a query string holds far fewer IDs than a body; the router
+# deployment reads both, so each route keeps the same limit there.
+MAX_LOOKUP_QUERY_IDS = int(os.environ.get('MAX_LOOKUP_QUERY_IDS', 100))
+MAX_LOOKUP_BODY_IDS = int(os.environ.get('MAX_LOOKUP_BODY_IDS', 500))
+
+GET_ITEMS_BY_IDS_STATEMENT = register_statement(
+    'get_items_by_ids',
+    """
+    SELECT id, name, price, description, created_at
+    FROM items
+    WHERE id = ANY(%s) AND deleted = FALSE;
+    """)
+
+def get_items_by_ids_from_db(item_ids):
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with dict_cursor(conn) as cursor:
+                execute_statement(cursor, GET_ITEMS_BY_IDS_STATEMENT, (list(item_ids),))
+                rows_by_id = {row['id']: row for row in cursor.fetchall()}
+
+                items = [rows_by_id[item_id] for item_id in item_ids if item_id in rows_by_id]
+                missing = [item_id for item_id in item_ids if item_id not in rows_by_id]
+
+                logger.info(f"Successfully retrieved {len(items)} of {len(item_ids)} requested items")
+                return {'items': items, 'missing': missing}
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error while fetching items by ID: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while fetching items by ID: {e}")
+        raise
@@ -1,47 +1,80 @@
-import json
-import psycopg2
-from utils.custom_exceptions import ValidationError, ActiveResourceNotFoundError, ResourceNotFoundError
+import base64
+import binascii
+from utils.custom_exceptions import ValidationError, BatchValidationError, ActiveResourceNotFoundError, ResourceNotFoundError
 from utils.logger import logger
+from utils.serializer import dumps
+from utils.metrics import start_invocation, finish_invocation, record_metric
+from utils.compression import compress_response
+from utils.db_connection import database_errors
 
 def lambda_exception_handler_wrapper(handler_func):
 
     def wrapped_handler(event, context):
+        token = start_invocation(event)
+        try:
+            response = _handle(event, context)
+            if token is not None:
+                record_metric('BytesSerialized', len((response.get('body') or '').encode('utf-8')))
+            return compress_response(event, response)
+        finally:
+            finish_invocation(token)
+
+    def _handle(event, context):
+        # API Gateway base64-encodes request bodies once binary media types
+        # are enabled for compressed responses.
+        if event.get('isBase64Encoded') and event.get('body'):
+            try:
+                event = {**event, 'body': base64.b64decode(event['body']).decode('utf-8'), 'isBase64Encoded': False}
+            except (binascii.Error, UnicodeDecodeError) as e:
+                logger.warning(f'Undecodable request body: {e}')
+                return {
+                    'statusCode': 400,
+                    'body': dumps({'error': 'Request body could not be decoded'})
+                }
+
         try:
             return handler_func(event, context)
 
+        except BatchValidationError as e:
+            logger.warning(f'Batch validation error: {e.message} ({len(e.errors)} invalid entries)')
+            return {
+                'statusCode': e.status_code,
+                'body': dumps({'error': e.message, 'errors': e.errors})
+            }
+
         except ValidationError as e:
             logger.warning(f'Validation error: {e.message}')
             return {
                 'statusCode': e.status_code,
-                'body': json.dumps({'error': e.message})
+                'body': dumps({'error': e.message})
             }
 
         except ActiveResourceNotFoundError as e:
             logger.warning(f'Active Resource not found: {e.message}')
             return {
                 'statusCode': e.status_code,
-                'body': json.dumps({'error': e.message})
+                'body': dumps({'error': e.message})
             }
         
         except ResourceNotFoundError as e:
             logger.warning(f'Resource not found: {e.message}')
             return {
                 'statusCode': e.status_code,
-                'body': json.dumps({'error': e.message})
+                'body': dumps({'error': e.message})
             }
 
-        except psycopg2.Error as e:
+        except database_errors() as e:
             logger.error(f'Database error: {e}', exc_info=True)
             return {
                 'statusCode': 500,
-                'body': json.dumps({'error': 'Database error'})
+                'body': dumps({'error': 'Database error'})
             }
 
         except Exception as e:
             logger.error(f'Unhandled exception: {e}', exc_info=True)
             return {
                 'statusCode': 500,
-                'body': json.dumps({'error': 'Internal server error'})
+                'body': dumps({'error': 'Internal server error'})
             }
 
     return wrapped_handler
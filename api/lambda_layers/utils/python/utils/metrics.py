@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import time
+from contextvars import ContextVar
+from .logger import logger
+
+METRICS_MODE = os.environ.get('METRICS_MODE', 'off').lower()
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'AnswerKingAPI')
+
+# EMF caps a single metric at 100 values per log line.
+MAX_VALUES_PER_METRIC = 100
+
+UNITS = {
+    'PoolWaitTime': 'Milliseconds',
+    'ConnectTime': 'Milliseconds',
+    'StatementTime': 'Milliseconds',
+    'StatementCount': 'Count',
+    'RowsReturned': 'Count',
+    'BytesSerialized': 'Bytes',
+    'BytesCompressed': 'Bytes',
+    'CompressionTime': 'Milliseconds'
+}
+
+_current_metrics = ContextVar('current_metrics', default=None)
+
+def metrics_enabled():
+    return METRICS_MODE == 'emf'
+
+class InvocationMetrics:
+
+    def __init__(self, route):
+        self.route = route
+        self.values = {}
+
+    def record(self, name, value):
+        self.values.setdefault(name, []).append(value)
+
+    def to_emf(self):
+        metrics = {}
+        for name, values in self.values.items():
+            if name in ('StatementCount', 'RowsReturned', 'BytesSerialized', 'BytesCompressed'):
+                metrics[name] = sum(values)
+            else:
+                metrics[name] = [round(value, 3) for value in values[:MAX_VALUES_PER_METRIC]]
+
+        return {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': METRICS_NAMESPACE,
+                    'Dimensions': [['Route']],
+                    'Metrics': [{'Name': name, 'Unit': UNITS.get(name, 'None')} for name in metrics]
+                }]
+            },
+            'Route': self.route,
+            **metrics
+        }
+
+def record_metric(name, value):
+    collector = _current_metrics.get()
+    if collector is not None:
+        collector.record(name, value)
+
+def start_invocation(event):
+    if not metrics_enabled():
+        return None
+    return _current_metrics.set(InvocationMetrics(route_name(event)))
+
+def finish_invocation(token):
+    if token is None:
+        return
+
+    collector = _current_metrics.get()
+    _current_metrics.reset(token)
+
+    try:
+        # EMF lines must be bare JSON on stdout; the logging formatter would
+        # prefix them and CloudWatch would no longer extract the metrics.
+        sys.stdout.write(json.dumps(collector.to_emf()) + '\n')
+        sys.stdout.flush()
+    except Exception as e:
+        logger.warning(f'Failed to emit metrics: {e}')
+
+def route_name(event):
+    method = event.get('httpMethod') or 'UNKNOWN'
+    resource = event.get('resource') or event.get('path') or 'unknown'
+    return f'{method} {resource}'
+
+class InstrumentedCursor:
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        self._cursor.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._cursor.__exit__(exc_type, exc_value, traceback)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, query, vars=None):
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(query, vars)
+        finally:
+            record_metric('StatementTime', (time.perf_counter() - start) * 1000)
+            record_metric('StatementCount', 1)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            record_metric('RowsReturned', 1)
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._cursor.fetchmany() if size is None else self._cursor.fetchmany(size)
+        record_metric('RowsReturned', len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        record_metric('RowsReturned', len(rows))
+        return rows
+
+class InstrumentedConnection:
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        if name == '_conn':
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._conn, name, value)
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._conn.cursor(*args, **kwargs))
+
+def instrument_connection(conn):
+    if _current_metrics.get() is None:
+        return conn
+    return InstrumentedConnection(conn)
@@ -1,5 +1,9 @@
-from typing import Optional, Annotated
-from pydantic import BaseModel, BeforeValidator
+from typing import List, Optional, Annotated
+from pydantic import BaseModel, BeforeValidator, Field
+from .validation import MAX_ID
+
+# Per item in one order, after repeated lines are added together.
+MAX_ORDER_QUANTITY = 1000
 
 def validate_price(value) -> float:
     if not isinstance(value, (int, float)):
@@ -18,8 +22,16 @@ def validate_name(value) -> str:
         raise ValueError('Name field must not be empty')
     return value
 
+def validate_positive_int(value) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError('Value must be an integer')
+    if value < 1:
+        raise ValueError('Value must be a positive integer')
+    return value
+
 NameStr = Annotated[str, BeforeValidator(validate_name)]
 PriceFloat = Annotated[float, BeforeValidator(validate_price)]
+PositiveInt = Annotated[int, BeforeValidator(validate_positive_int)]
 
 class Item(BaseModel):
     name: NameStr
@@ -28,3 +40,10 @@ class Item(BaseModel):
 
 class Category(BaseModel):
     name: NameStr
+
+class OrderLine(BaseModel):
+    item_id: Annotated[PositiveInt, Field(le=MAX_ID)]
+    quantity: Annotated[PositiveInt, Field(le=MAX_ORDER_QUANTITY)]
+
+class Order(BaseModel):
+    items: List[OrderLine] = []
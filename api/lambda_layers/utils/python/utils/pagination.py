@@ -0,0 +1,85 @@
+import os
+import json
+import hmac
+import base64
+import hashlib
+from urllib.parse import urlencode
+from .logger import logger
+from .custom_exceptions import ValidationError
+from .json_default import json_default
+
+DEFAULT_PAGE_SIZE = int(os.environ.get('DEFAULT_PAGE_SIZE', 50))
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', 200))
+
+def _b64encode(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+def _b64decode(text):
+    padding = '=' * (-len(text) % 4)
+    return base64.urlsafe_b64decode(text + padding)
+
+def _sign(payload):
+    # With no key anyone could mint a cursor, so without one the handler
+    # fails rather than signing or trusting any.
+    secret = os.environ.get('CURSOR_SECRET')
+    if not secret:
+        logger.error('CURSOR_SECRET is not set; refusing to sign or verify pagination cursors')
+        raise RuntimeError('CURSOR_SECRET is not set')
+    return hmac.new(secret.encode('utf-8'), payload.encode('ascii'), hashlib.sha256).digest()[:16]
+
+def encode_cursor(values):
+    payload = _b64encode(json.dumps(values, default=json_default, separators=(',', ':')).encode('utf-8'))
+    return f'{payload}.{_b64encode(_sign(payload))}'
+
+def decode_cursor(cursor, key_length=None):
+    try:
+        payload, signature = cursor.split('.', 1)
+        if not hmac.compare_digest(_b64decode(signature), _sign(payload)):
+            raise ValueError('Signature mismatch')
+        values = json.loads(_b64decode(payload))
+    except (ValueError, TypeError) as e:
+        logger.warning(f'Rejected pagination cursor: {e}')
+        raise ValidationError('Invalid pagination cursor')
+
+    if not isinstance(values, list) or (key_length is not None and len(values) != key_length):
+        raise ValidationError('Invalid pagination cursor')
+
+    return values
+
+def extract_pagination_params(event, key_length=2):
+    query_params = event.get('queryStringParameters') or {}
+    limit = query_params.get('limit')
+    cursor = query_params.get('cursor')
+
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    else:
+        try:
+            limit = int(limit)
+        except ValueError as e:
+            logger.error(f'Query string parameter limit not an int value: {e}')
+            raise ValidationError('limit must be an integer')
+
+        if limit < 1:
+            raise ValidationError('limit must be a positive integer')
+
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    return limit, decode_cursor(cursor, key_length) if cursor else None
+
+def build_next_link(event, limit, next_cursor):
+    query_params = dict(event.get('queryStringParameters') or {})
+    query_params['limit'] = limit
+    query_params['cursor'] = next_cursor
+
+    path = event.get('path') or '/'
+    return f'{path}?{urlencode(query_params)}'
+
+def pagination_headers(event, limit, next_cursor):
+    if not next_cursor:
+        return {}
+
+    return {
+        'X-Next-Cursor': next_cursor,
+        'Link': f'<{build_next_link(event, limit, next_cursor)}>; rel="next"'
+    }
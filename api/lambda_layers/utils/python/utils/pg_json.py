@@ -0,0 +1,34 @@
+import os
+
+# 'postgres' makes the list endpoints build their response body inside the
+# query, so no per-row dict, decode or re-encode happens in Python.
+JSON_RENDERING = os.environ.get('JSON_RENDERING', 'python').lower()
+
+def postgres_rendering_enabled():
+    return JSON_RENDERING == 'postgres'
+
+# The fragments below reproduce serializer.dumps byte for byte: row_to_json
+# is compact and keeps column order, and its string escaping matches
+# orjson's. Only prices and timestamps need help. The SQL avoids a literal
+# '%' so it can go through execute_statement with or without PREPARE.
+
+# Python prints a float NUMERIC(10, 2) as 5.5, 2.0 or 5.05; Postgres would
+# print 5.50 for numeric and 2 for float8.
+def json_price(column):
+    return (
+        f"(CASE WHEN {column} = trunc({column}) THEN trunc({column})::text || '.0' "
+        f"ELSE rtrim({column}::text, '0') END)::json"
+    )
+
+# datetime.isoformat() drops the fraction entirely when it is zero and
+# otherwise prints all six digits; Postgres trims trailing zeros.
+def json_timestamp(column):
+    return (
+        f"CASE WHEN date_trunc('second', {column}) = {column} "
+        f"THEN to_char({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS') "
+        f"ELSE to_char({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS.US') END"
+    )
+
+def json_array(row_json, order_by, filter_sql=None):
+    filter_clause = f' FILTER (WHERE {filter_sql})' if filter_sql else ''
+    return f"'[' || COALESCE(string_agg({row_json}::text, ',' ORDER BY {order_by}){filter_clause}, '') || ']'"
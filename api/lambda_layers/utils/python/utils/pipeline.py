@@ -0,0 +1,110 @@
+import os
+import time
+import threading
+from contextlib import contextmanager
+from .logger import logger
+from .metrics import record_metric
+from .statements import get_statement, execute_statement, PREPARED_STATEMENTS_ENABLED
+from .db_connection import (
+    DB_DRIVER, DEFAULT_STATEMENT_TIMEOUT_MS, DEFAULT_LOCK_TIMEOUT_MS,
+    ResilientConnectionPool, get_db_connection, dict_cursor
+)
+
+# Handlers that need several independent statements hand them to
+# execute_pipeline as (statement name, params) pairs. With DB_DRIVER=psycopg
+# they go out in one psycopg 3 pipeline, so the whole unit of work costs a
+# single network round trip; otherwise they run one after another on the
+# usual psycopg2 connection. Every statement is sent before any result is
+# read, so none may depend on an earlier statement's rows in Python.
+
+PIPELINE_ENABLED = DB_DRIVER == 'psycopg'
+
+_pipeline_pool = None
+_pipeline_pool_lock = threading.Lock()
+
+def init_pipeline_pool(minconn=1, maxconn=3):
+    global _pipeline_pool
+    if _pipeline_pool is None:
+        with _pipeline_pool_lock:
+            if _pipeline_pool is None:
+                import psycopg
+                from psycopg.types.numeric import FloatLoader
+
+                # Same NUMERIC -> float decoding as DEC2FLOAT on the psycopg2 side.
+                psycopg.adapters.register_loader('numeric', FloatLoader)
+
+                # psycopg 3 prepares a query itself once it has run prepare_threshold
+                # times on a connection; None keeps it off behind a pooling proxy.
+                _pipeline_pool = ResilientConnectionPool(
+                    minconn,
+                    int(os.environ.get('DB_POOL_MAX', maxconn)),
+                    driver=psycopg,
+                    autocommit=True,
+                    prepare_threshold=5 if PREPARED_STATEMENTS_ENABLED else None,
+                    options=f'-c statement_timeout={DEFAULT_STATEMENT_TIMEOUT_MS} -c lock_timeout={DEFAULT_LOCK_TIMEOUT_MS}',
+                    user=os.environ['DB_USER'],
+                    password=os.environ['DB_PASS'],
+                    host=os.environ['DB_HOST'],
+                    port=os.environ['DB_PORT'],
+                    dbname=os.environ['DB_NAME']
+                )
+
+    return _pipeline_pool
+
+@contextmanager
+def get_pipeline_connection():
+    import psycopg
+
+    pool = init_pipeline_pool()
+    conn = pool.getconn()
+
+    try:
+        yield conn
+    except psycopg.Error as e:
+        logger.error(f"DB error in pipeline, discarding connection: {e}")
+        pool.putconn(conn, close=True)
+        raise
+    except BaseException:
+        pool.putconn(conn)
+        raise
+    else:
+        pool.putconn(conn)
+
+def _execute_pipelined(queries, readonly):
+    from psycopg.rows import dict_row
+
+    with get_pipeline_connection() as conn:
+        # The connection is in autocommit, so BEGIN and COMMIT are ordinary
+        # pipelined commands and the only sync is the one on leaving the
+        # pipeline block.
+        start = time.perf_counter()
+        with conn.pipeline():
+            conn.execute('BEGIN READ ONLY;' if readonly else 'BEGIN;')
+            cursors = []
+            for name, params in queries:
+                cursor = conn.cursor(row_factory=dict_row)
+                cursor.execute(get_statement(name).sql, tuple(params))
+                cursors.append(cursor)
+            conn.execute('COMMIT;')
+        record_metric('PipelineTime', (time.perf_counter() - start) * 1000)
+        record_metric('StatementCount', len(cursors))
+
+        return [cursor.fetchall() if cursor.description else [] for cursor in cursors]
+
+def _execute_sequentially(queries, readonly):
+    with get_db_connection(readonly=readonly) as conn:
+        results = []
+        for name, params in queries:
+            with dict_cursor(conn) as cursor:
+                execute_statement(cursor, name, params)
+                results.append(cursor.fetchall() if cursor.description else [])
+
+        return results
+
+def execute_pipeline(queries, readonly=False):
+    queries = list(queries)
+
+    if PIPELINE_ENABLED:
+        return _execute_pipelined(queries, readonly)
+
+    return _execute_sequentially(queries, readonly)
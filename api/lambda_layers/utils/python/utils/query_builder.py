@@ -0,0 +1,94 @@
+import math
+import hashlib
+import datetime
+from collections import namedtuple
+from .logger import logger
+from .custom_exceptions import ValidationError
+from .validation import MAX_ID
+
+# Turns listing query parameters into parameterized SQL. Only the names,
+# conditions and columns declared by the handler's allow-lists reach the SQL
+# text; every value supplied by the client travels as a %s parameter.
+
+# parse: raw query string value -> SQL parameter (raises ValidationError).
+# condition: SQL with exactly one %s for that parameter.
+Filter = namedtuple('Filter', ['parse', 'condition'])
+
+# column: the sort column; cast: its SQL type, applied to the cursor value so
+# the keyset comparison stays on the column's index.
+Sort = namedtuple('Sort', ['column', 'cast'])
+
+def parse_price(name, value):
+    try:
+        price = float(value)
+    except ValueError:
+        raise ValidationError(f'{name} must be a number')
+
+    if not math.isfinite(price) or price < 0:
+        raise ValidationError(f'{name} must be a non-negative number')
+    return price
+
+def parse_timestamp(name, value):
+    try:
+        timestamp = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f'{name} must be an ISO 8601 timestamp')
+
+    # created_at is a TIMESTAMP in UTC and %s::timestamp would simply drop an
+    # offset, so convert instead.
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+def parse_positive_int(name, value):
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValidationError(f'{name} must be an integer')
+
+    if number < 1:
+        raise ValidationError(f'{name} must be a positive integer')
+    # Compared against INTEGER columns, so keep it within int4.
+    if number > MAX_ID:
+        raise ValidationError(f'{name} must be at most {MAX_ID}')
+    return number
+
+def parse_filters(query_params, allowed_filters):
+    filters = []
+    for name, allowed in allowed_filters.items():
+        value = query_params.get(name)
+        if value is None or value == '':
+            continue
+        filters.append((name, allowed.parse(name, value)))
+    return tuple(filters)
+
+def parse_sort(query_params, allowed_sorts, default):
+    sort = query_params.get('sort') or default
+    key = sort[1:] if sort.startswith('-') else sort
+
+    if key not in allowed_sorts:
+        logger.info(f'Rejected sort parameter: {sort}')
+        raise ValidationError(f"sort must be one of: {', '.join(sorted(allowed_sorts))}, optionally prefixed with -")
+
+    return key, sort.startswith('-')
+
+def build_listing_query(prefix, select_sql, allowed_filters, filters, allowed_sorts, sort, after, limit):
+    key, descending = sort
+    column, cast = allowed_sorts[key]
+    direction, comparison = ('DESC', '<') if descending else ('ASC', '>')
+
+    conditions = [allowed_filters[name].condition for name, _ in filters]
+    params = [value for _, value in filters]
+
+    if after:
+        conditions.append(f'({column}, id) {comparison} (%s::{cast}, %s)')
+        params.extend(after)
+
+    sql = select_sql + ''.join(f'\n    AND {condition}' for condition in conditions) + (
+        f'\n    ORDER BY {column} {direction}, id {direction}\n    LIMIT %s;')
+    params.append(limit)
+
+    # One statement name per distinct shape, so repeated shapes reuse the
+    # prepared plan on a warm connection.
+    name = f"{prefix}_{hashlib.md5(sql.encode('utf-8')).hexdigest()[:16]}"
+    return name, sql, tuple(params)
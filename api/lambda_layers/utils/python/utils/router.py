@@ -0,0 +1,120 @@
+import os
+import re
+import sys
+import threading
+import importlib.util
+from .logger import logger
+from .serializer import dumps
+
+# (httpMethod, resource) -> handler module, relative to the api/ directory.
+# Mirrors the per-function events in template.yml; the router deployment
+# (template.router.yml) sends every one of these routes to a single Lambda.
+ROUTES = {
+    ('POST', '/item'): 'items/create_item/create_item',
+    ('GET', '/item'): 'items/get_all_items/get_all_items',
+    ('GET', '/item/search'): 'items/search_items/search_items',
+    ('GET', '/item/{id}'): 'items/get_item_by_id/get_item_by_id',
+    ('PUT', '/item/{id}'): 'items/update_item/update_item',
+    ('DELETE', '/item/{id}'): 'items/remove_item/remove_item',
+    ('POST', '/items/batch'): 'items/create_items_batch/create_items_batch',
+    ('POST', '/items/lookup'): 'items/lookup_items/lookup_items',
+    ('POST', '/category'): 'categories/create_category/create_category',
+    ('GET', '/category'): 'categories/get_all_categories/get_all_categories',
+    ('PUT', '/category/{id}'): 'categories/update_category/update_category',
+    ('DELETE', '/category/{id}'): 'categories/remove_category/remove_category',
+    ('POST', '/category/{id}/items'): 'item_categories/add_item_to_category/add_item_to_category',
+    ('GET', '/category/{id}/items'): 'item_categories/get_items_by_category/get_items_by_category',
+    ('POST', '/orders'): 'orders/create_order/create_order',
+    ('GET', '/menu'): 'menu/get_menu/get_menu'
+}
+
+ROUTER_PRELOAD = os.environ.get('ROUTER_PRELOAD', 'off').lower() in ('on', 'true', '1')
+
+def compile_resource(resource):
+    pattern = re.sub(r'\\\{(\w+)\\\}', r'(?P<\1>[^/]+)', re.escape(resource))
+    return re.compile(f'^{pattern}/?$')
+
+class Router:
+
+    def __init__(self, base_dir, routes=ROUTES):
+        self.base_dir = base_dir
+        self.routes = dict(routes)
+        self.resources = {resource for _, resource in self.routes}
+        # Literal resources sort first so /items/batch never matches a
+        # templated sibling.
+        self.resource_patterns = [
+            (resource, compile_resource(resource))
+            for resource in sorted(self.resources, key=lambda resource: (resource.count('{'), resource))
+        ]
+        self._handlers = {}
+        self._load_lock = threading.Lock()
+
+    def match_path(self, path):
+        for resource, pattern in self.resource_patterns:
+            match = pattern.match(path)
+            if match:
+                return resource, match.groupdict() or None
+        return None, None
+
+    def _load_handler(self, module_path):
+        handler = self._handlers.get(module_path)
+        if handler is not None:
+            return handler
+
+        # Threaded hosts (local_server) can ask for the same module from
+        # several workers at once; import it exactly once.
+        with self._load_lock:
+            return self._import_handler(module_path)
+
+    def _import_handler(self, module_path):
+        handler = self._handlers.get(module_path)
+        if handler is not None:
+            return handler
+
+        module_name = os.path.basename(module_path)
+        module = sys.modules.get(module_name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(module_name, os.path.join(self.base_dir, f'{module_path}.py'))
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+
+        handler = self._handlers[module_path] = module.lambda_handler
+        return handler
+
+    def preload(self):
+        for module_path in set(self.routes.values()):
+            self._load_handler(module_path)
+        logger.info(f'Router preloaded {len(self._handlers)} handlers')
+
+    def resolve(self, method, resource):
+        module_path = self.routes.get((method, resource))
+        if module_path is None:
+            return None
+        return self._load_handler(module_path)
+
+    def __call__(self, event, context):
+        method = event.get('httpMethod')
+        resource = event.get('resource')
+
+        handler = self.resolve(method, resource)
+        if handler is not None:
+            return handler(event, context)
+
+        if resource in self.resources:
+            logger.warning(f'Method {method} not allowed on {resource}')
+            return {
+                'statusCode': 405,
+                'body': dumps({'error': f'Method {method} not allowed on {resource}'})
+            }
+
+        target = resource or event.get('path')
+        logger.warning(f'No route for {method} {target}')
+        return {
+            'statusCode': 404,
+            'body': dumps({'error': f'No route for {method} {target}'})
+        }
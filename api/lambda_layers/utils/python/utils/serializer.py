@@ -0,0 +1,29 @@
+import json
+import datetime
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = 'orjson' if orjson is not None else 'json'
+
+# orjson encodes datetime, date and UUID natively; NUMERIC columns already
+# arrive as float (see db_connection), so this hook only runs for the odd
+# Decimal built in Python or a type neither backend knows.
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    return str(obj)
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj):
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode('utf-8')
+else:
+    def dumps(obj):
+        return json.dumps(obj, default=_default, separators=(',', ':'), ensure_ascii=False)
@@ -0,0 +1,85 @@
+import os
+import re
+import weakref
+from .logger import logger
+
+# Transaction-pooling proxies (RDS Proxy, PgBouncer in transaction mode) can
+# hand each transaction a different backend, so named statements must be
+# switched off there and the plain SQL text sent instead.
+PREPARED_STATEMENTS_ENABLED = os.environ.get('PREPARED_STATEMENTS', 'on').lower() not in ('off', 'false', '0')
+
+_NAME_PATTERN = re.compile(r'^[a-z_][a-z0-9_]*$')
+
+_statements = {}
+_prepared_by_connection = weakref.WeakKeyDictionary()
+
+class Statement:
+    __slots__ = ('name', 'sql', 'prepare_sql', 'param_count')
+
+    def __init__(self, name, sql):
+        self.name = name
+        self.sql = sql
+        self.param_count = sql.count('%s')
+
+        counter = iter(range(1, self.param_count + 1))
+        positional = re.sub(r'%s', lambda match: f'${next(counter)}', sql).strip().rstrip(';')
+        # PREPARE is sent without parameters, so psycopg2 never unescapes a
+        # literal %% (e.g. the pg_trgm operators) for us.
+        positional = positional.replace('%%', '%')
+        self.prepare_sql = f'PREPARE {name} AS {positional};'
+
+def register_statement(name, sql):
+    if not _NAME_PATTERN.match(name):
+        raise ValueError(f'Invalid statement name: {name}')
+
+    existing = _statements.get(name)
+    if existing is not None:
+        if existing.sql != sql:
+            raise ValueError(f'Statement {name} is already registered with different SQL')
+        return name
+
+    _statements[name] = Statement(name, sql)
+    return name
+
+def get_statement(name):
+    return _statements[name]
+
+def _prepared_names(conn):
+    try:
+        return _prepared_by_connection.setdefault(conn, set())
+    except TypeError:
+        return None
+
+def execute_statement(cursor, name, params=()):
+    statement = _statements[name]
+    params = tuple(params)
+
+    if len(params) != statement.param_count:
+        raise ValueError(f'Statement {name} expects {statement.param_count} parameters, got {len(params)}')
+
+    if not PREPARED_STATEMENTS_ENABLED:
+        cursor.execute(statement.sql, params)
+        return
+
+    conn = cursor.connection
+    prepared = _prepared_names(conn)
+    if prepared is None:
+        cursor.execute(statement.sql, params)
+        return
+
+    if name not in prepared:
+        logger.info(f'Preparing statement {name} on connection')
+        prepare_cursor = conn.cursor()
+        try:
+            prepare_cursor.execute(statement.prepare_sql)
+        finally:
+            prepare_cursor.close()
+        prepared.add(name)
+
+    if params:
+        cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))});", params)
+    else:
+        cursor.execute(f'EXECUTE {name};')
+
+def forget_prepared_statements(conn):
+    _prepared_by_connection.pop(conn, None)
@@ -0,0 +1,68 @@
+from contextvars import ContextVar
+from contextlib import contextmanager
+from .logger import logger
+from .db_connection import get_db_connection
+from .statements import register_statement, execute_statement
+
+VERSIONED_TABLES = {'items', 'categories', 'item_categories', 'orders'}
+
+# Versions already read from the DB during the current request, so the
+# conditional GET check and the read cache agree on one snapshot.
+_request_versions = ContextVar('request_versions', default={})
+
+def _check_table_name(table_name):
+    if table_name not in VERSIONED_TABLES:
+        raise ValueError(f'Table {table_name} is not versioned')
+
+def bump_table_version(cursor, table_name):
+    _check_table_name(table_name)
+
+    cursor.execute(
+        """
+        INSERT INTO table_versions (table_name, version)
+        VALUES (%s, 1)
+        ON CONFLICT (table_name) DO UPDATE
+        SET version = table_versions.version + 1;
+        """,
+        (table_name,))
+
+    from .cache import invalidate_table
+    invalidate_table(table_name)
+
+GET_TABLE_VERSIONS_STATEMENT = register_statement(
+    'get_table_versions',
+    """
+    SELECT table_name, version FROM table_versions
+    WHERE table_name = ANY(%s);
+    """)
+
+def get_table_versions(table_names):
+    for table_name in table_names:
+        _check_table_name(table_name)
+
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with conn.cursor() as cursor:
+                execute_statement(cursor, GET_TABLE_VERSIONS_STATEMENT, (list(table_names),))
+                versions = dict(cursor.fetchall())
+
+    except Exception as e:
+        logger.warning(f'Could not read table versions for {table_names}: {e}')
+        return None
+
+    return tuple(versions.get(table_name, 0) for table_name in table_names)
+
+def known_table_versions(table_names):
+    known = _request_versions.get()
+    if not all(table_name in known for table_name in table_names):
+        return None
+
+    return tuple(known[table_name] for table_name in table_names)
+
+@contextmanager
+def remember_table_versions(table_names, versions):
+    token = _request_versions.set({**_request_versions.get(), **dict(zip(table_names, versions))})
+    try:
+        yield
+    finally:
+        _request_versions.reset(token)
@@ -1,10 +1,24 @@
 import json
-from pydantic import ValidationError as PydanticValidationError
 from .logger import logger
 from .custom_exceptions import ValidationError, ActiveResourceNotFoundError
-from .models import Category, Item
+from .statements import register_statement, execute_statement
+
+# pydantic and the models are imported inside the body validators so the
+# read-only handlers, which only need the path and query helpers here, do
+# not pay for them on cold start.
+
+# IDs are INTEGER columns and prepared statements type their parameters to
+# match, so an ID outside int4 would fail in Postgres rather than miss.
+MIN_ID = -2 ** 31
+MAX_ID = 2 ** 31 - 1
+
+def id_in_range(value):
+    return MIN_ID <= value <= MAX_ID
 
 def validate_category_event_body(event):
+    from pydantic import ValidationError as PydanticValidationError
+    from .models import Category
+
     if not event.get('body'):
         raise ValidationError('Request body is required')
 
@@ -19,6 +33,9 @@ def validate_category_event_body(event):
         raise ValidationError(e.errors()[0]['msg'])
 
 def validate_item_event_body(event):
+    from pydantic import ValidationError as PydanticValidationError
+    from .models import Item
+
     if not event.get('body'):
         raise ValidationError('Request body is required')
 
@@ -33,7 +50,138 @@ def validate_item_event_body(event):
     except PydanticValidationError as e:
         error_messages = "; ".join(err["msg"] for err in e.errors())
         raise ValidationError(error_messages)
-    
+
+def validate_item_batch_event_body(event, max_batch_size):
+    from pydantic import ValidationError as PydanticValidationError
+    from .models import Item
+
+    if not event.get('body'):
+        raise ValidationError('Request body is required')
+
+    try:
+        body = json.loads(event['body'])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid JSON in request body: {e}")
+        raise ValidationError('Invalid JSON format')
+
+    if not isinstance(body, list) or not body:
+        raise ValidationError('Request body must be a non-empty JSON array of items')
+
+    if len(body) > max_batch_size:
+        raise ValidationError(f'Batch size {len(body)} exceeds the maximum of {max_batch_size}')
+
+    items = []
+    errors = []
+    for index, entry in enumerate(body):
+        try:
+            items.append((index, Item.model_validate(entry)))
+        except PydanticValidationError as e:
+            errors.append({'index': index, 'error': "; ".join(err["msg"] for err in e.errors())})
+
+    return items, errors
+
+def validate_item_ids_event_body(event, max_items):
+    if not event.get('body'):
+        raise ValidationError('Request body is required')
+
+    try:
+        body = json.loads(event['body'])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid JSON in request body: {e}")
+        raise ValidationError('Invalid JSON format')
+
+    item_ids = body.get('item_ids') if isinstance(body, dict) else None
+    if not isinstance(item_ids, list) or not item_ids:
+        raise ValidationError('item_ids must be a non-empty list of integers')
+
+    if any(isinstance(item_id, bool) or not isinstance(item_id, int) for item_id in item_ids):
+        raise ValidationError('item_ids must be a non-empty list of integers')
+
+    if not all(id_in_range(item_id) for item_id in item_ids):
+        raise ValidationError(f'item_ids must be between {MIN_ID} and {MAX_ID}')
+
+    item_ids = list(dict.fromkeys(item_ids))
+    if len(item_ids) > max_items:
+        raise ValidationError(f'Cannot add more than {max_items} items in one request')
+
+    return item_ids
+
+def validate_lookup_ids(ids, max_ids):
+    if not all(id_in_range(item_id) for item_id in ids):
+        raise ValidationError(f'ids must be between {MIN_ID} and {MAX_ID}')
+
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > max_ids:
+        raise ValidationError(f'Cannot look up more than {max_ids} items in one request')
+
+    return ids
+
+def extract_ids_query_param(event, max_ids):
+    query_params = event.get('queryStringParameters') or {}
+    raw_ids = [raw_id.strip() for raw_id in (query_params.get('ids') or '').split(',')]
+
+    try:
+        ids = [int(raw_id) for raw_id in raw_ids if raw_id]
+    except ValueError as e:
+        logger.error(f'Query string parameter ids not a list of ints: {e}')
+        raise ValidationError('ids must be a comma-separated list of integers')
+
+    if not ids:
+        raise ValidationError('ids must be a comma-separated list of integers')
+
+    return validate_lookup_ids(ids, max_ids)
+
+def validate_lookup_event_body(event, max_ids):
+    if not event.get('body'):
+        raise ValidationError('Request body is required')
+
+    try:
+        body = json.loads(event['body'])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid JSON in request body: {e}")
+        raise ValidationError('Invalid JSON format')
+
+    ids = body.get('ids') if isinstance(body, dict) else None
+    if not isinstance(ids, list) or not ids or any(isinstance(item_id, bool) or not isinstance(item_id, int) for item_id in ids):
+        raise ValidationError('ids must be a non-empty list of integers')
+
+    return validate_lookup_ids(ids, max_ids)
+
+def validate_order_event_body(event, max_lines):
+    from pydantic import ValidationError as PydanticValidationError
+    from .models import Order, MAX_ORDER_QUANTITY
+
+    if not event.get('body'):
+        return []
+
+    try:
+        body = json.loads(event['body'])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid JSON in request body: {e}")
+        raise ValidationError('Invalid JSON format')
+
+    if not isinstance(body, dict):
+        raise ValidationError('Request body must be a JSON object')
+
+    try:
+        order = Order.model_validate(body)
+    except PydanticValidationError as e:
+        error_messages = "; ".join(f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors())
+        raise ValidationError(error_messages)
+
+    quantities = {}
+    for line in order.items:
+        quantities[line.item_id] = quantities.get(line.item_id, 0) + line.quantity
+
+    if len(quantities) > max_lines:
+        raise ValidationError(f'Cannot order more than {max_lines} different items in one order')
+
+    for item_id, quantity in quantities.items():
+        if quantity > MAX_ORDER_QUANTITY:
+            raise ValidationError(f'Cannot order more than {MAX_ORDER_QUANTITY} of item {item_id} in one order')
+
+    return list(quantities.items())
+
 def extract_item_id_from_query_param(event):
     query_params = event.get('queryStringParameters') or {}
     item_id = query_params.get('itemID')
@@ -43,11 +191,30 @@ def extract_item_id_from_query_param(event):
         raise ValidationError('Invalid or missing ID in path. Must use query string parameter labeled itemID')
 
     try:
-        return int(item_id)
+        item_id = int(item_id)
     except ValueError as e:
         logger.error(f'Query string parameter ID not an int value: {e}')
         raise ValidationError('ID must be an integer')
-    
+
+    if not id_in_range(item_id):
+        logger.info(f'Query string parameter ID out of range: {item_id}')
+        raise ValidationError(f'ID must be between {MIN_ID} and {MAX_ID}')
+
+    return item_id
+
+def extract_search_query_param(event, max_length):
+    query_params = event.get('queryStringParameters') or {}
+    query = ' '.join((query_params.get('q') or '').split())
+
+    if not query:
+        logger.info('No query string parameter labeled q')
+        raise ValidationError('Missing search text. Must use query string parameter labeled q')
+
+    if len(query) > max_length:
+        raise ValidationError(f'Search text must be at most {max_length} characters')
+
+    return query
+
 def extract_id_path_param(event):
     path_params = event.get('pathParameters') or {}
     item_id = path_params.get('id')
@@ -57,23 +224,50 @@ def extract_id_path_param(event):
         raise ValidationError('Invalid or missing path ID')
 
     try:
-        return int(item_id)
+        item_id = int(item_id)
     except ValueError as e:
         logger.error(f'Path ID not an int value: {e}')
         raise ValidationError('ID must be an integer')
 
+    if not id_in_range(item_id):
+        logger.info(f'Path ID out of range: {item_id}')
+        raise ValidationError(f'ID must be between {MIN_ID} and {MAX_ID}')
+
+    return item_id
+
+ACTIVE_ROW_STATEMENTS = {
+    table: register_statement(f'get_active_{table}_row', f"SELECT id FROM {table} WHERE id = %s AND deleted = false;")
+    for table in ('items', 'categories', 'item_categories', 'orders')
+}
+
 def get_active_row_from_table(cursor, table_name, id):
-    allowed_tables = {'items', 'categories', 'item_categories', 'orders'}
-    
-    if table_name.lower() not in (table.lower() for table in allowed_tables):
+    statement = ACTIVE_ROW_STATEMENTS.get(table_name.lower())
+
+    if statement is None:
         raise ValidationError(f"Invalid table name: {table_name}")
 
-    query = f"SELECT id FROM {table_name} WHERE id = %s AND deleted = false;"
-    cursor.execute(query, (id,))
+    execute_statement(cursor, statement, (id,))
     
     response = cursor.fetchone()
     if not response:
         logger.error(f'No Active {table_name} found at ID: {id}')
         raise ActiveResourceNotFoundError(f'No Active {table_name} found at ID: {id}')
     
-    return response
\ No newline at end of file
+    return response
+
+def active_row_query(table_name, id):
+    statement = ACTIVE_ROW_STATEMENTS.get(table_name.lower())
+
+    if statement is None:
+        raise ValidationError(f"Invalid table name: {table_name}")
+
+    return statement, (id,)
+
+# The pipelined counterpart of get_active_row_from_table: checks the rows
+# that active_row_query returned once the pipeline has been read.
+def require_active_row(rows, table_name, id):
+    if not rows:
+        logger.error(f'No Active {table_name} found at ID: {id}')
+        raise ActiveResourceNotFoundError(f'No Active {table_name} found at ID: {id}')
+
+    return rows[0]
\ No newline at end of file
@@ -0,0 +1,148 @@
+import os
+import sys
+import base64
+import secrets
+import argparse
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qsl
+
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(API_DIR, 'lambda_layers', 'utils', 'python'))
+
+from utils.logger import logger
+from utils.router import Router
+from utils.serializer import dumps
+
+# Serves the Lambda handlers over plain HTTP for load tests and local runs.
+# Requests are turned into API Gateway proxy events and dispatched through
+# the same route table as the single-function deployment.
+
+def build_event(router, method, raw_path, headers, body):
+    url = urlsplit(raw_path)
+    resource, path_parameters = router.match_path(url.path)
+
+    query_pairs = parse_qsl(url.query, keep_blank_values=True)
+    multi_value_query = {}
+    for key, value in query_pairs:
+        multi_value_query.setdefault(key, []).append(value)
+
+    return {
+        'resource': resource,
+        'path': url.path,
+        'httpMethod': method,
+        'headers': dict(headers),
+        'multiValueHeaders': {key: headers.get_all(key) for key in set(headers.keys())},
+        'queryStringParameters': {key: values[-1] for key, values in multi_value_query.items()} or None,
+        'multiValueQueryStringParameters': multi_value_query or None,
+        'pathParameters': path_parameters,
+        'body': body.decode('utf-8') if body else None,
+        'isBase64Encoded': False,
+        'requestContext': {'resourcePath': resource, 'httpMethod': method, 'stage': 'local'}
+    }
+
+class LambdaRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'AnswerKingLocal/1.0'
+
+    def _dispatch(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        try:
+            event = build_event(self.server.router, self.command, self.path, self.headers, body)
+        except UnicodeDecodeError as e:
+            # Same answer the Lambda wrapper gives an undecodable body.
+            logger.warning(f'Undecodable request body for {self.command} {self.path}: {e}')
+            self._write_response({'statusCode': 400, 'body': dumps({'error': 'Request body could not be decoded'})})
+            return
+
+        try:
+            response = self.server.router(event, None)
+        except Exception as e:
+            logger.error(f'Unhandled error serving {self.command} {self.path}: {e}', exc_info=True)
+            response = {'statusCode': 500, 'body': dumps({'error': 'Internal server error'})}
+
+        self._write_response(response)
+
+    def _write_response(self, response):
+        payload = response.get('body') or ''
+        if response.get('isBase64Encoded'):
+            payload = base64.b64decode(payload)
+        else:
+            payload = payload.encode('utf-8')
+
+        self.send_response(response.get('statusCode', 200))
+        headers = response.get('headers') or {}
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if not any(name.lower() == 'content-type' for name in headers):
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _dispatch
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            logger.info(f'{self.address_string()} {format % args}')
+
+class PooledHTTPServer(HTTPServer):
+    # HTTPServer handles one request at a time and ThreadingHTTPServer starts
+    # an unbounded thread per connection; a fixed pool keeps concurrency (and
+    # DB connections) at the configured worker count.
+
+    def __init__(self, address, router, workers, quiet=False):
+        super().__init__(address, LambdaRequestHandler)
+        self.router = router
+        self.quiet = quiet
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='api-worker')
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+def create_server(host='127.0.0.1', port=3000, workers=8, quiet=False, preload=True):
+    router = Router(API_DIR)
+    if preload:
+        router.preload()
+    return PooledHTTPServer((host, port), router, workers, quiet=quiet)
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the API handlers over HTTP with a fixed worker pool.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3000)
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('LOCAL_SERVER_WORKERS', 8)))
+    parser.add_argument('--quiet', action='store_true', help='do not log every request')
+    args = parser.parse_args()
+
+    # One pooled DB connection per worker, so no worker waits on another's
+    # checkout unless DB_POOL_MAX is set lower on purpose.
+    os.environ.setdefault('DB_POOL_MAX', str(args.workers))
+    # Pagination refuses to run without a cursor key; a per-process one keeps
+    # local cursors valid until the server restarts.
+    os.environ.setdefault('CURSOR_SECRET', secrets.token_hex(32))
+
+    server = create_server(args.host, args.port, args.workers, quiet=args.quiet)
+    logger.info(f'Serving on http://{args.host}:{server.server_address[1]} with {args.workers} workers')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
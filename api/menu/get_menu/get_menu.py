@@ -0,0 +1,89 @@
+import os
+import psycopg2
+import psycopg2.errors
+from utils.logger import logger
+from utils.db_connection import get_db_connection
+from utils.cache import read_through_cache
+from utils.statements import register_statement, execute_statement
+from utils.pg_json import json_price, json_array
+from utils.conditional_get import conditional_get
+from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
+
+MENU_TABLES = ('categories', 'items', 'item_categories')
+
+# Off to compare the snapshot with the live query. Until migration 0007 has
+# created menu_category_snapshots the live query is used either way.
+MENU_SNAPSHOT_ENABLED = os.environ.get('MENU_SNAPSHOT', 'on').lower() not in ('off', 'false', '0')
+
+# The triggers from migrations 0007/0009 keep one rendered fragment per
+# active category; joining them here keeps writers from contending on a
+# single assembled row.
+GET_MENU_SNAPSHOT_STATEMENT = register_statement(
+    'get_menu_snapshot',
+    f"""
+    SELECT {json_array('body', 'name, category_id')}
+    FROM menu_category_snapshots;
+    """)
+
+# Every active category, by name, with its active items nested, rendered to
+# the response body in one query. render_menu_category in migration 0007
+# and GET_MENU_SNAPSHOT_STATEMENT produce the same bytes from the snapshot.
+MENU_SQL = f"""
+    SELECT {json_array('row_to_json(rendered)', 'categories.name, categories.id')}
+    FROM categories
+    CROSS JOIN LATERAL (
+        SELECT categories.id, categories.name, (
+            SELECT {json_array('row_to_json(menu_item)', 'items.name, items.id')}
+            FROM item_categories
+            INNER JOIN items ON items.id = item_categories.item_id
+            CROSS JOIN LATERAL (
+                SELECT items.id, items.name, {json_price('items.price')} AS price
+            ) AS menu_item
+            WHERE item_categories.category_id = categories.id
+            AND item_categories.deleted = FALSE
+            AND items.deleted = FALSE
+        )::json AS items
+    ) AS rendered
+    WHERE categories.deleted = FALSE;
+    """
+
+GET_MENU_STATEMENT = register_statement('get_menu', MENU_SQL)
+
+def get_menu_from_db():
+    try:
+        with get_db_connection(readonly=True) as conn:
+            with conn.cursor() as cursor:
+                if MENU_SNAPSHOT_ENABLED:
+                    # Reads run in autocommit, so a failed statement does not
+                    # abort the live query that follows it.
+                    try:
+                        execute_statement(cursor, GET_MENU_SNAPSHOT_STATEMENT)
+                        body = cursor.fetchone()[0]
+                    except psycopg2.errors.UndefinedTable:
+                        logger.warning('menu_category_snapshots does not exist yet, rendering the menu live')
+                    else:
+                        logger.info('Successfully retrieved menu snapshot')
+                        return body
+
+                execute_statement(cursor, GET_MENU_STATEMENT)
+                body = cursor.fetchone()[0]
+
+                logger.info('Successfully rendered menu in the database')
+                return body
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error while fetching menu: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error while fetching menu: {e}")
+        raise
+
+@lambda_exception_handler_wrapper
+@conditional_get(MENU_TABLES)
+def lambda_handler(event, context):
+    body = read_through_cache(('get_menu',), MENU_TABLES, get_menu_from_db)
+
+    return {
+        'statusCode': 200,
+        'body': body
+    }
@@ -1,30 +1,106 @@
-import json
-import psycopg2.extras
+import os
+import psycopg2
+from decimal import Decimal
 from utils.logger import logger
-from utils.db_connection import get_db_connection
-from utils.json_default import json_default
-from utils.custom_exceptions import DatabaseInsertError
+from utils.serializer import dumps
+from utils.db_connection import get_db_connection, dict_cursor
+from utils.validation import validate_order_event_body
+from utils.custom_exceptions import ValidationError, DatabaseInsertError, ActiveResourceNotFoundError
+from utils.table_versions import bump_table_version
 from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
 
-def post_order_to_db():
+MAX_ORDER_LINES = int(os.environ.get('MAX_ORDER_LINES', 100))
+
+# orders.total is NUMERIC(10, 2).
+MAX_ORDER_TOTAL = Decimal('99999999.99')
+
+def fetch_item_prices(cursor, item_ids):
+    # FOR SHARE keeps the prices fixed until the order lines are written.
+    # Prices come back as text so the order arithmetic stays in Decimal
+    # instead of the floats DEC2FLOAT decodes NUMERIC into.
+    cursor.execute(
+    """
+    SELECT id, price::text AS price FROM items
+    WHERE id = ANY(%s) AND deleted = FALSE
+    FOR SHARE
+    """,
+    (item_ids,))
+
+    return {row['id']: Decimal(row['price']) for row in cursor.fetchall()}
+
+def create_order_with_lines(cursor, lines, prices):
+    cursor.execute(
+    """
+    WITH line_values AS (
+        SELECT * FROM unnest(%s::int[], %s::int[], %s::numeric[]) AS l(item_id, quantity, unit_price)
+    ),
+    new_order AS (
+        INSERT INTO orders (total)
+        SELECT SUM(quantity * unit_price) FROM line_values
+        RETURNING id, status, total, created_at
+    ),
+    new_lines AS (
+        INSERT INTO order_items (order_id, item_id, quantity, unit_price)
+        SELECT new_order.id, line_values.item_id, line_values.quantity, line_values.unit_price
+        FROM new_order, line_values
+        RETURNING item_id, quantity, unit_price
+    )
+    SELECT new_order.id, new_order.status, new_order.total, new_order.created_at,
+        (SELECT json_agg(json_build_object(
+            'item_id', item_id,
+            'quantity', quantity,
+            'unit_price', unit_price
+        ) ORDER BY item_id) FROM new_lines) AS items
+    FROM new_order;
+    """,
+    (
+        [item_id for item_id, _ in lines],
+        [quantity for _, quantity in lines],
+        [prices[item_id] for item_id, _ in lines]
+    ))
+
+    return cursor.fetchone()
+
+def create_empty_order(cursor):
+    cursor.execute(
+        """
+        INSERT INTO orders
+        DEFAULT VALUES
+        RETURNING id, status, total, 
+        created_at;
+        """,
+        )
+
+    return cursor.fetchone()
+
+def post_order_to_db(lines=None):
     try:
         with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(
-                    """
-                    INSERT INTO orders
-                    DEFAULT VALUES
-                    RETURNING id, status, total, 
-                    created_at;
-                    """,
-                    )
-                
-                response = cursor.fetchone()
+            with dict_cursor(conn) as cursor:
+                if lines:
+                    prices = fetch_item_prices(cursor, [item_id for item_id, _ in lines])
+                    missing_ids = [item_id for item_id, _ in lines if item_id not in prices]
+                    if missing_ids:
+                        logger.error(f"No Active items found at IDs: {missing_ids}")
+                        raise ActiveResourceNotFoundError(
+                            f"No Active items found at ID: {', '.join(str(item_id) for item_id in missing_ids)}")
+
+                    total = sum(quantity * prices[item_id] for item_id, quantity in lines)
+                    if total > MAX_ORDER_TOTAL:
+                        logger.error(f"Order total {total} exceeds {MAX_ORDER_TOTAL}")
+                        raise ValidationError(f'Order total cannot exceed {MAX_ORDER_TOTAL}')
+
+                    response = create_order_with_lines(cursor, lines, prices)
+                else:
+                    response = create_empty_order(cursor)
+
                 if not response:
                     logger.error("Failed to create order - no result returned")
                     raise DatabaseInsertError("Failed to create order - no result returned")
-                
-                logger.info(f"Order creation successful")
+
+                bump_table_version(cursor, 'orders')
+
+                logger.info(f"Order creation successful with {len(lines or [])} lines")
                 return response
 
     except psycopg2.Error as e:
@@ -36,9 +112,10 @@ def post_order_to_db():
 
 @lambda_exception_handler_wrapper
 def lambda_handler(event, context):
-    create_order_response = post_order_to_db()
+    lines = validate_order_event_body(event, MAX_ORDER_LINES)
+    create_order_response = post_order_to_db(lines)
             
     return {
         'statusCode': 200,
-        'body': json.dumps(create_order_response, default=json_default)
+        'body': dumps(create_order_response)
     }
@@ -0,0 +1,13 @@
+import os
+from utils.router import Router, ROUTER_PRELOAD
+
+# Entry point for the single-function deployment (template.router.yml).
+# Module scope so the route table, handler imports and DB pool are shared
+# by every warm invocation.
+router = Router(os.path.dirname(os.path.abspath(__file__)))
+
+if ROUTER_PRELOAD:
+    router.preload()
+
+def lambda_handler(event, context):
+    return router(event, context)
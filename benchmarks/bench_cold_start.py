@@ -0,0 +1,101 @@
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_TEMPLATE = os.path.join(ROOT, 'template.yml')
+DEFAULT_BUDGET_FILE = os.path.join(os.path.dirname(__file__), 'import_budget.json')
+
+FUNCTION_PATTERN = re.compile(r'^  (\w+):\n    Type: AWS::Serverless::Function\n(.*?)(?=^  \w+:\n|^\S|\Z)', re.M | re.S)
+LAYER_PATTERN = re.compile(r'^      ContentUri: (\S+)', re.M)
+
+# Runs in a fresh interpreter so nothing is already in sys.modules.
+PROBE = (
+    'import {module}\n'
+    'import resource, sys\n'
+    'sys.stdout.write(str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))\n'
+)
+
+def find_handlers(template_path):
+    with open(template_path) as template_file:
+        template = template_file.read()
+
+    handlers = []
+    for name, body in FUNCTION_PATTERN.findall(template):
+        code_uri = re.search(r'^      CodeUri: (\S+)', body, re.M)
+        handler = re.search(r'^      Handler: (\S+)', body, re.M)
+        if code_uri and handler:
+            module = handler.group(1).rsplit('.', 1)[0]
+            handlers.append((name, os.path.normpath(os.path.join(ROOT, code_uri.group(1))), module))
+
+    layers = [os.path.join(ROOT, uri, 'python') for uri in LAYER_PATTERN.findall(template)]
+    return handlers, layers
+
+def parse_importtime(stderr, module):
+    total_us = 0
+    module_us = None
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in re.split(r'[:|]', line, maxsplit=3))
+        total_us += int(self_us)
+        if name == module:
+            module_us = int(cumulative_us)
+    return module_us, total_us
+
+def measure(code_dir, module, layers):
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(layers)}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE.format(module=module)],
+        cwd=code_dir, env=env, capture_output=True, text=True)
+
+    if result.returncode != 0:
+        raise RuntimeError(f'Importing {module} failed:\n{result.stderr[-2000:]}')
+
+    module_us, total_us = parse_importtime(result.stderr, module)
+    return module_us / 1000, total_us / 1000, int(result.stdout) / 1024
+
+def load_budgets(path):
+    if not path or not os.path.exists(path):
+        return None, {}
+    with open(path) as budget_file:
+        budgets = json.load(budget_file)
+    return budgets.get('default_ms'), budgets.get('functions', {})
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time and peak RSS of every Lambda handler in template.yml.')
+    parser.add_argument('--template', default=DEFAULT_TEMPLATE)
+    parser.add_argument('--budget-file', default=DEFAULT_BUDGET_FILE)
+    parser.add_argument('--runs', type=int, default=3, help='fresh interpreters per handler; the median is reported')
+    args = parser.parse_args()
+
+    handlers, layers = find_handlers(args.template)
+    default_budget, budgets = load_budgets(args.budget_file)
+
+    print(f'{"function":<34} {"handler ms":>10} {"all imports ms":>14} {"peak RSS MB":>11} {"budget ms":>9}')
+    over_budget = []
+    for name, code_dir, module in handlers:
+        samples = [measure(code_dir, module, layers) for _ in range(args.runs)]
+        module_ms = statistics.median(sample[0] for sample in samples)
+        total_ms = statistics.median(sample[1] for sample in samples)
+        rss_mb = statistics.median(sample[2] for sample in samples)
+
+        budget = budgets.get(name, default_budget)
+        flag = ''
+        if budget is not None and module_ms > budget:
+            over_budget.append(name)
+            flag = '  OVER'
+
+        print(f'{name:<34} {module_ms:>10.1f} {total_ms:>14.1f} {rss_mb:>11.1f} '
+              f'{budget if budget is not None else "-":>9}{flag}')
+
+    if over_budget:
+        print(f'\n{len(over_budget)} handler(s) over their import budget: {", ".join(over_budget)}')
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import argparse
+import datetime
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api', 'lambda_layers', 'utils', 'python'))
+
+from utils.serializer import dumps
+from utils.compression import ENCODERS, COMPRESSION_MIN_BYTES
+
+def make_body(count):
+    created_at = datetime.datetime(2025, 7, 2, 12, 0, 0)
+    return dumps([
+        {
+            'id': n,
+            'name': f'Item {n}',
+            'price': (n % 1000) / 100,
+            'description': f'Description for item {n}',
+            'created_at': created_at + datetime.timedelta(seconds=n)
+        }
+        for n in range(1, count + 1)
+    ]).encode('utf-8')
+
+def time_it(encoder, data, iterations):
+    encoder(data)
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        encoder(data)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description='Bytes saved and CPU cost of response compression per payload size.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 50, 500, 5000, 10000])
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'encoders: {", ".join(ENCODERS)}; threshold {COMPRESSION_MIN_BYTES} bytes')
+    for rows in args.sizes:
+        data = make_body(rows)
+        skipped = ' (below threshold, sent as is)' if len(data) < COMPRESSION_MIN_BYTES else ''
+        print(f'{rows:>6} rows, {len(data):>9} bytes{skipped}')
+
+        for name, encoder in ENCODERS.items():
+            compressed = len(encoder(data))
+            timings = time_it(encoder, data, args.iterations)
+            print(f'    {name:>4}: {compressed:>9} bytes  saved {1 - compressed / len(data):6.1%}  '
+                  f'mean {statistics.mean(timings):7.3f}ms  p50 {statistics.median(timings):7.3f}ms')
+
+if __name__ == '__main__':
+    main()
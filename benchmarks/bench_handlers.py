@@ -0,0 +1,187 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import datetime
+import statistics
+import tracemalloc
+from contextlib import ExitStack
+from unittest.mock import patch
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'api', 'lambda_layers', 'utils', 'python'))
+
+# Measure the handlers themselves: no read cache, no version lookups and a
+# page size big enough for the 10k-row cases.
+os.environ['CACHE_TTL_SECONDS'] = '0'
+os.environ.setdefault('MAX_PAGE_SIZE', '10000')
+os.environ.setdefault('CURSOR_SECRET', 'benchmark-secret')
+
+from test.helper_funcs.setup_mock_db import setup_mock_db
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baselines', 'handlers.json')
+ROW_COUNTS = (1, 100, 10000)
+CREATED_AT = datetime.datetime(2025, 7, 2, 12, 0, 0)
+
+def item_rows(count):
+    return [
+        {'id': n, 'name': f'Item {n}', 'price': (n % 1000) / 100 + 0.99,
+         'description': f'Description for item {n}', 'created_at': CREATED_AT + datetime.timedelta(seconds=n)}
+        for n in range(count, 0, -1)
+    ]
+
+def category_rows(count):
+    return [
+        {'id': n, 'name': f'Category {n}', 'created_at': CREATED_AT + datetime.timedelta(seconds=n)}
+        for n in range(count, 0, -1)
+    ]
+
+def body(payload):
+    return json.dumps(payload)
+
+ITEM_BODY = body({'name': 'Double Cheeseburger', 'price': 7.49, 'description': 'Two patties, two slices of cheese'})
+
+# (name, handler module, event, fetchone, fetchall)
+def build_cases():
+    cases = []
+    for count in ROW_COUNTS:
+        cases.append((f'get_all_items[{count}]', 'api.items.get_all_items.get_all_items',
+                      {'queryStringParameters': {'limit': str(count)}}, None, item_rows(count)))
+        cases.append((f'get_all_categories[{count}]', 'api.categories.get_all_categories.get_all_categories',
+                      {}, None, category_rows(count)))
+        cases.append((f'get_items_by_category[{count}]', 'api.item_categories.get_items_by_category.get_items_by_category',
+                      {'pathParameters': {'id': '1'}}, (1,),
+                      [{'id': row['id'], 'name': row['name'], 'price': row['price']} for row in item_rows(count)]))
+
+    cases += [
+        ('get_item_by_id', 'api.items.get_item_by_id.get_item_by_id',
+         {'pathParameters': {'id': '1'}}, item_rows(1)[0], None),
+        ('create_item', 'api.items.create_item.create_item',
+         {'body': ITEM_BODY}, item_rows(1)[0], None),
+        ('update_item', 'api.items.update_item.update_item',
+         {'pathParameters': {'id': '1'}, 'body': ITEM_BODY}, item_rows(1)[0], None),
+        ('remove_item', 'api.items.remove_item.remove_item',
+         {'pathParameters': {'id': '1'}}, (1,), None),
+        ('create_category', 'api.categories.create_category.create_category',
+         {'body': body({'name': 'Burgers'})}, category_rows(1)[0], None),
+        ('update_category', 'api.categories.update_category.update_category',
+         {'pathParameters': {'id': '1'}, 'body': body({'name': 'Burgers'})}, category_rows(1)[0], None),
+        ('remove_category', 'api.categories.remove_category.remove_category',
+         {'pathParameters': {'id': '1'}}, (1,), None),
+        ('add_item_to_category', 'api.item_categories.add_item_to_category.add_item_to_category',
+         {'pathParameters': {'id': '1'}, 'queryStringParameters': {'itemID': '2'}}, ('created',), None),
+        ('create_order[20 lines]', 'api.orders.create_order.create_order',
+         {'body': body({'items': [{'item_id': n, 'quantity': 2} for n in range(1, 21)]})},
+         {'id': 1, 'status': 'pending', 'total': 99.6, 'created_at': CREATED_AT,
+          'items': [{'item_id': n, 'quantity': 2, 'unit_price': 2.49} for n in range(1, 21)]},
+         [{'id': n, 'price': 2.49} for n in range(1, 21)]),
+        ('error:invalid_id', 'api.items.get_item_by_id.get_item_by_id',
+         {'pathParameters': {'id': 'abc'}}, None, None),
+        ('error:invalid_item_body', 'api.items.create_item.create_item',
+         {'body': body({'name': '', 'price': -1})}, None, None)
+    ]
+    return cases
+
+def run_case(module_name, event, fetchone, fetchall, iterations):
+    module = __import__(module_name, fromlist=['lambda_handler'])
+
+    with ExitStack() as stack:
+        # Handlers that batch their statements reach the database through
+        # utils.pipeline, which runs them on get_db_connection under the
+        # default driver; both see the same mocked connection.
+        mock_get_db_connection = stack.enter_context(patch('utils.pipeline.get_db_connection'))
+        stack.enter_context(patch('utils.pipeline.PIPELINE_ENABLED', False))
+        if hasattr(module, 'get_db_connection'):
+            stack.enter_context(patch(f'{module_name}.get_db_connection', mock_get_db_connection))
+        stack.enter_context(patch('utils.conditional_get.get_table_versions', return_value=None))
+        setup_mock_db(mock_get_db_connection, fetchone=fetchone, fetchall=fetchall)
+
+        status = module.lambda_handler(event, None)['statusCode']
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            module.lambda_handler(event, None)
+            timings.append(time.perf_counter() - start)
+
+        # A separate pass so tracing does not inflate the timings.
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        module.lambda_handler(event, None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        'status': status,
+        'ops_per_sec': round(1 / statistics.mean(timings), 1),
+        'mean_us': round(statistics.mean(timings) * 1e6, 1),
+        'p95_us': round(statistics.quantiles(timings, n=20)[18] * 1e6, 1) if len(timings) > 1 else None,
+        'peak_alloc_kb': round(peak / 1024, 1)
+    }
+
+def iterations_for(name, budget_seconds, probe):
+    return max(5, min(2000, int(budget_seconds / max(probe, 1e-6))))
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        change = result['ops_per_sec'] / previous['ops_per_sec'] - 1
+        if change < -threshold:
+            regressions.append((name, previous['ops_per_sec'], result['ops_per_sec'], change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-handler Python overhead with a mocked database.')
+    parser.add_argument('--filter', help='only run cases whose name contains this text')
+    parser.add_argument('--seconds', type=float, default=0.5, help='rough time budget per case')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='write these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2, help='ops/sec drop that counts as a regression')
+    args = parser.parse_args()
+
+    # Keep the handlers' log calls (their cost is real) but drop the output.
+    logging.getLogger().addHandler(logging.NullHandler())
+
+    results = {}
+    print(f'{"case":<34} {"ops/sec":>10} {"mean us":>10} {"p95 us":>10} {"peak KB":>9}')
+    for name, module_name, event, fetchone, fetchall in build_cases():
+        if args.filter and args.filter not in name:
+            continue
+
+        probe = run_case(module_name, event, fetchone, fetchall, 3)
+        result = run_case(module_name, event, fetchone, fetchall,
+                          iterations_for(name, args.seconds, probe['mean_us'] / 1e6))
+        results[name] = result
+        print(f'{name:<34} {result["ops_per_sec"]:>10.1f} {result["mean_us"]:>10.1f} '
+              f'{result["p95_us"] or 0:>10.1f} {result["peak_alloc_kb"]:>9.1f}')
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        print(f'\nSaved baseline to {args.baseline}')
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f'\nNo baseline at {args.baseline}; run with --save-baseline to create one')
+        return
+
+    with open(args.baseline) as baseline_file:
+        regressions = compare(results, json.load(baseline_file), args.threshold)
+
+    if regressions:
+        print(f'\n{len(regressions)} regression(s) over {args.threshold:.0%}:')
+        for name, before, after, change in regressions:
+            print(f'  {name}: {before:.1f} -> {after:.1f} ops/sec ({change:+.1%})')
+        sys.exit(1)
+
+    print(f'\nNo regressions over {args.threshold:.0%} against {args.baseline}')
+
+if __name__ == '__main__':
+    main()
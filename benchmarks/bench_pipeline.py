@@ -0,0 +1,173 @@
+import os
+import sys
+import time
+import queue
+import socket
+import argparse
+import threading
+import statistics
+import psycopg2
+import psycopg2.extensions
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'api', 'lambda_layers', 'utils', 'python'))
+
+from db.migrate import migrate
+
+PROTECTED_DATABASES = {'AnswerKingAPI'}
+
+# Postgres on localhost answers in microseconds, which hides what a round
+# trip costs from a Lambda to RDS. LatencyProxy sits between the handlers and
+# the server and holds every chunk for half the configured round trip in
+# each direction, and counts how often the client had to send.
+
+class LatencyProxy:
+
+    def __init__(self, upstream_host, upstream_port, latency_ms):
+        self.upstream = (upstream_host, upstream_port)
+        self.one_way = latency_ms / 2000
+        self.client_sends = 0
+        self._lock = threading.Lock()
+        self._listener = socket.create_server(('127.0.0.1', 0))
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            client, _ = self._listener.accept()
+            upstream = socket.create_connection(self.upstream)
+            for sock in (client, upstream):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._forward(client, upstream, count=True)
+            self._forward(upstream, client, count=False)
+
+    def _forward(self, source, target, count):
+        pending = queue.Queue()
+
+        def read():
+            while True:
+                try:
+                    data = source.recv(65536)
+                except OSError:
+                    data = b''
+                if count and data:
+                    with self._lock:
+                        self.client_sends += 1
+                pending.put((time.monotonic() + self.one_way, data))
+                if not data:
+                    return
+
+        def write():
+            while True:
+                due, data = pending.get()
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                if not data:
+                    try:
+                        target.shutdown(socket.SHUT_WR)
+                    except OSError:
+                        pass
+                    return
+                try:
+                    target.sendall(data)
+                except OSError:
+                    return
+
+        threading.Thread(target=read, daemon=True).start()
+        threading.Thread(target=write, daemon=True).start()
+
+def default_dsn():
+    return (
+        f"host={os.environ.get('DB_HOST', 'localhost')} port={os.environ.get('DB_PORT', '5432')} "
+        f"user={os.environ['DB_USER']} password={os.environ['DB_PASS']} dbname={os.environ['DB_NAME']}"
+    )
+
+def seed(dsn, items, iterations):
+    conn = psycopg2.connect(dsn)
+    try:
+        migrate(conn, log=lambda message: None)
+        with conn.cursor() as cursor:
+            cursor.execute('TRUNCATE items, categories, item_categories RESTART IDENTITY CASCADE;')
+            cursor.execute("""
+                INSERT INTO items (name, price)
+                SELECT 'Item ' || n, (n %% 1000) / 100.0 FROM generate_series(1, %s) AS n;
+                INSERT INTO categories (name)
+                SELECT 'Category ' || n FROM generate_series(1, %s) AS n;
+                INSERT INTO item_categories (item_id, category_id)
+                SELECT n, 1 FROM generate_series(1, %s, 2) AS n;
+                ANALYZE items, categories, item_categories;
+                """, (items, iterations * 2 + 1, items))
+        conn.commit()
+    finally:
+        conn.close()
+
+def point_handlers_at(proxy_port, params):
+    os.environ.update({
+        'DB_HOST': '127.0.0.1',
+        'DB_PORT': str(proxy_port),
+        'DB_USER': params['user'],
+        'DB_PASS': params.get('password', ''),
+        'DB_NAME': params['dbname'],
+        'CACHE_TTL_SECONDS': '0'
+    })
+
+def measure(proxy, iterations, call):
+    call(0)
+    timings = []
+    sends = []
+    for i in range(1, iterations + 1):
+        before = proxy.client_sends
+        start = time.perf_counter()
+        call(i)
+        timings.append((time.perf_counter() - start) * 1000)
+        sends.append(proxy.client_sends - before)
+    return timings, sends
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare sequential psycopg2 statements with a psycopg 3 pipeline for the multi-statement item_categories handlers.')
+    parser.add_argument('--dsn', help='libpq connection string; defaults to the DB_* environment variables')
+    parser.add_argument('--latency-ms', type=float, default=2.0, help='added round-trip latency between the handlers and Postgres')
+    parser.add_argument('--items', type=int, default=2000)
+    parser.add_argument('--bulk-size', type=int, default=50)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    dsn = args.dsn or default_dsn()
+    params = psycopg2.extensions.parse_dsn(dsn)
+    if params['dbname'] in PROTECTED_DATABASES:
+        sys.exit(f"Refusing to reseed {params['dbname']}; point --dsn at a scratch database")
+
+    seed(dsn, args.items, args.iterations)
+    proxy = LatencyProxy(params.get('host', 'localhost'), int(params.get('port', 5432)), args.latency_ms)
+    point_handlers_at(proxy.port, params)
+
+    from utils import pipeline
+    from api.item_categories.get_items_by_category.get_items_by_category import fetch_items_by_category_from_db
+    from api.item_categories.add_item_to_category.add_item_to_category import post_items_to_category_in_db
+
+    bulk_ids = list(range(1, args.bulk_size + 1))
+    # Each bulk call gets a fresh category (2..) so every run really inserts.
+    scenarios = {
+        'get_items_by_category': lambda i, offset: fetch_items_by_category_from_db(1),
+        'add_items_to_category': lambda i, offset: post_items_to_category_in_db(2 + offset + i, bulk_ids)
+    }
+
+    print(f'Added latency: {args.latency_ms}ms per round trip')
+    for name, scenario in scenarios.items():
+        results = {}
+        for offset, (label, enabled) in enumerate((('psycopg2', False), ('pipeline', True))):
+            pipeline.PIPELINE_ENABLED = enabled
+            results[label] = measure(proxy, args.iterations // 2, lambda i: scenario(i, offset * (args.iterations // 2 + 1)))
+
+        print(name)
+        for label, (timings, sends) in results.items():
+            print(f'  {label:>9}: mean {statistics.mean(timings):7.2f}ms  '
+                  f'p95 {statistics.quantiles(timings, n=20)[18]:7.2f}ms  '
+                  f'client sends {statistics.mean(sends):4.1f}')
+        saving = statistics.mean(results['psycopg2'][0]) - statistics.mean(results['pipeline'][0])
+        print(f'     saving: {saving:7.2f}ms per request')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import psycopg2
+import psycopg2.extras
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api', 'lambda_layers', 'utils', 'python'))
+
+from utils import statements
+from utils.statements import register_statement, execute_statement
+
+# Same shape as the hot per-request query in get_item_by_id, against a
+# session-local copy of items so the benchmark never touches real data.
+LOOKUP_SQL = """
+    SELECT id, name, price, description, created_at
+    FROM bench_items
+    WHERE id = %s AND deleted = FALSE;
+    """
+
+def connect(dsn):
+    if dsn:
+        return psycopg2.connect(dsn)
+    return psycopg2.connect(
+        user=os.environ['DB_USER'],
+        password=os.environ['DB_PASS'],
+        host=os.environ.get('DB_HOST', 'localhost'),
+        port=os.environ.get('DB_PORT', '5432'),
+        dbname=os.environ['DB_NAME']
+    )
+
+def seed(conn, rows):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            CREATE TEMP TABLE bench_items (
+                id SERIAL PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                price NUMERIC(10, 2) NOT NULL,
+                description TEXT,
+                created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                deleted BOOLEAN NOT NULL DEFAULT FALSE
+            );
+            """)
+        cursor.execute("""
+            INSERT INTO bench_items (name, price, description, deleted)
+            SELECT 'Item ' || n, (n % 1000) / 100.0, 'Description ' || n, n % 2 = 0
+            FROM generate_series(1, %s) AS n;
+            """, (rows,))
+        cursor.execute('ANALYZE bench_items;')
+    conn.commit()
+
+def run(conn, iterations, rows, prepared):
+    statements.PREPARED_STATEMENTS_ENABLED = prepared
+    timings = []
+
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+        for i in range(iterations):
+            start = time.perf_counter()
+            execute_statement(cursor, 'bench_get_item', ((i * 7919) % rows + 1,))
+            cursor.fetchone()
+            timings.append((time.perf_counter() - start) * 1e6)
+    conn.rollback()
+
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare plain SQL with prepared statements for the item lookup query.')
+    parser.add_argument('--dsn', help='libpq connection string; defaults to the DB_* environment variables')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+
+    register_statement('bench_get_item', LOOKUP_SQL)
+    conn = connect(args.dsn)
+    seed(conn, args.rows)
+
+    results = {}
+    for label, prepared in (('plain', False), ('prepared', True)):
+        run(conn, min(500, args.iterations), args.rows, prepared)
+        results[label] = run(conn, args.iterations, args.rows, prepared)
+
+    for label, timings in results.items():
+        print(f'{label:>9}: mean {statistics.mean(timings):8.1f}us  '
+              f'p50 {statistics.median(timings):8.1f}us  '
+              f'p95 {statistics.quantiles(timings, n=20)[18]:8.1f}us')
+
+    saving = statistics.mean(results['plain']) - statistics.mean(results['prepared'])
+    print(f'   saving: {saving:8.1f}us per request ({saving / statistics.mean(results["plain"]):.1%})')
+
+if __name__ == '__main__':
+    main()
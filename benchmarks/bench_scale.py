@@ -0,0 +1,268 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+import subprocess
+import psycopg2
+import psycopg2.extensions
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+API_DIR = os.path.join(ROOT, 'api')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(API_DIR, 'lambda_layers', 'utils', 'python'))
+
+from db.migrate import migrate
+
+DOCKER_CONTAINER = 'answer-king-bench-pg'
+PROTECTED_DATABASES = {'AnswerKingAPI'}
+
+def start_docker_postgres(port, password):
+    subprocess.run(['docker', 'rm', '-f', DOCKER_CONTAINER], capture_output=True)
+    subprocess.run([
+        'docker', 'run', '-d', '--rm', '--name', DOCKER_CONTAINER,
+        '-e', f'POSTGRES_PASSWORD={password}', '-e', 'POSTGRES_DB=answer_king_bench',
+        '-p', f'{port}:5432', 'postgres:16',
+        '-c', 'shared_buffers=512MB', '-c', 'max_wal_size=4GB'
+    ], check=True, capture_output=True)
+
+    dsn = f'host=localhost port={port} user=postgres password={password} dbname=answer_king_bench'
+    deadline = time.monotonic() + 60
+    while True:
+        try:
+            psycopg2.connect(dsn).close()
+            return dsn
+        except psycopg2.OperationalError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(1)
+
+def default_dsn():
+    return (
+        f"host={os.environ.get('DB_HOST', 'localhost')} port={os.environ.get('DB_PORT', '5432')} "
+        f"user={os.environ['DB_USER']} password={os.environ['DB_PASS']} dbname={os.environ['DB_NAME']}"
+    )
+
+def point_handlers_at(dsn):
+    params = psycopg2.extensions.parse_dsn(dsn)
+    os.environ.update({
+        'DB_HOST': params.get('host', 'localhost'),
+        'DB_PORT': str(params.get('port', 5432)),
+        'DB_USER': params['user'],
+        'DB_PASS': params.get('password', ''),
+        'DB_NAME': params['dbname'],
+        # Every request should reach Postgres, not the warm read cache.
+        'CACHE_TTL_SECONDS': '0'
+    })
+    os.environ.setdefault('CURSOR_SECRET', 'benchmark-secret')
+
+def seed(conn, items, categories, associations, deleted_ratio):
+    steps = (
+        ('truncate', 'TRUNCATE order_items, orders, item_categories, items, categories RESTART IDENTITY CASCADE;', ()),
+        # Row-by-row menu snapshot upkeep would dominate a bulk load; rebuild
+        # it once at the end instead.
+        ('disable triggers', 'ALTER TABLE items DISABLE TRIGGER USER; ALTER TABLE categories DISABLE TRIGGER USER; '
+                             'ALTER TABLE item_categories DISABLE TRIGGER USER;', ()),
+        ('items', """
+            INSERT INTO items (name, price, description, created_at, deleted)
+            SELECT 'Item ' || n, round((random() * 20 + 0.5)::numeric, 2), 'Synthetic item ' || n,
+                NOW() - random() * INTERVAL '365 days', random() < %s
+            FROM generate_series(1, %s) AS n;
+            """, (deleted_ratio, items)),
+        ('categories', """
+            INSERT INTO categories (name, created_at, deleted)
+            SELECT 'Category ' || n, NOW() - random() * INTERVAL '365 days', random() < %s
+            FROM generate_series(1, %s) AS n;
+            """, (deleted_ratio, categories)),
+        ('item_categories', """
+            INSERT INTO item_categories (item_id, category_id, deleted)
+            SELECT 1 + floor(random() * %s)::int, 1 + floor(random() * %s)::int, random() < %s
+            FROM generate_series(1, %s)
+            ON CONFLICT (item_id, category_id) DO NOTHING;
+            """, (items, categories, deleted_ratio, associations)),
+        ('enable triggers', 'ALTER TABLE items ENABLE TRIGGER USER; ALTER TABLE categories ENABLE TRIGGER USER; '
+                            'ALTER TABLE item_categories ENABLE TRIGGER USER;', ()),
+        ('menu snapshot', 'SELECT refresh_menu_snapshot();', ()),
+        ('analyze', 'ANALYZE items, categories, item_categories;', ())
+    )
+
+    with conn.cursor() as cursor:
+        for name, sql, params in steps:
+            start = time.perf_counter()
+            cursor.execute(sql, params)
+            conn.commit()
+            print(f'  seeded {name:<16} in {time.perf_counter() - start:7.1f}s')
+
+def sample_active_ids(conn, table, count):
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f'SELECT id FROM {table} TABLESAMPLE SYSTEM (5) WHERE deleted = FALSE LIMIT %s;', (count,))
+        ids = [row[0] for row in cursor.fetchall()]
+    conn.rollback()
+    if not ids:
+        raise RuntimeError(f'No active rows in {table}; seed the database first')
+    return ids
+
+class Scenario:
+
+    def __init__(self, name, build_event):
+        self.name = name
+        self.build_event = build_event
+        self.latencies = []
+        self.rows = 0
+        self.statuses = {}
+
+def count_rows(response):
+    try:
+        body = json.loads(response.get('body') or 'null')
+    except ValueError:
+        return 0
+    if isinstance(body, list):
+        return len(body)
+    for key in ('created', 'items'):
+        if isinstance(body, dict) and isinstance(body.get(key), list):
+            return len(body[key])
+    return 1 if body else 0
+
+def build_scenarios(rng, router, item_ids, category_ids):
+    def pick(ids):
+        return str(rng.choice(ids))
+
+    # Walk a few pages once so the deep-page scenario starts from a real cursor.
+    deep_cursor = None
+    for _ in range(20):
+        query = {'limit': '50', **({'cursor': deep_cursor} if deep_cursor else {})}
+        response = router({'httpMethod': 'GET', 'resource': '/item', 'path': '/item', 'queryStringParameters': query}, None)
+        deep_cursor = (response.get('headers') or {}).get('X-Next-Cursor')
+        if not deep_cursor:
+            break
+
+    new_item = lambda: json.dumps({'name': f'Bench item {rng.random()}', 'price': 4.99, 'description': 'Benchmark'})
+
+    return [
+        Scenario('GET /item', lambda: ('GET', '/item', None, {'limit': '50'}, None)),
+        Scenario('GET /item (page 20)', lambda: ('GET', '/item', None, {'limit': '50', 'cursor': deep_cursor}, None)),
+        Scenario('GET /item/{id}', lambda: ('GET', '/item/{id}', {'id': pick(item_ids)}, None, None)),
+        Scenario('GET /item?ids=', lambda: ('GET', '/item', None, {'ids': ','.join(map(str, rng.sample(item_ids, 20)))}, None)),
+        Scenario('POST /items/lookup', lambda: ('POST', '/items/lookup', None, None, json.dumps({'ids': rng.sample(item_ids, 200)}))),
+        Scenario('GET /item/search', lambda: ('GET', '/item/search', None, {'q': 'item 42'}, None)),
+        Scenario('GET /item/search (typo)', lambda: ('GET', '/item/search', None, {'q': 'Iten 4217'}, None)),
+        Scenario('GET /category', lambda: ('GET', '/category', None, None, None)),
+        Scenario('GET /menu', lambda: ('GET', '/menu', None, None, None)),
+        Scenario('GET /category/{id}/items', lambda: ('GET', '/category/{id}/items', {'id': pick(category_ids)}, None, None)),
+        Scenario('POST /item', lambda: ('POST', '/item', None, None, new_item())),
+        Scenario('PUT /item/{id}', lambda: ('PUT', '/item/{id}', {'id': pick(item_ids)}, None, new_item())),
+        Scenario('POST /items/batch', lambda: ('POST', '/items/batch', None, None,
+                                               json.dumps([json.loads(new_item()) for _ in range(100)]))),
+        Scenario('POST /category', lambda: ('POST', '/category', None, None, json.dumps({'name': f'Bench {rng.random()}'}))),
+        Scenario('PUT /category/{id}', lambda: ('PUT', '/category/{id}', {'id': pick(category_ids)}, None,
+                                                json.dumps({'name': f'Bench {rng.random()}'}))),
+        Scenario('POST /category/{id}/items', lambda: ('POST', '/category/{id}/items', {'id': pick(category_ids)},
+                                                      {'itemID': pick(item_ids)}, None)),
+        Scenario('POST /category/{id}/items (bulk)', lambda: ('POST', '/category/{id}/items', {'id': pick(category_ids)}, None,
+                                                             json.dumps({'item_ids': rng.sample(item_ids, 50)}))),
+        Scenario('POST /orders', lambda: ('POST', '/orders', None, None, json.dumps(
+            {'items': [{'item_id': item_id, 'quantity': rng.randint(1, 3)} for item_id in rng.sample(item_ids, 5)]}))),
+        Scenario('DELETE /item/{id}', lambda: ('DELETE', '/item/{id}', {'id': str(item_ids.pop())}, None, None)),
+        Scenario('DELETE /category/{id}', lambda: ('DELETE', '/category/{id}', {'id': str(category_ids.pop())}, None, None))
+    ]
+
+def run_scenario(router, scenario, requests):
+    for _ in range(requests):
+        method, resource, path_parameters, query, body = scenario.build_event()
+        event = {
+            'httpMethod': method,
+            'resource': resource,
+            'path': resource,
+            'pathParameters': path_parameters,
+            'queryStringParameters': query,
+            'body': body
+        }
+
+        start = time.perf_counter()
+        response = router(event, None)
+        scenario.latencies.append((time.perf_counter() - start) * 1000)
+
+        status = response.get('statusCode')
+        scenario.statuses[status] = scenario.statuses.get(status, 0) + 1
+        scenario.rows += count_rows(response)
+
+def report(scenarios):
+    print(f'\n{"endpoint":<36} {"n":>5} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"rows/sec":>10}  statuses')
+    results = {}
+    for scenario in scenarios:
+        if len(scenario.latencies) < 2:
+            continue
+        cuts = statistics.quantiles(scenario.latencies, n=100)
+        total_seconds = sum(scenario.latencies) / 1000
+        result = results[scenario.name] = {
+            'requests': len(scenario.latencies),
+            'p50_ms': round(cuts[49], 2),
+            'p95_ms': round(cuts[94], 2),
+            'p99_ms': round(cuts[98], 2),
+            'rows_per_sec': round(scenario.rows / total_seconds, 1),
+            'statuses': {str(status): count for status, count in sorted(scenario.statuses.items())}
+        }
+        statuses = ' '.join(f'{status}x{count}' for status, count in result['statuses'].items())
+        print(f'{scenario.name:<36} {result["requests"]:>5} {result["p50_ms"]:>8.2f} {result["p95_ms"]:>8.2f} '
+              f'{result["p99_ms"]:>8.2f} {result["rows_per_sec"]:>10.1f}  {statuses}')
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Drive every handler against a seeded Postgres and report latency at volume.')
+    parser.add_argument('--dsn', help='libpq connection string; defaults to the DB_* environment variables')
+    parser.add_argument('--docker', action='store_true', help='start a throwaway postgres:16 container instead of attaching')
+    parser.add_argument('--docker-port', type=int, default=55432)
+    parser.add_argument('--seed', action='store_true', help='truncate and reseed the tables before running')
+    parser.add_argument('--items', type=int, default=1_000_000)
+    parser.add_argument('--categories', type=int, default=10_000)
+    parser.add_argument('--associations', type=int, default=5_000_000)
+    parser.add_argument('--deleted-ratio', type=float, default=0.5)
+    parser.add_argument('--requests', type=int, default=200, help='requests per endpoint')
+    parser.add_argument('--filter', help='only run endpoints whose name contains this text')
+    parser.add_argument('--output', help='also write the results to this JSON file')
+    parser.add_argument('--random-seed', type=int, default=42)
+    args = parser.parse_args()
+
+    dsn = start_docker_postgres(args.docker_port, 'bench') if args.docker else (args.dsn or default_dsn())
+    database = psycopg2.extensions.parse_dsn(dsn)['dbname']
+
+    # Every run migrates, and the write scenarios create, rename and
+    # soft-delete rows, so never point this at a real database.
+    if database in PROTECTED_DATABASES:
+        sys.exit(f'Refusing to migrate and write to {database}; point --dsn at a benchmark database or use --docker')
+
+    conn = psycopg2.connect(dsn)
+    migrate(conn)
+
+    if args.seed:
+        print(f'Seeding {args.items} items, {args.categories} categories, {args.associations} associations '
+              f'({args.deleted_ratio:.0%} soft-deleted)')
+        seed(conn, args.items, args.categories, args.associations, args.deleted_ratio)
+
+    rng = random.Random(args.random_seed)
+    item_ids = sample_active_ids(conn, 'items', 5000)
+    category_ids = sample_active_ids(conn, 'categories', 1000)
+    conn.close()
+
+    # Handlers read their DB settings at first use, so this has to happen
+    # before the router imports them.
+    point_handlers_at(dsn)
+    from utils.router import Router
+    router = Router(API_DIR)
+
+    scenarios = build_scenarios(rng, router, item_ids, category_ids)
+    for scenario in scenarios:
+        if args.filter and args.filter not in scenario.name:
+            continue
+        run_scenario(router, scenario, min(args.requests, 10) if scenario.name.startswith('DELETE') else args.requests)
+
+    results = report(scenarios)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import argparse
+import datetime
+import statistics
+import json
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api', 'lambda_layers', 'utils', 'python'))
+
+from utils.json_default import json_default
+from utils.serializer import dumps, JSON_BACKEND
+
+# Rows shaped like the get_all_items response. The old path sees price as
+# Decimal (psycopg2's default for NUMERIC); the new path sees it as float
+# because db_connection registers the DEC2FLOAT typecaster.
+def make_rows(count, price_type):
+    created_at = datetime.datetime(2025, 7, 2, 12, 0, 0)
+    return [
+        {
+            'id': n,
+            'name': f'Item {n}',
+            'price': price_type(f'{(n % 1000) / 100:.2f}'),
+            'description': f'Description for item {n}',
+            'created_at': created_at + datetime.timedelta(seconds=n)
+        }
+        for n in range(1, count + 1)
+    ]
+
+def time_it(func, rows, iterations):
+    func(rows)
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func(rows)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare json.dumps + json_default with the response serializer.')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--iterations', type=int, default=50)
+    args = parser.parse_args()
+
+    decimal_rows = make_rows(args.rows, Decimal)
+    float_rows = make_rows(args.rows, float)
+
+    cases = (
+        ('json_default', lambda rows: json.dumps(rows, default=json_default), decimal_rows),
+        (f'serializer[{JSON_BACKEND}] decimal', dumps, decimal_rows),
+        (f'serializer[{JSON_BACKEND}] float', dumps, float_rows)
+    )
+
+    results = {}
+    for label, func, rows in cases:
+        results[label] = time_it(func, rows, args.iterations)
+        print(f'{label:>28}: mean {statistics.mean(results[label]):8.2f}ms  '
+              f'p50 {statistics.median(results[label]):8.2f}ms  '
+              f'bytes {len(func(rows).encode("utf-8"))}')
+
+    baseline = statistics.mean(results['json_default'])
+    for label in list(results)[1:]:
+        print(f'{label:>28}: {baseline / statistics.mean(results[label]):.1f}x faster than json_default')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+import os
+import re
+import sys
+import time
+import hashlib
+import argparse
+import psycopg2
+
+# Applies db/migrations/NNNN_name.sql in version order and records each one
+# in schema_migrations with a checksum, so an edited migration that has
+# already run is caught instead of silently drifting from the database.
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+FILENAME_PATTERN = re.compile(r'^(\d{4})_(\w+)\.sql$')
+
+# CREATE INDEX CONCURRENTLY cannot run inside a transaction. Migrations that
+# start with this line run statement by statement in autocommit instead.
+NO_TRANSACTION_MARKER = '-- migrate: no-transaction'
+
+CONCURRENT_INDEX_PATTERN = re.compile(
+    r'^CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', re.I)
+
+# Arbitrary key for pg_advisory_lock so two deploys never migrate at once.
+MIGRATION_LOCK_ID = 720_001
+
+STATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        applied_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        duration_ms INTEGER NOT NULL
+    );
+    """
+
+class MigrationError(Exception):
+    pass
+
+class Migration:
+    __slots__ = ('version', 'name', 'path', 'sql', 'checksum', 'transactional')
+
+    def __init__(self, version, name, path, sql):
+        self.version = version
+        self.name = name
+        self.path = path
+        self.sql = sql
+        self.checksum = hashlib.sha256(sql.encode('utf-8')).hexdigest()
+        self.transactional = not sql.lstrip().startswith(NO_TRANSACTION_MARKER)
+
+def discover_migrations(migrations_dir=MIGRATIONS_DIR):
+    migrations = {}
+    for filename in sorted(os.listdir(migrations_dir)):
+        match = FILENAME_PATTERN.match(filename)
+        if not match:
+            continue
+
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(f'Duplicate migration version {version}: {migrations[version].path} and {filename}')
+
+        path = os.path.join(migrations_dir, filename)
+        with open(path, newline=None) as migration_file:
+            migrations[version] = Migration(version, match.group(2), path, migration_file.read())
+
+    return [migrations[version] for version in sorted(migrations)]
+
+def split_statements(sql):
+    # Only used for no-transaction migrations, which hold plain DDL: no
+    # function bodies or string literals containing ';'.
+    lines = [line for line in sql.splitlines() if not line.lstrip().startswith('--')]
+    return [statement.strip() for statement in '\n'.join(lines).split(';') if statement.strip()]
+
+def applied_migrations(cursor):
+    cursor.execute('SELECT version, name, checksum FROM schema_migrations ORDER BY version;')
+    return {version: (name, checksum) for version, name, checksum in cursor.fetchall()}
+
+def verify_applied(migrations, applied):
+    by_version = {migration.version: migration for migration in migrations}
+    for version, (name, checksum) in applied.items():
+        migration = by_version.get(version)
+        if migration is None:
+            raise MigrationError(f'Migration {version:04d}_{name} is recorded as applied but its file is missing')
+        if migration.checksum != checksum.strip():
+            raise MigrationError(f'Migration {version:04d}_{name} has changed since it was applied; add a new migration instead')
+
+def pending_migrations(migrations, applied, target=None):
+    return [
+        migration for migration in migrations
+        if migration.version not in applied and (target is None or migration.version <= target)
+    ]
+
+def apply_migration(conn, migration):
+    start = time.perf_counter()
+
+    if migration.transactional:
+        with conn.cursor() as cursor:
+            cursor.execute(migration.sql)
+            record_migration(cursor, migration, start)
+        conn.commit()
+        return
+
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            for statement in split_statements(migration.sql):
+                drop_invalid_index(cursor, statement)
+                cursor.execute(statement)
+            record_migration(cursor, migration, start)
+    finally:
+        conn.autocommit = False
+
+def drop_invalid_index(cursor, statement):
+    # A failed CONCURRENTLY build leaves an INVALID index behind, which IF
+    # NOT EXISTS would then skip; drop it so the statement builds it again.
+    match = CONCURRENT_INDEX_PATTERN.match(statement)
+    if not match:
+        return
+
+    index_name = match.group(1)
+    cursor.execute('SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s);', (index_name,))
+    row = cursor.fetchone()
+    if row is not None and not row[0]:
+        cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name};')
+
+def record_migration(cursor, migration, start):
+    cursor.execute(
+        'INSERT INTO schema_migrations (version, name, checksum, duration_ms) VALUES (%s, %s, %s, %s);',
+        (migration.version, migration.name, migration.checksum, int((time.perf_counter() - start) * 1000)))
+
+def migrate(conn, migrations_dir=MIGRATIONS_DIR, target=None, dry_run=False, log=print):
+    migrations = discover_migrations(migrations_dir)
+
+    with conn.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_lock(%s);', (MIGRATION_LOCK_ID,))
+        cursor.execute(STATE_TABLE_SQL)
+    conn.commit()
+
+    try:
+        with conn.cursor() as cursor:
+            applied = applied_migrations(cursor)
+        conn.commit()
+
+        verify_applied(migrations, applied)
+        pending = pending_migrations(migrations, applied, target)
+
+        if not pending:
+            log('Database is up to date')
+            return []
+
+        for migration in pending:
+            if dry_run:
+                log(f'Would apply {migration.version:04d}_{migration.name}')
+                continue
+            log(f'Applying {migration.version:04d}_{migration.name}')
+            apply_migration(conn, migration)
+
+        return pending
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_unlock(%s);', (MIGRATION_LOCK_ID,))
+        conn.commit()
+
+def status(conn, migrations_dir=MIGRATIONS_DIR, log=print):
+    migrations = discover_migrations(migrations_dir)
+
+    with conn.cursor() as cursor:
+        cursor.execute(STATE_TABLE_SQL)
+        applied = applied_migrations(cursor)
+    conn.commit()
+
+    for migration in migrations:
+        recorded = applied.get(migration.version)
+        if recorded is None:
+            state = 'pending'
+        elif recorded[1].strip() != migration.checksum:
+            state = 'CHANGED'
+        else:
+            state = 'applied'
+        log(f'{migration.version:04d}_{migration.name:<40} {state}')
+
+def default_dsn():
+    return (
+        f"host={os.environ.get('DB_HOST', 'localhost')} port={os.environ.get('DB_PORT', '5432')} "
+        f"user={os.environ['DB_USER']} password={os.environ['DB_PASS']} dbname={os.environ['DB_NAME']}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply the versioned SQL migrations in db/migrations.')
+    parser.add_argument('command', nargs='?', choices=('up', 'status'), default='up')
+    parser.add_argument('--dsn', help='libpq connection string; defaults to the DB_* environment variables')
+    parser.add_argument('--target', type=int, help='stop after this migration version')
+    parser.add_argument('--dry-run', action='store_true', help='list pending migrations without applying them')
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn or default_dsn())
+    try:
+        if args.command == 'status':
+            status(conn)
+        else:
+            migrate(conn, target=args.target, dry_run=args.dry_run)
+    except MigrationError as e:
+        sys.exit(str(e))
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    main()
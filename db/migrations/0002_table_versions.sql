@@ -0,0 +1,12 @@
+-- One counter per table, bumped by the write handlers in the same
+-- transaction as the write. Readers compare it to decide whether a cached
+-- result is still current.
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(63) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO table_versions (table_name)
+VALUES ('items'), ('categories'), ('item_categories'), ('orders')
+ON CONFLICT (table_name) DO NOTHING;
@@ -0,0 +1,16 @@
+-- Name and description search for GET /item/search. Adding a stored
+-- generated column rewrites items once; run it outside peak hours.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE items ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED;
+
+-- Both indexes skip soft-deleted rows, which search never returns.
+CREATE INDEX IF NOT EXISTS items_search_vector_idx ON items USING GIN (search_vector) WHERE deleted = FALSE;
+
+-- Backs the typo and partial-word fallback (word similarity on name).
+CREATE INDEX IF NOT EXISTS items_name_trgm_idx ON items USING GIN (name gin_trgm_ops) WHERE deleted = FALSE;
@@ -0,0 +1,11 @@
+-- Indexes behind the GET /item filters and sorts. Each sort has a
+-- (column, id) index matching its keyset cursor; the listing never returns
+-- soft-deleted rows, so all of them are partial.
+
+CREATE INDEX IF NOT EXISTS items_active_created_at_idx ON items (created_at DESC, id DESC) WHERE deleted = FALSE;
+CREATE INDEX IF NOT EXISTS items_active_price_idx ON items (price, id) WHERE deleted = FALSE;
+CREATE INDEX IF NOT EXISTS items_active_name_idx ON items (name, id) WHERE deleted = FALSE;
+
+-- category_id filter: the existing UNIQUE (item_id, category_id) index leads
+-- with item_id, which cannot serve a lookup by category.
+CREATE INDEX IF NOT EXISTS item_categories_active_category_idx ON item_categories (category_id, item_id) WHERE deleted = FALSE;
@@ -0,0 +1,18 @@
+-- migrate: no-transaction
+-- Partial indexes for the soft-delete filters, built CONCURRENTLY so the
+-- tables stay writable. items (created_at DESC, id DESC) WHERE deleted =
+-- FALSE already exists from 0005.
+
+-- GET /category: an index-only scan in created_at order.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS categories_active_created_at_idx
+    ON categories (created_at DESC) INCLUDE (id, name) WHERE deleted = FALSE;
+
+-- get_active_row_from_table and GET /item/{id}: "id = $1 AND deleted =
+-- false" answered from the index alone for active rows.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS items_active_id_idx ON items (id) WHERE deleted = FALSE;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS categories_active_id_idx ON categories (id) WHERE deleted = FALSE;
+
+-- GET /category/{id}/items joins every association of the category, deleted
+-- or not, so it needs a full (category_id, item_id) index; the partial one
+-- from 0005 only serves the GET /item category_id filter.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS item_categories_category_item_idx ON item_categories (category_id, item_id);
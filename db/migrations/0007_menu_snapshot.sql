@@ -0,0 +1,156 @@
+-- Precomputed body for GET /menu. Each active category's JSON (with its
+-- active items) is kept in menu_category_snapshots; menu_snapshot holds the
+-- assembled array, so the endpoint reads one row. Triggers re-render only
+-- the categories a write touched, in the writing transaction.
+--
+-- The rendering matches get_menu.MENU_SQL (and so serializer.dumps) byte
+-- for byte; change both together.
+
+CREATE TABLE IF NOT EXISTS menu_snapshot (
+    id SMALLINT PRIMARY KEY CHECK (id = 1),
+    body TEXT NOT NULL,
+    refreshed_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS menu_category_snapshots (
+    category_id INTEGER PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    body TEXT NOT NULL
+);
+
+-- Categories touched by the current statement; filled by the row triggers
+-- and emptied by the statement trigger before the transaction commits.
+CREATE TABLE IF NOT EXISTS menu_snapshot_dirty (
+    category_id INTEGER PRIMARY KEY
+);
+
+CREATE OR REPLACE FUNCTION render_menu_category(p_category_id INTEGER) RETURNS TEXT AS $$
+    SELECT row_to_json(rendered)::text
+    FROM categories
+    CROSS JOIN LATERAL (
+        SELECT categories.id, categories.name, (
+            SELECT '[' || COALESCE(string_agg(row_to_json(menu_item)::text, ',' ORDER BY items.name, items.id), '') || ']'
+            FROM item_categories
+            INNER JOIN items ON items.id = item_categories.item_id
+            CROSS JOIN LATERAL (
+                SELECT items.id, items.name,
+                    (CASE WHEN items.price = trunc(items.price) THEN trunc(items.price)::text || '.0'
+                    ELSE rtrim(items.price::text, '0') END)::json AS price
+            ) AS menu_item
+            WHERE item_categories.category_id = categories.id
+            AND item_categories.deleted = FALSE
+            AND items.deleted = FALSE
+        )::json AS items
+    ) AS rendered
+    WHERE categories.id = p_category_id AND categories.deleted = FALSE;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION assemble_menu_snapshot() RETURNS VOID AS $$
+    INSERT INTO menu_snapshot (id, body, refreshed_at)
+    SELECT 1, '[' || COALESCE(string_agg(body, ',' ORDER BY name, category_id), '') || ']', NOW()
+    FROM menu_category_snapshots
+    ON CONFLICT (id) DO UPDATE SET body = EXCLUDED.body, refreshed_at = EXCLUDED.refreshed_at;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION refresh_menu_snapshot() RETURNS VOID AS $$
+BEGIN
+    DELETE FROM menu_category_snapshots;
+    INSERT INTO menu_category_snapshots (category_id, name, body)
+    SELECT id, name, render_menu_category(id) FROM categories WHERE deleted = FALSE;
+    PERFORM assemble_menu_snapshot();
+END;
+$$ LANGUAGE plpgsql;
+
+-- NEW is unset for DELETE and OLD for INSERT, so each branch only reads the
+-- record that exists for TG_OP.
+CREATE OR REPLACE FUNCTION menu_mark_dirty() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'items' THEN
+        INSERT INTO menu_snapshot_dirty (category_id)
+        SELECT category_id FROM item_categories WHERE item_id = OLD.id
+        ON CONFLICT DO NOTHING;
+    ELSIF TG_TABLE_NAME = 'categories' THEN
+        IF TG_OP = 'DELETE' THEN
+            INSERT INTO menu_snapshot_dirty (category_id) VALUES (OLD.id) ON CONFLICT DO NOTHING;
+        ELSE
+            INSERT INTO menu_snapshot_dirty (category_id) VALUES (NEW.id) ON CONFLICT DO NOTHING;
+        END IF;
+    ELSE
+        IF TG_OP <> 'INSERT' THEN
+            INSERT INTO menu_snapshot_dirty (category_id) VALUES (OLD.category_id) ON CONFLICT DO NOTHING;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO menu_snapshot_dirty (category_id) VALUES (NEW.category_id) ON CONFLICT DO NOTHING;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION menu_refresh_dirty() RETURNS TRIGGER AS $$
+DECLARE
+    dirty_ids INTEGER[];
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM menu_snapshot_dirty;
+        PERFORM refresh_menu_snapshot();
+        RETURN NULL;
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM menu_snapshot_dirty) THEN
+        RETURN NULL;
+    END IF;
+
+    -- Writers queue here, so each one assembles the menu after the previous
+    -- writer's fragments have committed.
+    PERFORM 1 FROM menu_snapshot WHERE id = 1 FOR UPDATE;
+
+    WITH dirty AS (DELETE FROM menu_snapshot_dirty RETURNING category_id)
+    SELECT array_agg(category_id) INTO dirty_ids FROM dirty;
+
+    DELETE FROM menu_category_snapshots
+    WHERE category_id = ANY (dirty_ids)
+    AND NOT EXISTS (SELECT 1 FROM categories WHERE categories.id = menu_category_snapshots.category_id AND categories.deleted = FALSE);
+
+    INSERT INTO menu_category_snapshots (category_id, name, body)
+    SELECT id, name, render_menu_category(id) FROM categories WHERE id = ANY (dirty_ids) AND deleted = FALSE
+    ON CONFLICT (category_id) DO UPDATE SET name = EXCLUDED.name, body = EXCLUDED.body;
+
+    PERFORM assemble_menu_snapshot();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- A new item has no associations yet, so only updates that change what the
+-- menu shows (and hard deletes) mark its categories.
+DROP TRIGGER IF EXISTS items_menu_mark_dirty ON items;
+CREATE TRIGGER items_menu_mark_dirty
+    AFTER UPDATE OF name, price, deleted OR DELETE ON items
+    FOR EACH ROW EXECUTE FUNCTION menu_mark_dirty();
+
+DROP TRIGGER IF EXISTS categories_menu_mark_dirty ON categories;
+CREATE TRIGGER categories_menu_mark_dirty
+    AFTER INSERT OR UPDATE OF name, deleted OR DELETE ON categories
+    FOR EACH ROW EXECUTE FUNCTION menu_mark_dirty();
+
+DROP TRIGGER IF EXISTS item_categories_menu_mark_dirty ON item_categories;
+CREATE TRIGGER item_categories_menu_mark_dirty
+    AFTER INSERT OR UPDATE OR DELETE ON item_categories
+    FOR EACH ROW EXECUTE FUNCTION menu_mark_dirty();
+
+DROP TRIGGER IF EXISTS items_menu_refresh ON items;
+CREATE TRIGGER items_menu_refresh
+    AFTER UPDATE OR DELETE OR TRUNCATE ON items
+    FOR EACH STATEMENT EXECUTE FUNCTION menu_refresh_dirty();
+
+DROP TRIGGER IF EXISTS categories_menu_refresh ON categories;
+CREATE TRIGGER categories_menu_refresh
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON categories
+    FOR EACH STATEMENT EXECUTE FUNCTION menu_refresh_dirty();
+
+DROP TRIGGER IF EXISTS item_categories_menu_refresh ON item_categories;
+CREATE TRIGGER item_categories_menu_refresh
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON item_categories
+    FOR EACH STATEMENT EXECUTE FUNCTION menu_refresh_dirty();
+
+SELECT refresh_menu_snapshot();
@@ -0,0 +1,12 @@
+-- migrate: no-transaction
+-- Indexes from 0005/0006 that only added write cost, dropped CONCURRENTLY so
+-- the tables stay writable.
+
+-- Duplicates of items_pkey / categories_pkey: the active-row lookups select
+-- columns outside the index, so they were never answered from it alone.
+DROP INDEX CONCURRENTLY IF EXISTS items_active_id_idx;
+DROP INDEX CONCURRENTLY IF EXISTS categories_active_id_idx;
+
+-- The full item_categories (category_id, item_id) index from 0006 also
+-- serves the GET /item category_id filter's deleted = FALSE subquery.
+DROP INDEX CONCURRENTLY IF EXISTS item_categories_active_category_idx;
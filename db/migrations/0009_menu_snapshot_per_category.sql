@@ -0,0 +1,50 @@
+-- GET /menu now joins menu_category_snapshots itself instead of reading an
+-- array assembled on every write. 0007 made each write statement lock the
+-- single menu_snapshot row until commit and rebuild the whole array, which
+-- serialized every catalog write. Writers now only queue behind writers of
+-- the same categories, and re-render nothing but those categories.
+
+CREATE OR REPLACE FUNCTION refresh_menu_snapshot() RETURNS VOID AS $$
+BEGIN
+    DELETE FROM menu_category_snapshots;
+    INSERT INTO menu_category_snapshots (category_id, name, body)
+    SELECT id, name, render_menu_category(id) FROM categories WHERE deleted = FALSE;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION menu_refresh_dirty() RETURNS TRIGGER AS $$
+DECLARE
+    dirty_ids INTEGER[];
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM menu_snapshot_dirty;
+        PERFORM refresh_menu_snapshot();
+        RETURN NULL;
+    END IF;
+
+    WITH dirty AS (DELETE FROM menu_snapshot_dirty RETURNING category_id)
+    SELECT array_agg(category_id ORDER BY category_id) INTO dirty_ids FROM dirty;
+
+    IF dirty_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- One lock per category (class 720002; migrate.py uses 720001), held
+    -- until commit and taken in id order so writers cannot deadlock on them. The statements below start after the locks are granted, so they
+    -- see what an earlier writer of the same category committed.
+    PERFORM pg_advisory_xact_lock(720002, category_id) FROM unnest(dirty_ids) AS category_id;
+
+    DELETE FROM menu_category_snapshots
+    WHERE category_id = ANY (dirty_ids)
+    AND NOT EXISTS (SELECT 1 FROM categories WHERE categories.id = menu_category_snapshots.category_id AND categories.deleted = FALSE);
+
+    INSERT INTO menu_category_snapshots (category_id, name, body)
+    SELECT id, name, render_menu_category(id) FROM categories WHERE id = ANY (dirty_ids) AND deleted = FALSE
+    ON CONFLICT (category_id) DO UPDATE SET name = EXCLUDED.name, body = EXCLUDED.body;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP FUNCTION IF EXISTS assemble_menu_snapshot();
+DROP TABLE IF EXISTS menu_snapshot;
@@ -0,0 +1,5 @@
+import os
+
+# Cursor signing refuses to run without a key; the deployed functions get
+# theirs from the CursorSecret parameter.
+os.environ.setdefault('CURSOR_SECRET', 'test-cursor-secret')
@@ -50,3 +50,14 @@ class TestGetAllCategories(unittest.TestCase):
 
         self.assertEqual(response['statusCode'], 500)
         self.assertEqual(body, {'error': 'Database error'})
+
+    @patch("api.categories.get_all_categories.get_all_categories.postgres_rendering_enabled", return_value=True)
+    @patch("api.categories.get_all_categories.get_all_categories.get_db_connection")
+    def test_lambda_handler_passes_postgres_rendered_body_through(self, mock_get_db_connection, _):
+        body = '[{"id":1,"name":"Burgers","created_at":"2025-07-02T12:00:00"}]'
+        setup_mock_db(mock_get_db_connection, fetchone=(body, 1))
+
+        response = lambda_handler({}, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertIs(response['body'], body)
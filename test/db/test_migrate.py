@@ -0,0 +1,171 @@
+import os
+import shutil
+import tempfile
+import unittest
+import psycopg2
+from unittest.mock import MagicMock
+from db.migrate import (
+    MigrationError,
+    discover_migrations,
+    split_statements,
+    verify_applied,
+    pending_migrations,
+    migrate,
+    MIGRATIONS_DIR
+)
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+
+
+def mock_connection(applied_rows=()):
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = list(applied_rows)
+    return conn, cursor
+
+
+class TestMigrate(unittest.TestCase):
+
+    def setUp(self):
+        self.migrations_dir = tempfile.mkdtemp()
+        self.write('0002_second.sql', 'CREATE INDEX b ON t (b);\n')
+        self.write('0001_first.sql', 'CREATE TABLE t (a INT, b INT);\n')
+        self.write('0003_concurrent.sql', '-- migrate: no-transaction\n-- Build; then swap.\nCREATE INDEX CONCURRENTLY c ON t (a);\nCREATE INDEX CONCURRENTLY d ON t (b);\n')
+        self.write('README.md', 'not a migration')
+
+    def tearDown(self):
+        shutil.rmtree(self.migrations_dir)
+
+    def write(self, filename, sql):
+        with open(os.path.join(self.migrations_dir, filename), 'w') as migration_file:
+            migration_file.write(sql)
+
+    def test_discover_orders_by_version_and_ignores_other_files(self):
+        migrations = discover_migrations(self.migrations_dir)
+
+        self.assertEqual([(migration.version, migration.name) for migration in migrations],
+                         [(1, 'first'), (2, 'second'), (3, 'concurrent')])
+        self.assertEqual([migration.transactional for migration in migrations], [True, True, False])
+
+    def test_discover_rejects_duplicate_versions(self):
+        self.write('0002_other.sql', 'SELECT 1;')
+
+        with self.assertRaises(MigrationError):
+            discover_migrations(self.migrations_dir)
+
+    def test_split_statements_drops_comments(self):
+        migration = discover_migrations(self.migrations_dir)[2]
+
+        self.assertEqual(split_statements(migration.sql),
+                         ['CREATE INDEX CONCURRENTLY c ON t (a)', 'CREATE INDEX CONCURRENTLY d ON t (b)'])
+
+    def test_verify_rejects_changed_migration(self):
+        migrations = discover_migrations(self.migrations_dir)
+
+        with self.assertRaises(MigrationError) as context:
+            verify_applied(migrations, {1: ('first', '0' * 64)})
+        self.assertIn('0001_first has changed', str(context.exception))
+
+    def test_verify_rejects_missing_migration_file(self):
+        migrations = discover_migrations(self.migrations_dir)
+
+        with self.assertRaises(MigrationError) as context:
+            verify_applied(migrations, {9: ('gone', '0' * 64)})
+        self.assertIn('0009_gone', str(context.exception))
+
+    def test_pending_skips_applied_and_stops_at_target(self):
+        migrations = discover_migrations(self.migrations_dir)
+        applied = {1: ('first', migrations[0].checksum)}
+
+        self.assertEqual([migration.version for migration in pending_migrations(migrations, applied)], [2, 3])
+        self.assertEqual([migration.version for migration in pending_migrations(migrations, applied, target=2)], [2])
+
+    def test_migrate_applies_pending_in_order_and_records_them(self):
+        first = discover_migrations(self.migrations_dir)[0]
+        conn, cursor = mock_connection([(1, 'first', first.checksum)])
+
+        applied = migrate(conn, self.migrations_dir, log=lambda message: None)
+
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        self.assertEqual([migration.version for migration in applied], [2, 3])
+        self.assertIn('CREATE INDEX b ON t (b);\n', executed)
+        self.assertIn('CREATE INDEX CONCURRENTLY c ON t (a)', executed)
+        self.assertNotIn('CREATE TABLE t (a INT, b INT);\n', executed)
+        recorded = [call.args[1][0] for call in cursor.execute.call_args_list if 'INSERT INTO schema_migrations' in call.args[0]]
+        self.assertEqual(recorded, [2, 3])
+        self.assertIn('SELECT pg_advisory_unlock(%s);', executed)
+        self.assertFalse(conn.autocommit)
+
+    def test_migrate_dry_run_applies_nothing(self):
+        conn, cursor = mock_connection()
+        messages = []
+
+        migrate(conn, self.migrations_dir, dry_run=True, log=messages.append)
+
+        executed = ' '.join(call.args[0] for call in cursor.execute.call_args_list)
+        self.assertNotIn('CREATE TABLE t', executed)
+        self.assertEqual(messages, ['Would apply 0001_first', 'Would apply 0002_second', 'Would apply 0003_concurrent'])
+
+    def test_migrate_releases_lock_when_a_migration_fails(self):
+        conn, cursor = mock_connection()
+
+        def execute(sql, params=None):
+            if sql.startswith('CREATE TABLE'):
+                raise psycopg2.Error('boom')
+        cursor.execute.side_effect = execute
+
+        with self.assertRaises(psycopg2.Error):
+            migrate(conn, self.migrations_dir, log=lambda message: None)
+
+        self.assertEqual(cursor.execute.call_args.args[0], 'SELECT pg_advisory_unlock(%s);')
+        conn.rollback.assert_called()
+
+    def test_migrate_drops_invalid_index_left_by_failed_concurrent_build(self):
+        applied = [(migration.version, migration.name, migration.checksum) for migration in discover_migrations(self.migrations_dir)[:2]]
+        conn, cursor = mock_connection(applied)
+        cursor.fetchone.side_effect = [(False,), None]
+
+        migrate(conn, self.migrations_dir, log=lambda message: None)
+
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        drop = executed.index('DROP INDEX CONCURRENTLY IF EXISTS c;')
+        self.assertEqual(executed[drop + 1], 'CREATE INDEX CONCURRENTLY c ON t (a)')
+        self.assertNotIn('DROP INDEX CONCURRENTLY IF EXISTS d;', executed)
+
+    def test_repo_migrations_are_discoverable(self):
+        migrations = discover_migrations(MIGRATIONS_DIR)
+
+        self.assertEqual([migration.version for migration in migrations], list(range(1, len(migrations) + 1)))
+
+
+@unittest.skipUnless(TEST_DATABASE_URL, 'TEST_DATABASE_URL is not set')
+class TestMigrateAgainstDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = psycopg2.connect(TEST_DATABASE_URL)
+        with self.conn.cursor() as cursor:
+            cursor.execute('CREATE SCHEMA migrate_test; SET search_path TO migrate_test, public;')
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.rollback()
+        with self.conn.cursor() as cursor:
+            cursor.execute('DROP SCHEMA migrate_test CASCADE;')
+        self.conn.commit()
+        self.conn.close()
+
+    def test_repo_migrations_apply_once(self):
+        first_run = migrate(self.conn, log=lambda message: None)
+        second_run = migrate(self.conn, log=lambda message: None)
+
+        self.assertEqual(len(first_run), len(discover_migrations(MIGRATIONS_DIR)))
+        self.assertEqual(second_run, [])
+
+        with self.conn.cursor() as cursor:
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE schemaname = 'migrate_test';")
+            indexes = {row[0] for row in cursor.fetchall()}
+        self.conn.commit()
+        self.assertTrue({'items_active_created_at_idx', 'categories_active_created_at_idx',
+                         'item_categories_category_item_idx'} <= indexes)
+        self.assertFalse({'items_active_id_idx', 'categories_active_id_idx',
+                          'item_categories_active_category_idx'} & indexes)
@@ -5,9 +5,9 @@ from unittest.mock import patch, MagicMock, Mock
 from utils.custom_exceptions import ActiveResourceNotFoundError, ValidationError
 from api.item_categories.add_item_to_category.add_item_to_category import (
     extract_and_validate_ids, 
-    validate_entities_exist, 
-    create_item_category_association, 
+    add_item_to_category_in_db,
     post_item_to_category_in_db, 
+    post_items_to_category_in_db,
     lambda_handler
 )
 
@@ -56,68 +56,54 @@ class TestAddItemToCategory(unittest.TestCase):
         mock_extract_id.assert_called_once()
         mock_extract_item_id.assert_called_once()
 
-    @patch('api.item_categories.add_item_to_category.add_item_to_category.get_active_row_from_table')
-    def test_validate_entities_exist_returns_none_when_entities_exist(self, mock_get_active_row):
-        mock_get_active_row.return_value = None
-        
-        response = validate_entities_exist(self.mock_cursor, 1, 2)
-        
-        self.assertIsNone(response)
-        self.assertEqual(mock_get_active_row.call_count, 2)
-    
-    @patch('api.item_categories.add_item_to_category.add_item_to_category.get_active_row_from_table')
-    def test_validate_entities_throws_error_with_no_active_item(self, mock_get_active_row):
-        mock_get_active_row.side_effect = ActiveResourceNotFoundError('No Active Item found at ID: 2')
-        
-        with self.assertRaises(ActiveResourceNotFoundError) as context:
-            validate_entities_exist(self.mock_cursor, 1, 2)
-        
-        self.assertEqual(str(context.exception), 'No Active Item found at ID: 2')
-        self.assertEqual(mock_get_active_row.call_count, 1)
-
-    @patch('api.item_categories.add_item_to_category.add_item_to_category.get_active_row_from_table')
-    def test_validate_entities_throws_error_with_no_active_category(self, mock_get_active_row):
-        mock_get_active_row.side_effect = [None, ActiveResourceNotFoundError('No Active Category found at ID: 1')]
-        
-        with self.assertRaises(ActiveResourceNotFoundError) as context:
-            validate_entities_exist(self.mock_cursor, 1, 2)
-        
-        self.assertEqual(str(context.exception), 'No Active Category found at ID: 1')
-        self.assertEqual(mock_get_active_row.call_count, 2)
+    def test_add_item_to_category_in_db_returns_none_when_created(self):
+        self.mock_cursor.fetchone.return_value = ('created',)
 
-    def test_create_item_category_association_returns_none_for_success(self):
-        self.mock_cursor.execute.return_value = None
+        response = add_item_to_category_in_db(self.mock_cursor, 1, 2)
 
-        response = create_item_category_association(self.mock_cursor, 1, 2)
-        
         self.assertIsNone(response)
         self.assertEqual(self.mock_cursor.execute.call_count, 1)
+        self.assertEqual(self.mock_cursor.execute.call_args[0][1], (2, 1))
+
+    def test_add_item_to_category_in_db_throws_error_with_no_active_item(self):
+        self.mock_cursor.fetchone.return_value = ('item_missing',)
+
+        with self.assertRaises(ActiveResourceNotFoundError) as context:
+            add_item_to_category_in_db(self.mock_cursor, 1, 2)
+
+        self.assertEqual(str(context.exception), 'No Active items found at ID: 2')
+        self.assertEqual(self.mock_cursor.execute.call_count, 1)
 
-    def test_create_item_category_association_throws_unique_validation_error(self):
-        self.mock_cursor.execute.side_effect = psycopg2.errors.UniqueViolation('unique constraint violation')
+    def test_add_item_to_category_in_db_throws_error_with_no_active_category(self):
+        self.mock_cursor.fetchone.return_value = ('category_missing',)
+
+        with self.assertRaises(ActiveResourceNotFoundError) as context:
+            add_item_to_category_in_db(self.mock_cursor, 1, 2)
+
+        self.assertEqual(str(context.exception), 'No Active categories found at ID: 1')
+
+    def test_add_item_to_category_in_db_throws_validation_error_when_already_linked(self):
+        self.mock_cursor.fetchone.return_value = ('already_linked',)
 
         with self.assertRaises(ValidationError) as context:
-            create_item_category_association(self.mock_cursor, 1, 2)
-        
+            add_item_to_category_in_db(self.mock_cursor, 1, 2)
+
         self.assertEqual(str(context.exception), 'Item at ID 2 is already added to Category with ID 1')
         self.assertEqual(self.mock_cursor.execute.call_count, 1)
 
     @patch('api.item_categories.add_item_to_category.add_item_to_category.get_db_connection')
-    @patch('api.item_categories.add_item_to_category.add_item_to_category.validate_entities_exist')
-    @patch('api.item_categories.add_item_to_category.add_item_to_category.create_item_category_association')
-    def test_post_item_to_category_in_db_returns_success_json(self, mock_create_association, mock_validate_entities, mock_get_db_connection):
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.add_item_to_category_in_db')
+    def test_post_item_to_category_in_db_returns_success_json(self, mock_add_item_to_category, mock_get_db_connection):
         mock_get_db_connection.return_value.__enter__.return_value = self.mock_conn
         self.mock_conn.cursor.return_value.__enter__.return_value = self.mock_cursor
 
-        mock_validate_entities.return_value = None
-        mock_create_association.return_value = None
+        mock_add_item_to_category.return_value = None
 
         response = post_item_to_category_in_db(1, 2)
 
         self.assertEqual(response['statusCode'], 201)
         self.assertEqual(json.loads(response['body']), {'message': 'Successfully added Item at ID 2 to Category at ID 1'})
-        mock_validate_entities.assert_called_once_with(self.mock_cursor, 1, 2)
-        mock_create_association.assert_called_once_with(self.mock_cursor, 1, 2)
+        mock_add_item_to_category.assert_called_once_with(self.mock_cursor, 1, 2)
 
     @patch('api.item_categories.add_item_to_category.add_item_to_category.get_db_connection')
     def test_post_item_to_category_returns_psycopg2_error(self, mock_get_db_connection):
@@ -180,4 +166,75 @@ class TestAddItemToCategory(unittest.TestCase):
         self.assertEqual(response['statusCode'], 201)
         self.assertEqual(json.loads(response['body']), {'message': 'Successfully added Item at ID 2 to Category at ID 1'})
         mock_validate_ids.assert_called_once()
-        mock_post_item_to_category.assert_called_once_with(1, 2)
\ No newline at end of file
+        mock_post_item_to_category.assert_called_once_with(1, 2)
+
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.invalidate_table')
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.execute_pipeline')
+    def test_post_items_to_category_reports_added_present_and_missing(self, mock_execute_pipeline, mock_invalidate_table):
+        mock_execute_pipeline.return_value = [[{'id': 5}], [{'id': 1}, {'id': 2}, {'id': 3}], [{'item_id': 1}, {'item_id': 3}]]
+
+        response = post_items_to_category_in_db(5, [1, 2, 3, 4])
+
+        self.assertEqual(response['statusCode'], 201)
+        self.assertEqual(json.loads(response['body']), {'added': [1, 3], 'already_present': [2], 'missing': [4]})
+        self.assertEqual(mock_execute_pipeline.call_args[0][0], [
+            ('get_active_categories_row', (5,)),
+            ('get_active_item_ids', ([1, 2, 3, 4],)),
+            ('add_items_to_category', ([1, 2, 3, 4], 5))
+        ])
+        mock_invalidate_table.assert_called_once_with('item_categories')
+
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.invalidate_table')
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.execute_pipeline')
+    def test_post_items_to_category_reports_missing_when_no_items_active(self, mock_execute_pipeline, mock_invalidate_table):
+        mock_execute_pipeline.return_value = [[{'id': 5}], [], []]
+
+        response = post_items_to_category_in_db(5, [8, 9])
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), {'added': [], 'already_present': [], 'missing': [8, 9]})
+        mock_invalidate_table.assert_not_called()
+
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.execute_pipeline')
+    def test_post_items_to_category_raises_on_missing_category(self, mock_execute_pipeline):
+        mock_execute_pipeline.return_value = [[], [{'id': 1}], []]
+
+        with self.assertRaises(ActiveResourceNotFoundError):
+            post_items_to_category_in_db(5, [1])
+
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.post_items_to_category_in_db')
+    def test_lambda_handler_uses_bulk_path_for_body(self, mock_post_items):
+        mock_post_items.return_value = {'statusCode': 201, 'body': '{}'}
+        event = {'pathParameters': {'id': '5'}, 'body': json.dumps({'item_ids': [3, 1, 3]})}
+
+        lambda_handler(event, None)
+
+        mock_post_items.assert_called_once_with(5, [3, 1])
+
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.post_items_to_category_in_db')
+    def test_lambda_handler_rejects_invalid_item_ids(self, mock_post_items):
+        event = {'pathParameters': {'id': '5'}, 'body': json.dumps({'item_ids': [1, 'two']})}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'item_ids must be a non-empty list of integers'})
+        mock_post_items.assert_not_called()
+
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.post_items_to_category_in_db')
+    def test_lambda_handler_rejects_item_ids_outside_int4(self, mock_post_items):
+        event = {'pathParameters': {'id': '5'}, 'body': json.dumps({'item_ids': [1, 2 ** 31]})}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        mock_post_items.assert_not_called()
+
+    @patch('api.item_categories.add_item_to_category.add_item_to_category.MAX_BULK_ITEMS', 2)
+    def test_lambda_handler_rejects_too_many_item_ids(self):
+        event = {'pathParameters': {'id': '5'}, 'body': json.dumps({'item_ids': [1, 2, 3]})}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Cannot add more than 2 items in one request'})
@@ -1,57 +1,79 @@
 import json
 import unittest
 import psycopg2
-from unittest.mock import patch, Mock
-from test.helper_funcs.setup_mock_db import setup_mock_db
-from api.item_categories.get_items_by_category.get_items_by_category import fetch_items_by_category_from_db, lambda_handler
-from api.lambda_layers.utils.python.utils.custom_exceptions import ValidationError, ActiveResourceNotFoundError
+from unittest.mock import patch
+from api.item_categories.get_items_by_category.get_items_by_category import fetch_items_by_category_from_db, fetch_items_by_category_json_from_db, lambda_handler
+from utils.custom_exceptions import ValidationError, ActiveResourceNotFoundError
 
 class TestGetItemsByCategory(unittest.TestCase):
 
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_db_connection')
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_active_row_from_table')
-    def test_fetch_items_by_category_in_db_returns_success_json(self, mock_get_active_row, mock_get_db_connection):
-        setup_mock_db(mock_get_db_connection, fetchall=[{'id': 1, 'name': 'Test Item', 'price': 1.99}])
-
-        mock_get_active_row.return_value = None
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.execute_pipeline')
+    def test_fetch_items_by_category_in_db_returns_success_json(self, mock_execute_pipeline):
+        mock_execute_pipeline.return_value = [[{'id': 1}], [{'id': 1, 'name': 'Test Item', 'price': 1.99}]]
 
         expected = [{'id': 1, 'name': 'Test Item', 'price': 1.99}]
         result = fetch_items_by_category_from_db(1)
 
         self.assertEqual(result, expected)
 
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_db_connection')
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_active_row_from_table')
-    def test_fetch_items_by_category_returns_empty_list(self, mock_get_active_row, mock_get_db_connection):
-        setup_mock_db(mock_get_db_connection, fetchall=[])
-        mock_get_active_row.return_value = None
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.execute_pipeline')
+    def test_fetch_items_by_category_sends_check_and_query_together(self, mock_execute_pipeline):
+        mock_execute_pipeline.return_value = [[{'id': 1}], []]
+
+        fetch_items_by_category_from_db(7)
+
+        queries = mock_execute_pipeline.call_args[0][0]
+        self.assertEqual(queries, [('get_active_categories_row', (7,)), ('get_items_by_category', (7,))])
+        self.assertTrue(mock_execute_pipeline.call_args.kwargs['readonly'])
+
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.execute_pipeline')
+    def test_fetch_items_by_category_returns_empty_list(self, mock_execute_pipeline):
+        mock_execute_pipeline.return_value = [[{'id': 1}], []]
 
         result = fetch_items_by_category_from_db(1)
         self.assertEqual(result, [])
 
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_db_connection')
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_active_row_from_table')
-    def test_fetch_items_by_category_raises_on_missing_category(self, mock_get_active_row, mock_get_db_connection):
-        setup_mock_db(mock_get_db_connection)
-        mock_get_active_row.side_effect = ActiveResourceNotFoundError("Category not found", 404)
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.execute_pipeline')
+    def test_fetch_items_by_category_raises_on_missing_category(self, mock_execute_pipeline):
+        mock_execute_pipeline.return_value = [[], []]
 
         with self.assertRaises(ActiveResourceNotFoundError):
             fetch_items_by_category_from_db(1)
 
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_db_connection')
-    def test_fetch_items_by_category_raises_psycopg2_error(self, mock_get_db_connection):
-        setup_mock_db(mock_get_db_connection, side_effect=psycopg2.Error)
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.execute_pipeline')
+    def test_fetch_items_by_category_raises_psycopg2_error(self, mock_execute_pipeline):
+        mock_execute_pipeline.side_effect = psycopg2.Error
 
         with self.assertRaises(psycopg2.Error):
             fetch_items_by_category_from_db(1)
 
-    @patch('api.item_categories.get_items_by_category.get_items_by_category.get_db_connection')
-    def test_fetch_items_by_category_raises_generic_exception(self, mock_get_db_connection):
-        setup_mock_db(mock_get_db_connection, side_effect=Exception("Unexpected"))
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.execute_pipeline')
+    def test_fetch_items_by_category_raises_generic_exception(self, mock_execute_pipeline):
+        mock_execute_pipeline.side_effect = Exception("Unexpected")
 
         with self.assertRaises(Exception):
             fetch_items_by_category_from_db(1)
 
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.execute_pipeline')
+    def test_fetch_items_by_category_json_returns_rendered_body(self, mock_execute_pipeline):
+        body = '[{"id":1,"name":"Test Item","price":1.99}]'
+        mock_execute_pipeline.return_value = [[{'id': 1}], [{'body': body, 'count': 1}]]
+
+        result = fetch_items_by_category_json_from_db(1)
+
+        self.assertIs(result, body)
+        self.assertEqual(mock_execute_pipeline.call_args[0][0][1], ('get_items_by_category_json', (1,)))
+
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.postgres_rendering_enabled', return_value=True)
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.fetch_items_by_category_json_from_db')
+    def test_lambda_handler_postgres_rendering(self, mock_fetch_json, _):
+        mock_fetch_json.return_value = '[]'
+
+        response = lambda_handler({'pathParameters': {'id': '1'}}, None)
+
+        self.assertEqual(response, {'statusCode': 200, 'body': '[]'})
+        mock_fetch_json.assert_called_once_with(1)
+
     @patch('api.item_categories.get_items_by_category.get_items_by_category.fetch_items_by_category_from_db')
     @patch('api.item_categories.get_items_by_category.get_items_by_category.extract_id_path_param')
     def test_lambda_handler_success(self, mock_extract_id, mock_fetch_items):
@@ -110,6 +132,19 @@ class TestGetItemsByCategory(unittest.TestCase):
         self.assertEqual(response['statusCode'], 500)
         self.assertEqual(json.loads(response['body']), {'error': 'Database error'})
 
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.extract_id_path_param')
+    @patch('api.item_categories.get_items_by_category.get_items_by_category.fetch_items_by_category_from_db')
+    def test_lambda_handler_psycopg_pipeline_error(self, mock_fetch, mock_extract_id):
+        import psycopg
+
+        mock_extract_id.return_value = 1
+        mock_fetch.side_effect = psycopg.OperationalError("Pipeline aborted")
+
+        response = lambda_handler({'pathParameters': {'id': '1'}}, None)
+
+        self.assertEqual(response['statusCode'], 500)
+        self.assertEqual(json.loads(response['body']), {'error': 'Database error'})
+
     @patch('api.item_categories.get_items_by_category.get_items_by_category.extract_id_path_param')
     @patch('api.item_categories.get_items_by_category.get_items_by_category.fetch_items_by_category_from_db')
     def test_lambda_handler_unexpected_error(self, mock_fetch, mock_extract_id):
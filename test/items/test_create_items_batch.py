@@ -0,0 +1,118 @@
+import unittest
+import psycopg2
+from unittest.mock import patch
+import json
+from api.items.create_items_batch.create_items_batch import lambda_handler, post_items_to_db
+from test.helper_funcs.setup_mock_db import setup_mock_db
+from utils.models import Item
+
+EXECUTE_VALUES = "api.items.create_items_batch.create_items_batch.psycopg2.extras.execute_values"
+GET_DB_CONNECTION = "api.items.create_items_batch.create_items_batch.get_db_connection"
+
+def created_row(id, name, price):
+    return {'id': id, 'name': name, 'price': price, 'description': None, 'created_at': '2025-07-02T12:00:00'}
+
+
+class TestCreateItemsBatch(unittest.TestCase):
+
+    @patch(EXECUTE_VALUES)
+    @patch(GET_DB_CONNECTION)
+    def test_lambda_handler_creates_all_items_in_one_insert(self, mock_get_db_connection, mock_execute_values):
+        setup_mock_db(mock_get_db_connection)
+        mock_execute_values.return_value = [created_row(1, 'Burger', 4.99), created_row(2, 'Fries', 1.99)]
+
+        event = {'body': json.dumps([{'name': 'Burger', 'price': 4.99}, {'name': 'Fries', 'price': 1.99}])}
+        response = lambda_handler(event, None)
+        body = json.loads(response['body'])
+
+        self.assertEqual(response['statusCode'], 201)
+        self.assertEqual([item['id'] for item in body['created']], [1, 2])
+        self.assertEqual([item['index'] for item in body['created']], [0, 1])
+        self.assertEqual(body['errors'], [])
+        mock_execute_values.assert_called_once()
+        self.assertEqual(mock_execute_values.call_args[0][2], [('Burger', 4.99, None), ('Fries', 1.99, None)])
+        self.assertEqual(mock_execute_values.call_args.kwargs['page_size'], 2)
+
+    @patch(EXECUTE_VALUES)
+    @patch(GET_DB_CONNECTION)
+    def test_atomic_mode_rejects_whole_batch_with_per_index_errors(self, mock_get_db_connection, mock_execute_values):
+        event = {'body': json.dumps([{'name': 'Burger', 'price': 4.99}, {'name': ' ', 'price': 1.99}, {'name': 'Shake', 'price': -1}])}
+
+        response = lambda_handler(event, None)
+        body = json.loads(response['body'])
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(body['error'], '2 of 3 items failed validation')
+        self.assertEqual([error['index'] for error in body['errors']], [1, 2])
+        self.assertIn('Name field must not be empty', body['errors'][0]['error'])
+        mock_execute_values.assert_not_called()
+
+    @patch(EXECUTE_VALUES)
+    @patch(GET_DB_CONNECTION)
+    def test_partial_mode_inserts_valid_items_and_reports_errors(self, mock_get_db_connection, mock_execute_values):
+        setup_mock_db(mock_get_db_connection)
+        mock_execute_values.return_value = [created_row(7, 'Shake', 2.49)]
+
+        event = {
+            'queryStringParameters': {'mode': 'partial'},
+            'body': json.dumps([{'name': ' ', 'price': 1.99}, {'name': 'Shake', 'price': 2.49}])
+        }
+        response = lambda_handler(event, None)
+        body = json.loads(response['body'])
+
+        self.assertEqual(response['statusCode'], 207)
+        self.assertEqual(body['created'][0]['index'], 1)
+        self.assertEqual(body['created'][0]['id'], 7)
+        self.assertEqual(body['errors'][0]['index'], 0)
+
+    @patch(EXECUTE_VALUES)
+    @patch(GET_DB_CONNECTION)
+    def test_partial_mode_with_no_valid_items_is_rejected(self, mock_get_db_connection, mock_execute_values):
+        event = {'queryStringParameters': {'mode': 'partial'}, 'body': json.dumps([{'name': ' ', 'price': 1.99}])}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        mock_execute_values.assert_not_called()
+
+    @patch("api.items.create_items_batch.create_items_batch.MAX_BATCH_SIZE", 2)
+    def test_lambda_handler_rejects_oversized_batch(self):
+        event = {'body': json.dumps([{'name': 'Item', 'price': 1.00}] * 3)}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Batch size 3 exceeds the maximum of 2'})
+
+    def test_lambda_handler_rejects_non_array_body(self):
+        response = lambda_handler({'body': json.dumps({'name': 'Item', 'price': 1.00})}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Request body must be a non-empty JSON array of items'})
+
+    def test_lambda_handler_rejects_unknown_mode(self):
+        event = {'queryStringParameters': {'mode': 'sometimes'}, 'body': json.dumps([{'name': 'Item', 'price': 1.00}])}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+
+    @patch(EXECUTE_VALUES)
+    @patch(GET_DB_CONNECTION)
+    def test_lambda_handler_returns_500_on_db_error(self, mock_get_db_connection, mock_execute_values):
+        setup_mock_db(mock_get_db_connection)
+        mock_execute_values.side_effect = psycopg2.Error('DB Error')
+
+        response = lambda_handler({'body': json.dumps([{'name': 'Burger', 'price': 4.99}])}, None)
+
+        self.assertEqual(response['statusCode'], 500)
+        self.assertEqual(json.loads(response['body']), {'error': 'Database error'})
+
+    @patch(EXECUTE_VALUES)
+    @patch(GET_DB_CONNECTION)
+    def test_post_items_to_db_raises_when_row_count_mismatches(self, mock_get_db_connection, mock_execute_values):
+        setup_mock_db(mock_get_db_connection)
+        mock_execute_values.return_value = []
+
+        with self.assertRaises(Exception):
+            post_items_to_db([Item(name='Burger', price=4.99)])
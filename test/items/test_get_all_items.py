@@ -2,12 +2,22 @@ import unittest
 import psycopg2
 from unittest.mock import patch
 import json
-from api.items.get_all_items.get_all_items import lambda_handler, json_default
+from api.items.get_all_items.get_all_items import lambda_handler
+from utils.json_default import json_default
 from test.helper_funcs.setup_mock_db import setup_mock_db
 import datetime
+from utils.pagination import encode_cursor, decode_cursor
+from utils.cache import clear_cache
 
 class TestGetAllItems(unittest.TestCase):
 
+    def setUp(self):
+        # No versions means no ETag and no caching, so each test reaches the mocked DB.
+        patcher = patch("utils.conditional_get.get_table_versions", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(clear_cache)
+
     @patch("api.items.get_all_items.get_all_items.get_db_connection")
     def test_lambda_handler_returns_expected_item(self, mock_get_db_connection):
         setup_mock_db(mock_get_db_connection, fetchall=[{'id': 1, 'name': 'Test Item', 'price': 1.99, 'description': 'Test Item Description', 'created_at': '2025-07-02T12:00:00'}])
@@ -73,4 +83,124 @@ class TestGetAllItems(unittest.TestCase):
 
     def test_default_json_handles_float(self):
         floatObj = 1.99
-        self.assertEqual("1.99", json_default(floatObj))
\ No newline at end of file
+        self.assertEqual("1.99", json_default(floatObj))
+
+    @patch("api.items.get_all_items.get_all_items.get_db_connection")
+    def test_lambda_handler_returns_next_cursor_when_more_rows(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[{'id': 3, 'name': 'Test Item 3', 'price': 3.99, 'description': None, 'created_at': '2025-07-03T12:00:00'},
+                                                        {'id': 2, 'name': 'Test Item 2', 'price': 2.99, 'description': None, 'created_at': '2025-07-02T12:00:00'}])
+
+        event = {'path': '/item', 'queryStringParameters': {'limit': '1'}}
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual([item['id'] for item in json.loads(response['body'])], [3])
+        self.assertEqual(decode_cursor(response['headers']['X-Next-Cursor']), ['2025-07-03T12:00:00', 3])
+        self.assertIn('rel="next"', response['headers']['Link'])
+
+    @patch("api.items.get_all_items.get_all_items.get_db_connection")
+    def test_lambda_handler_uses_keyset_for_cursor(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[])
+
+        event = {'queryStringParameters': {'limit': '5', 'cursor': encode_cursor(['2025-07-03T12:00:00', 3])}}
+        response = lambda_handler(event, None)
+
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ('2025-07-03T12:00:00', 3, 6))
+        self.assertEqual(response['headers'], {})
+
+    def test_lambda_handler_rejects_invalid_cursor(self):
+        response = lambda_handler({'queryStringParameters': {'cursor': 'bad'}}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Invalid pagination cursor'})
+
+    @patch("api.items.get_all_items.get_all_items.postgres_rendering_enabled", return_value=True)
+    @patch("api.items.get_all_items.get_all_items.get_db_connection")
+    def test_lambda_handler_passes_postgres_rendered_body_through(self, mock_get_db_connection, _):
+        body = '[{"id":3,"name":"Test Item","price":1.5,"description":null,"created_at":"2025-07-03T12:00:00"}]'
+        setup_mock_db(mock_get_db_connection, fetchone=(body, 2, datetime.datetime(2025, 7, 3, 12), 3))
+
+        event = {'path': '/item', 'queryStringParameters': {'limit': '1'}}
+        response = lambda_handler(event, None)
+
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.assertEqual(response['statusCode'], 200)
+        self.assertIs(response['body'], body)
+        self.assertEqual(mock_cursor.execute.call_args[0][1], (2, 1, 1, 1))
+        self.assertEqual(decode_cursor(response['headers']['X-Next-Cursor']), ['2025-07-03T12:00:00', 3])
+
+    @patch("api.items.get_all_items.get_all_items.postgres_rendering_enabled", return_value=True)
+    @patch("api.items.get_all_items.get_all_items.get_db_connection")
+    def test_lambda_handler_postgres_rendering_last_page_has_no_cursor(self, mock_get_db_connection, _):
+        setup_mock_db(mock_get_db_connection, fetchone=('[]', 0, None, None))
+
+        response = lambda_handler({}, None)
+
+        self.assertEqual(response['body'], '[]')
+        self.assertEqual(response['headers'], {})
+
+    @patch("api.items.get_all_items.get_all_items.get_db_connection")
+    def test_lambda_handler_filters_and_sorts_with_parameters(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[{'id': 2, 'name': 'Fries', 'price': 2.5, 'description': None, 'created_at': '2025-07-02T12:00:00'}])
+
+        event = {'queryStringParameters': {'min_price': '2', 'category_id': '4', 'sort': 'price', 'limit': '10'}}
+        response = lambda_handler(event, None)
+
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual([item['id'] for item in json.loads(response['body'])], [2])
+        self.assertEqual(mock_cursor.execute.call_args[0][1], (2.0, 4, 11))
+
+    @patch("api.items.get_all_items.get_all_items.get_db_connection")
+    def test_lambda_handler_filtered_cursor_carries_sort(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[{'id': 5, 'name': 'Burger', 'price': 4.5, 'description': None, 'created_at': '2025-07-02T12:00:00'},
+                                                        {'id': 6, 'name': 'Cola', 'price': 1.5, 'description': None, 'created_at': '2025-07-02T12:00:00'}])
+
+        response = lambda_handler({'path': '/item', 'queryStringParameters': {'sort': 'name', 'limit': '1'}}, None)
+
+        self.assertEqual(decode_cursor(response['headers']['X-Next-Cursor']), ['name', 'Burger', 5])
+        self.assertIn('sort=name', response['headers']['Link'])
+
+    @patch("api.items.get_all_items.get_all_items.get_db_connection")
+    def test_lambda_handler_continues_filtered_listing_from_cursor(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[])
+
+        event = {'queryStringParameters': {'sort': '-price', 'max_price': '9', 'cursor': encode_cursor(['price', 4.5, 5])}}
+        lambda_handler(event, None)
+
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.assertEqual(mock_cursor.execute.call_args[0][1], (9.0, 4.5, 5, 51))
+
+    def test_lambda_handler_rejects_cursor_from_other_sort(self):
+        event = {'queryStringParameters': {'sort': 'price', 'cursor': encode_cursor(['name', 'Burger', 5])}}
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Invalid pagination cursor'})
+
+    def test_lambda_handler_rejects_unknown_sort(self):
+        response = lambda_handler({'queryStringParameters': {'sort': 'description'}}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'sort must be one of: created_at, name, price, optionally prefixed with -'})
+
+    @patch("utils.item_lookup.get_db_connection")
+    def test_lambda_handler_fetches_ids_in_one_query(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[{'id': 1, 'name': 'Fries', 'price': 2.5, 'description': None, 'created_at': '2025-07-02T12:00:00'},
+                                                        {'id': 4, 'name': 'Cola', 'price': 1.5, 'description': None, 'created_at': '2025-07-02T12:00:00'}])
+
+        response = lambda_handler({'queryStringParameters': {'ids': '4,8,1'}}, None)
+        body = json.loads(response['body'])
+
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+        self.assertEqual([item['id'] for item in body['items']], [4, 1])
+        self.assertEqual(body['missing'], [8])
+
+    def test_lambda_handler_rejects_too_many_ids(self):
+        response = lambda_handler({'queryStringParameters': {'ids': ','.join(str(n) for n in range(1, 102))}}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Cannot look up more than 100 items in one request'})
@@ -4,9 +4,17 @@ from unittest.mock import patch
 import json
 from api.items.get_item_by_id.get_item_by_id import lambda_handler
 from test.helper_funcs.setup_mock_db import setup_mock_db
+from utils.cache import clear_cache
 
 class TestGetItemByID(unittest.TestCase):
 
+    def setUp(self):
+        # No versions means no ETag and no caching, so each test reaches the mocked DB.
+        patcher = patch("utils.conditional_get.get_table_versions", return_value=None)
+        self.mock_get_table_versions = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(clear_cache)
+
     @patch("api.items.get_item_by_id.get_item_by_id.get_db_connection")
     def test_lambda_handler_returns_expected_item(self, mock_get_db_connection):
         setup_mock_db(mock_get_db_connection, fetchone={'id': 1, 'name': 'Test Item', 'price': 1.99, 'description': 'Test Item Description', 'created_at': '2025-07-02T12:00:00'})
@@ -60,4 +68,18 @@ class TestGetItemByID(unittest.TestCase):
         response = lambda_handler(event,None)
 
         self.assertEqual(response['statusCode'], 500)
-        self.assertIn('Internal server error', response['body'])
\ No newline at end of file
+        self.assertIn('Internal server error', response['body'])
+
+    @patch("api.items.get_item_by_id.get_item_by_id.get_db_connection")
+    def test_lambda_handler_serves_repeat_reads_from_cache(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchone={'id': 1, 'name': 'Test Item', 'price': 1.99, 'description': None, 'created_at': '2025-07-02T12:00:00'})
+        self.mock_get_table_versions.return_value = (1,)
+
+        event = {'pathParameters' : {'id' : '1'}}
+        first = lambda_handler(event, None)
+        second = lambda_handler(event, None)
+
+        self.assertEqual(first['body'], second['body'])
+        self.assertEqual(first['headers']['ETag'], second['headers']['ETag'])
+        mock_get_db_connection.assert_called_once()
+        self.mock_get_table_versions.assert_called_once_with(('items',))
@@ -0,0 +1,49 @@
+import unittest
+import psycopg2
+from unittest.mock import patch
+import json
+from api.items.lookup_items.lookup_items import lambda_handler
+from test.helper_funcs.setup_mock_db import setup_mock_db
+
+def item_row(item_id):
+    return {'id': item_id, 'name': f'Test Item {item_id}', 'price': 1.99, 'description': None, 'created_at': '2025-07-02T12:00:00'}
+
+class TestLookupItems(unittest.TestCase):
+
+    @patch("utils.item_lookup.get_db_connection")
+    def test_lambda_handler_returns_items_in_requested_order(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[item_row(1), item_row(2), item_row(3)])
+
+        response = lambda_handler({'body': json.dumps({'ids': [3, 1, 2]})}, None)
+        body = json.loads(response['body'])
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual([item['id'] for item in body['items']], [3, 1, 2])
+        self.assertEqual(body['missing'], [])
+
+    @patch("utils.item_lookup.get_db_connection")
+    def test_lambda_handler_reports_missing_ids(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[item_row(2)])
+
+        response = lambda_handler({'body': json.dumps({'ids': [9, 2, 7]})}, None)
+        body = json.loads(response['body'])
+
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ([9, 2, 7],))
+        self.assertEqual([item['id'] for item in body['items']], [2])
+        self.assertEqual(body['missing'], [9, 7])
+
+    def test_lambda_handler_rejects_invalid_body(self):
+        response = lambda_handler({'body': json.dumps({'ids': 'all'})}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'ids must be a non-empty list of integers'})
+
+    @patch("utils.item_lookup.get_db_connection")
+    def test_lambda_handler_throws_database_error(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, side_effect=psycopg2.Error('DB Error'))
+
+        response = lambda_handler({'body': json.dumps({'ids': [1]})}, None)
+
+        self.assertEqual(response['statusCode'], 500)
+        self.assertEqual(json.loads(response['body']), {'error': 'Database error'})
@@ -0,0 +1,118 @@
+import unittest
+import psycopg2
+from unittest.mock import patch
+import json
+from api.items.search_items.search_items import lambda_handler, SEARCH_STATEMENTS
+from utils.statements import get_statement
+from test.helper_funcs.setup_mock_db import setup_mock_db
+from utils.pagination import encode_cursor, decode_cursor
+
+def search_row(item_id, score):
+    return {'id': item_id, 'name': f'Cheeseburger {item_id}', 'price': 5.99, 'description': 'Beef and cheese',
+            'created_at': '2025-07-02T12:00:00', 'score': score}
+
+def executed_sql(mock_get_db_connection):
+    mock_conn = mock_get_db_connection.return_value.__enter__.return_value
+    cursor = mock_conn.cursor.return_value.__enter__.return_value
+    return ' '.join(str(call.args[0]) for call in cursor.execute.call_args_list)
+
+class TestSearchItems(unittest.TestCase):
+
+    @patch("api.items.search_items.search_items.get_db_connection")
+    def test_lambda_handler_returns_ranked_items_without_score(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[search_row(2, 0.9), search_row(1, 0.4)])
+
+        response = lambda_handler({'queryStringParameters': {'q': 'cheeseburger'}}, None)
+        body = json.loads(response['body'])
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual([item['id'] for item in body], [2, 1])
+        self.assertNotIn('score', body[0])
+        self.assertEqual(response['headers'], {})
+
+    @patch("api.items.search_items.search_items.get_db_connection")
+    def test_lambda_handler_falls_back_to_similar_names(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection)
+        mock_conn = mock_get_db_connection.return_value.__enter__.return_value
+        mock_conn.cursor.return_value.__enter__.return_value.fetchall.side_effect = [[], [search_row(1, 0.7)]]
+
+        response = lambda_handler({'queryStringParameters': {'q': 'chese'}}, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual([item['id'] for item in json.loads(response['body'])], [1])
+        self.assertIn('search_items_similar', executed_sql(mock_get_db_connection))
+
+    @patch("api.items.search_items.search_items.get_db_connection")
+    def test_lambda_handler_returns_empty_list_when_nothing_matches(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[])
+
+        response = lambda_handler({'queryStringParameters': {'q': 'zzzz'}}, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body']), [])
+
+    @patch("api.items.search_items.search_items.get_db_connection")
+    def test_lambda_handler_returns_next_cursor_with_search_mode(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[search_row(3, 0.9), search_row(2, 0.5), search_row(1, 0.1)])
+
+        response = lambda_handler({'path': '/item/search', 'queryStringParameters': {'q': 'burger', 'limit': '2'}}, None)
+
+        self.assertEqual(len(json.loads(response['body'])), 2)
+        self.assertEqual(decode_cursor(response['headers']['X-Next-Cursor']), ['text', 0.5, 2])
+        self.assertIn('q=burger', response['headers']['Link'])
+
+    @patch("api.items.search_items.search_items.get_db_connection")
+    def test_lambda_handler_continues_in_cursor_mode(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[search_row(1, 0.3)])
+        cursor = encode_cursor(['similar', 0.5, 2])
+
+        response = lambda_handler({'queryStringParameters': {'q': 'burg', 'cursor': cursor}}, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        sql = executed_sql(mock_get_db_connection)
+        self.assertIn('search_items_similar_after', sql)
+        self.assertNotIn('search_items_text', sql)
+
+    def test_after_statements_compare_score_as_real(self):
+        # Unprepared, the cursor score arrives as a numeric literal; without the
+        # cast real < numeric compares in float8 and tied rows are skipped.
+        for mode, (_, after_statement) in SEARCH_STATEMENTS.items():
+            with self.subTest(mode=mode):
+                self.assertIn('(score, id) < (%s::real, %s)', get_statement(after_statement).sql)
+
+    def test_lambda_handler_rejects_cursor_with_unknown_mode(self):
+        cursor = encode_cursor(['other', 0.5, 2])
+
+        response = lambda_handler({'queryStringParameters': {'q': 'burger', 'cursor': cursor}}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Invalid pagination cursor'})
+
+    def test_lambda_handler_rejects_cursor_with_bad_score_or_id(self):
+        for values in (['text', 'high', 2], ['text', True, 2], ['text', 0.5, '2'], ['text', 0.5, 2 ** 31], ['text', 0.5, 2.5]):
+            with self.subTest(values=values):
+                response = lambda_handler({'queryStringParameters': {'q': 'burger', 'cursor': encode_cursor(values)}}, None)
+
+                self.assertEqual(response['statusCode'], 400)
+                self.assertEqual(json.loads(response['body']), {'error': 'Invalid pagination cursor'})
+
+    def test_lambda_handler_requires_search_text(self):
+        response = lambda_handler({'queryStringParameters': {'q': '   '}}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Missing search text. Must use query string parameter labeled q'})
+
+    def test_lambda_handler_rejects_long_search_text(self):
+        response = lambda_handler({'queryStringParameters': {'q': 'a' * 101}}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body']), {'error': 'Search text must be at most 100 characters'})
+
+    @patch("api.items.search_items.search_items.get_db_connection")
+    def test_lambda_handler_throws_database_error(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, side_effect=psycopg2.Error('DB Error'))
+
+        response = lambda_handler({'queryStringParameters': {'q': 'burger'}}, None)
+
+        self.assertEqual(response['statusCode'], 500)
+        self.assertEqual(json.loads(response['body']), {'error': 'Database error'})
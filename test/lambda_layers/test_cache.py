@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch, Mock
+from api.lambda_layers.utils.python.utils.table_versions import remember_table_versions
+from api.lambda_layers.utils.python.utils.cache import (
+    ReadCache,
+    read_through_cache,
+    invalidate_table,
+    clear_cache
+)
+
+GET_TABLE_VERSIONS = 'api.lambda_layers.utils.python.utils.cache.get_table_versions'
+MONOTONIC = 'api.lambda_layers.utils.python.utils.cache.time.monotonic'
+
+
+class TestReadCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_cache()
+
+    def tearDown(self):
+        clear_cache()
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = ReadCache(max_entries=2)
+        cache.put(('a',), 1, ('items',), (1,), 10)
+        cache.put(('b',), 2, ('items',), (1,), 10)
+        cache.get(('a',))
+        cache.put(('c',), 3, ('items',), (1,), 10)
+
+        self.assertEqual(list(cache.entries), [('a',), ('c',)])
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_second_read_within_ttl_skips_loader_and_version_check(self, mock_get_versions):
+        mock_get_versions.return_value = (1,)
+        loader = Mock(return_value=['row'])
+
+        self.assertEqual(read_through_cache(('key',), ('items',), loader, ttl=60), ['row'])
+        self.assertEqual(read_through_cache(('key',), ('items',), loader, ttl=60), ['row'])
+
+        loader.assert_called_once()
+        mock_get_versions.assert_called_once_with(('items',))
+
+    @patch(MONOTONIC)
+    @patch(GET_TABLE_VERSIONS)
+    def test_expired_entry_is_revalidated_when_version_unchanged(self, mock_get_versions, mock_monotonic):
+        mock_get_versions.return_value = (1,)
+        mock_monotonic.return_value = 100
+        loader = Mock(return_value=['row'])
+
+        read_through_cache(('key',), ('items',), loader, ttl=5)
+        mock_monotonic.return_value = 106
+        result = read_through_cache(('key',), ('items',), loader, ttl=5)
+
+        self.assertEqual(result, ['row'])
+        loader.assert_called_once()
+        self.assertEqual(mock_get_versions.call_count, 2)
+
+    @patch(MONOTONIC)
+    @patch(GET_TABLE_VERSIONS)
+    def test_expired_entry_is_reloaded_when_version_changed(self, mock_get_versions, mock_monotonic):
+        mock_get_versions.side_effect = [(1,), (2,)]
+        mock_monotonic.return_value = 100
+        loader = Mock(side_effect=[['old'], ['new']])
+
+        read_through_cache(('key',), ('items',), loader, ttl=5)
+        mock_monotonic.return_value = 106
+        result = read_through_cache(('key',), ('items',), loader, ttl=5)
+
+        self.assertEqual(result, ['new'])
+        self.assertEqual(loader.call_count, 2)
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_nothing_is_cached_when_versions_unavailable(self, mock_get_versions):
+        mock_get_versions.return_value = None
+        loader = Mock(return_value=['row'])
+
+        read_through_cache(('key',), ('items',), loader, ttl=60)
+        read_through_cache(('key',), ('items',), loader, ttl=60)
+
+        self.assertEqual(loader.call_count, 2)
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_zero_ttl_disables_cache(self, mock_get_versions):
+        loader = Mock(return_value=['row'])
+
+        read_through_cache(('key',), ('items',), loader, ttl=0)
+
+        loader.assert_called_once()
+        mock_get_versions.assert_not_called()
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_loader_errors_are_not_cached(self, mock_get_versions):
+        mock_get_versions.return_value = (1,)
+        loader = Mock(side_effect=[Exception('DB down'), ['row']])
+
+        with self.assertRaises(Exception):
+            read_through_cache(('key',), ('items',), loader, ttl=60)
+
+        self.assertEqual(read_through_cache(('key',), ('items',), loader, ttl=60), ['row'])
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_invalidate_table_drops_dependent_entries(self, mock_get_versions):
+        mock_get_versions.return_value = (1, 1)
+        loader = Mock(return_value=['row'])
+
+        read_through_cache(('key',), ('categories', 'items'), loader, ttl=60)
+        invalidate_table('items')
+        read_through_cache(('key',), ('categories', 'items'), loader, ttl=60)
+
+        self.assertEqual(loader.call_count, 2)
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_request_known_versions_override_ttl(self, mock_get_versions):
+        mock_get_versions.return_value = (1,)
+        loader = Mock(side_effect=[['old'], ['new']])
+
+        read_through_cache(('key',), ('items',), loader, ttl=60)
+        with remember_table_versions(('items',), (2,)):
+            result = read_through_cache(('key',), ('items',), loader, ttl=60)
+
+        self.assertEqual(result, ['new'])
+        mock_get_versions.assert_called_once()
@@ -0,0 +1,40 @@
+import os
+import sys
+import unittest
+import subprocess
+
+LAYER_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'api', 'lambda_layers', 'utils', 'python')
+
+
+def modules_loaded_by(statement):
+    result = subprocess.run(
+        [sys.executable, '-c', f'import sys\n{statement}\nprint(" ".join(sys.modules))'],
+        env={**os.environ, 'PYTHONPATH': LAYER_PATH}, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestColdStartImports(unittest.TestCase):
+
+    def test_validation_helpers_do_not_import_pydantic(self):
+        modules = modules_loaded_by('import utils.validation')
+
+        self.assertNotIn('pydantic', modules)
+        self.assertNotIn('utils.models', modules)
+
+    def test_handler_wrapper_does_not_import_extras_or_codecs(self):
+        modules = modules_loaded_by('import utils.lambda_exception_handler_wrapper, utils.db_connection')
+
+        self.assertNotIn('psycopg2.extras', modules)
+        self.assertNotIn('gzip', modules)
+
+    def test_default_driver_does_not_import_psycopg(self):
+        modules = modules_loaded_by('import utils.lambda_exception_handler_wrapper, utils.pipeline')
+
+        self.assertNotIn('psycopg', modules)
+
+    def test_body_validation_still_loads_models_on_demand(self):
+        modules = modules_loaded_by(
+            'from utils.validation import validate_item_event_body\n'
+            'validate_item_event_body({"body": "{\\"name\\": \\"Burger\\", \\"price\\": 1.5}"})')
+
+        self.assertIn('utils.models', modules)
@@ -0,0 +1,83 @@
+import gzip
+import json
+import base64
+import unittest
+from unittest.mock import patch
+import api.lambda_layers.utils.python.utils.compression as compression
+from api.lambda_layers.utils.python.utils.compression import parse_accept_encoding, choose_encoding, compress_response
+from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
+
+LARGE_BODY = json.dumps([{'id': n, 'name': f'Item {n}', 'price': 1.99} for n in range(200)])
+
+
+class TestCompression(unittest.TestCase):
+
+    def test_parse_accept_encoding_reads_quality_values(self):
+        self.assertEqual(parse_accept_encoding('gzip;q=0.5, br, identity;q=0'), {'gzip': 0.5, 'br': 1.0, 'identity': 0.0})
+
+    def test_choose_encoding_respects_weights_and_availability(self):
+        self.assertEqual(choose_encoding('gzip, deflate'), 'gzip')
+        self.assertIsNone(choose_encoding('gzip;q=0'))
+        self.assertIsNone(choose_encoding(None))
+
+        with patch.dict(compression.ENCODERS, {'br': lambda data: data}):
+            self.assertEqual(choose_encoding('gzip, br'), 'br')
+            self.assertEqual(choose_encoding('gzip, br;q=0.5'), 'gzip')
+            self.assertEqual(choose_encoding('*'), 'br')
+
+    def test_large_body_is_gzipped_and_base64_encoded(self):
+        event = {'headers': {'accept-encoding': 'gzip'}}
+        response = compress_response(event, {'statusCode': 200, 'headers': {'ETag': '"abc"'}, 'body': LARGE_BODY})
+
+        self.assertTrue(response['isBase64Encoded'])
+        self.assertEqual(response['headers']['Content-Encoding'], 'gzip')
+        self.assertEqual(response['headers']['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['headers']['ETag'], 'W/"abc"')
+        self.assertEqual(gzip.decompress(base64.b64decode(response['body'])).decode('utf-8'), LARGE_BODY)
+
+    def test_small_body_is_left_alone(self):
+        original = {'statusCode': 200, 'body': '{"id":1}'}
+
+        self.assertIs(compress_response({'headers': {'Accept-Encoding': 'gzip'}}, original), original)
+
+    def test_large_body_without_accept_encoding_only_gets_vary(self):
+        response = compress_response({}, {'statusCode': 200, 'body': LARGE_BODY})
+
+        self.assertEqual(response['body'], LARGE_BODY)
+        self.assertEqual(response['headers'], {'Vary': 'Accept-Encoding'})
+        self.assertNotIn('isBase64Encoded', response)
+
+    def test_already_encoded_response_is_left_alone(self):
+        original = {'statusCode': 200, 'headers': {'Content-Encoding': 'br'}, 'body': LARGE_BODY}
+
+        self.assertIs(compress_response({'headers': {'Accept-Encoding': 'gzip'}}, original), original)
+
+    def test_wrapper_compresses_and_decodes_base64_request_bodies(self):
+        received = {}
+
+        @lambda_exception_handler_wrapper
+        def handler(event, context):
+            received['body'] = event['body']
+            return {'statusCode': 200, 'body': LARGE_BODY}
+
+        event = {
+            'headers': {'Accept-Encoding': 'gzip'},
+            'body': base64.b64encode(b'{"name": "Burger"}').decode('ascii'),
+            'isBase64Encoded': True
+        }
+        response = handler(event, None)
+
+        self.assertEqual(received['body'], '{"name": "Burger"}')
+        self.assertEqual(response['headers']['Content-Encoding'], 'gzip')
+
+    def test_wrapper_rejects_undecodable_request_bodies(self):
+        @lambda_exception_handler_wrapper
+        def handler(event, context):
+            raise AssertionError('handler should not run')
+
+        for body in ('abc', base64.b64encode(b'\xff\xfe').decode('ascii')):
+            with self.subTest(body=body):
+                response = handler({'body': body, 'isBase64Encoded': True}, None)
+
+                self.assertEqual(response['statusCode'], 400)
+                self.assertEqual(json.loads(response['body']), {'error': 'Request body could not be decoded'})
@@ -0,0 +1,130 @@
+import unittest
+from unittest.mock import patch, Mock
+from api.lambda_layers.utils.python.utils.conditional_get import (
+    conditional_get,
+    compute_etag,
+    etag_matches,
+    get_header
+)
+from api.lambda_layers.utils.python.utils.table_versions import known_table_versions
+from api.lambda_layers.utils.python.utils.cache import invalidate_table, clear_cache
+
+GET_TABLE_VERSIONS = 'api.lambda_layers.utils.python.utils.conditional_get.get_table_versions'
+
+
+class TestConditionalGet(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = Mock(return_value={'statusCode': 200, 'body': '[]'})
+        self.wrapped = conditional_get(('items',))(self.handler)
+        self.event = {'resource': '/item', 'headers': {}}
+        clear_cache()
+        self.addCleanup(clear_cache)
+
+    def test_get_header_is_case_insensitive(self):
+        self.assertEqual(get_header({'headers': {'if-none-match': '"a"'}}, 'If-None-Match'), '"a"')
+        self.assertIsNone(get_header({}, 'If-None-Match'))
+
+    def test_etag_changes_with_versions_and_query(self):
+        base = compute_etag(self.event, ('items',), (1,))
+
+        self.assertNotEqual(base, compute_etag(self.event, ('items',), (2,)))
+        self.assertNotEqual(base, compute_etag({**self.event, 'queryStringParameters': {'limit': '5'}}, ('items',), (1,)))
+        self.assertEqual(base, compute_etag(dict(self.event), ('items',), (1,)))
+
+    def test_etag_matches_handles_lists_and_weak_tags(self):
+        self.assertTrue(etag_matches('"x", "y"', '"y"'))
+        self.assertTrue(etag_matches('W/"y"', '"y"'))
+        self.assertFalse(etag_matches('*', '"y"'))
+        self.assertFalse(etag_matches('"x"', '"y"'))
+        self.assertFalse(etag_matches(None, '"y"'))
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_adds_etag_to_ok_response(self, mock_get_versions):
+        mock_get_versions.return_value = (3,)
+
+        response = self.wrapped(self.event, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(response['headers']['ETag'], compute_etag(self.event, ('items',), (3,)))
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_returns_304_without_calling_handler_when_etag_matches(self, mock_get_versions):
+        mock_get_versions.return_value = (3,)
+        etag = compute_etag(self.event, ('items',), (3,))
+        self.event['headers'] = {'If-None-Match': etag}
+
+        response = self.wrapped(self.event, None)
+
+        self.assertEqual(response, {'statusCode': 304, 'headers': {'ETag': etag}, 'body': ''})
+        self.handler.assert_not_called()
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_wildcard_returns_304_only_for_an_existing_resource(self, mock_get_versions):
+        mock_get_versions.return_value = (3,)
+        self.event['headers'] = {'If-None-Match': '*'}
+
+        response = self.wrapped(self.event, None)
+        self.assertEqual(response, {'statusCode': 304, 'headers': {'ETag': compute_etag(self.event, ('items',), (3,))}, 'body': ''})
+
+        self.handler.return_value = {'statusCode': 404, 'body': '{}'}
+        self.assertEqual(self.wrapped(self.event, None), {'statusCode': 404, 'body': '{}'})
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_stale_etag_gets_full_response(self, mock_get_versions):
+        mock_get_versions.return_value = (4,)
+        self.event['headers'] = {'If-None-Match': compute_etag(self.event, ('items',), (3,))}
+
+        response = self.wrapped(self.event, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.handler.assert_called_once()
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_versions_are_shared_with_handler_for_the_request(self, mock_get_versions):
+        mock_get_versions.return_value = (3,)
+        seen = []
+        self.handler.side_effect = lambda event, context: seen.append(known_table_versions(('items',))) or {'statusCode': 200, 'body': ''}
+
+        self.wrapped(self.event, None)
+
+        self.assertEqual(seen, [(3,)])
+        self.assertIsNone(known_table_versions(('items',)))
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_passes_through_without_versions(self, mock_get_versions):
+        mock_get_versions.return_value = None
+
+        response = self.wrapped(self.event, None)
+
+        self.assertEqual(response, {'statusCode': 200, 'body': '[]'})
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_error_responses_get_no_etag(self, mock_get_versions):
+        mock_get_versions.return_value = (3,)
+        self.handler.return_value = {'statusCode': 404, 'body': '{}'}
+
+        response = self.wrapped(self.event, None)
+
+        self.assertNotIn('headers', response)
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_repeat_request_within_ttl_reuses_held_versions(self, mock_get_versions):
+        mock_get_versions.return_value = (3,)
+
+        first = self.wrapped(self.event, None)
+        second = self.wrapped(self.event, None)
+
+        self.assertEqual(first['headers']['ETag'], second['headers']['ETag'])
+        mock_get_versions.assert_called_once_with(('items',))
+
+    @patch(GET_TABLE_VERSIONS)
+    def test_invalidated_table_versions_are_read_again(self, mock_get_versions):
+        mock_get_versions.side_effect = [(3,), (4,)]
+
+        self.wrapped(self.event, None)
+        invalidate_table('items')
+        response = self.wrapped(self.event, None)
+
+        self.assertEqual(response['headers']['ETag'], compute_etag(self.event, ('items',), (4,)))
+        self.assertEqual(mock_get_versions.call_count, 2)
@@ -0,0 +1,319 @@
+import time
+import threading
+import unittest
+import psycopg2
+import psycopg2.extensions
+from unittest.mock import patch, MagicMock
+from api.lambda_layers.utils.python.utils.db_connection import ResilientConnectionPool, PoolTimeoutError, init_connection_pool
+
+CONNECT = 'api.lambda_layers.utils.python.utils.db_connection.psycopg2.connect'
+MONOTONIC = 'api.lambda_layers.utils.python.utils.db_connection.time.monotonic'
+SLEEP = 'api.lambda_layers.utils.python.utils.db_connection.time.sleep'
+DB_ENV = {'DB_USER': 'user', 'DB_PASS': 'pass', 'DB_HOST': 'localhost', 'DB_PORT': '5432', 'DB_NAME': 'db'}
+
+
+def make_conn():
+    conn = MagicMock()
+    conn.closed = 0
+    conn.autocommit = False
+    conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    return conn
+
+
+class TestResilientConnectionPool(unittest.TestCase):
+
+    @patch(CONNECT)
+    def test_reuses_returned_connection(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+        pool = ResilientConnectionPool(0, 2)
+
+        conn = pool.getconn()
+        pool.putconn(conn)
+
+        self.assertIs(pool.getconn(), conn)
+        mock_connect.assert_called_once()
+
+    @patch(CONNECT)
+    def test_connects_with_keepalive_settings(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+
+        ResilientConnectionPool(0, 1, host='db').getconn()
+
+        kwargs = mock_connect.call_args.kwargs
+        self.assertEqual(kwargs['host'], 'db')
+        self.assertEqual(kwargs['keepalives'], 1)
+        self.assertIn('keepalives_idle', kwargs)
+
+    @patch(SLEEP)
+    @patch(CONNECT)
+    def test_retries_failed_connects(self, mock_connect, mock_sleep):
+        conn = make_conn()
+        mock_connect.side_effect = [psycopg2.OperationalError('refused'), conn]
+
+        self.assertIs(ResilientConnectionPool(0, 1, connect_retries=2).getconn(), conn)
+        mock_sleep.assert_called_once()
+
+    @patch(SLEEP)
+    @patch(CONNECT)
+    def test_gives_up_after_bounded_retries_and_frees_slot(self, mock_connect, mock_sleep):
+        mock_connect.side_effect = psycopg2.OperationalError('refused')
+        pool = ResilientConnectionPool(0, 1, connect_retries=2)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            pool.getconn()
+
+        self.assertEqual(mock_connect.call_count, 3)
+        self.assertEqual(pool._total, 0)
+
+    def test_connects_and_retries_with_the_given_driver(self):
+        driver = MagicMock()
+        driver.OperationalError = type('OperationalError', (Exception,), {})
+        driver.Error = Exception
+        conn = make_conn()
+        driver.connect.side_effect = [driver.OperationalError('refused'), conn]
+
+        with patch(SLEEP):
+            pool = ResilientConnectionPool(0, 1, driver=driver, autocommit=True)
+            self.assertIs(pool.getconn(), conn)
+
+        self.assertTrue(driver.connect.call_args.kwargs['autocommit'])
+        self.assertEqual(driver.connect.call_count, 2)
+
+    @patch(MONOTONIC)
+    @patch(CONNECT)
+    def test_idle_connection_is_pinged_and_replaced_when_dead(self, mock_connect, mock_monotonic):
+        dead, fresh = make_conn(), make_conn()
+        dead.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError('gone')
+        mock_connect.side_effect = [dead, fresh]
+        mock_monotonic.return_value = 0
+        pool = ResilientConnectionPool(0, 1, idle_check_seconds=30)
+
+        pool.putconn(pool.getconn())
+        mock_monotonic.return_value = 31
+
+        self.assertIs(pool.getconn(), fresh)
+        dead.close.assert_called_once()
+
+    @patch(MONOTONIC)
+    @patch(CONNECT)
+    def test_recently_used_connection_is_not_pinged(self, mock_connect, mock_monotonic):
+        conn = make_conn()
+        mock_connect.return_value = conn
+        mock_monotonic.return_value = 0
+        pool = ResilientConnectionPool(0, 1, idle_check_seconds=30)
+
+        pool.putconn(pool.getconn())
+        mock_monotonic.return_value = 10
+        pool.getconn()
+
+        conn.cursor.assert_not_called()
+
+    @patch(MONOTONIC)
+    @patch(CONNECT)
+    def test_connection_past_max_lifetime_is_recycled(self, mock_connect, mock_monotonic):
+        old, new = make_conn(), make_conn()
+        mock_connect.side_effect = [old, new]
+        mock_monotonic.return_value = 0
+        pool = ResilientConnectionPool(0, 1, max_lifetime_seconds=60)
+
+        conn = pool.getconn()
+        mock_monotonic.return_value = 61
+        pool.putconn(conn)
+
+        self.assertIs(pool.getconn(), new)
+        old.close.assert_called_once()
+
+    @patch(CONNECT)
+    def test_open_transaction_is_rolled_back_on_return(self, mock_connect):
+        conn = make_conn()
+        conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+        mock_connect.return_value = conn
+        pool = ResilientConnectionPool(0, 1)
+
+        pool.putconn(pool.getconn())
+
+        conn.rollback.assert_called_once()
+
+    @patch(CONNECT)
+    def test_close_flag_discards_connection(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+        pool = ResilientConnectionPool(0, 1)
+
+        conn = pool.getconn()
+        pool.putconn(conn, close=True)
+
+        conn.close.assert_called_once()
+        self.assertIsNot(pool.getconn(), conn)
+
+    @patch(CONNECT)
+    def test_exhausted_pool_times_out(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+        pool = ResilientConnectionPool(0, 1, checkout_timeout=0.01)
+        pool.getconn()
+
+        with self.assertRaises(PoolTimeoutError):
+            pool.getconn()
+
+    @patch(CONNECT)
+    def test_exhausted_pool_waits_for_returned_connection(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+        pool = ResilientConnectionPool(0, 1, checkout_timeout=5)
+        conn = pool.getconn()
+
+        timer = threading.Timer(0.05, pool.putconn, args=(conn,))
+        timer.start()
+
+        self.assertIs(pool.getconn(), conn)
+        timer.join()
+
+    @patch(CONNECT)
+    def test_putconn_rejects_unknown_connection(self, mock_connect):
+        pool = ResilientConnectionPool(0, 1)
+
+        with self.assertRaises(psycopg2.pool.PoolError):
+            pool.putconn(make_conn())
+
+
+class TestGetDbConnection(unittest.TestCase):
+
+    @patch('api.lambda_layers.utils.python.utils.db_connection.init_connection_pool')
+    def test_connection_is_returned_when_body_raises_non_db_error(self, mock_init_pool):
+        from api.lambda_layers.utils.python.utils.db_connection import get_db_connection
+        pool = mock_init_pool.return_value
+
+        with self.assertRaises(ValueError):
+            with get_db_connection():
+                raise ValueError('not found')
+
+        pool.putconn.assert_called_once_with(pool.getconn.return_value)
+
+    @patch('api.lambda_layers.utils.python.utils.db_connection.init_connection_pool')
+    def test_connection_is_discarded_on_db_error(self, mock_init_pool):
+        from api.lambda_layers.utils.python.utils.db_connection import get_db_connection
+        pool = mock_init_pool.return_value
+
+        with self.assertRaises(psycopg2.Error):
+            with get_db_connection():
+                raise psycopg2.Error('boom')
+
+        pool.putconn.assert_called_once_with(pool.getconn.return_value, close=True)
+
+    @patch('api.lambda_layers.utils.python.utils.db_connection.init_connection_pool')
+    def test_write_transaction_commits_once(self, mock_init_pool):
+        from api.lambda_layers.utils.python.utils.db_connection import get_db_connection
+        conn = make_conn()
+        mock_init_pool.return_value.getconn.return_value = conn
+
+        with get_db_connection():
+            self.assertFalse(conn.autocommit)
+
+        conn.commit.assert_called_once()
+        conn.rollback.assert_not_called()
+        mock_init_pool.return_value.putconn.assert_called_once_with(conn)
+
+    @patch('api.lambda_layers.utils.python.utils.db_connection.init_connection_pool')
+    def test_write_transaction_rolls_back_on_error(self, mock_init_pool):
+        from api.lambda_layers.utils.python.utils.db_connection import get_db_connection
+        conn = make_conn()
+        mock_init_pool.return_value.getconn.return_value = conn
+
+        with self.assertRaises(ValueError):
+            with get_db_connection():
+                raise ValueError('not found')
+
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called_once()
+
+    @patch('api.lambda_layers.utils.python.utils.db_connection.init_connection_pool')
+    def test_readonly_uses_autocommit_without_commit(self, mock_init_pool):
+        from api.lambda_layers.utils.python.utils.db_connection import get_db_connection
+        conn = make_conn()
+        mock_init_pool.return_value.getconn.return_value = conn
+
+        with get_db_connection(readonly=True):
+            self.assertTrue(conn.autocommit)
+
+        conn.commit.assert_not_called()
+        set_call = conn.cursor.return_value.__enter__.return_value.execute.call_args
+        self.assertIn('default_transaction_read_only', set_call[0][0])
+        self.assertEqual(set_call[0][1], (True, 0, 0))
+
+    @patch('api.lambda_layers.utils.python.utils.db_connection.init_connection_pool')
+    def test_session_settings_are_only_sent_when_they_change(self, mock_init_pool):
+        from api.lambda_layers.utils.python.utils.db_connection import get_db_connection
+        conn = make_conn()
+        mock_init_pool.return_value.getconn.return_value = conn
+        set_cursor = conn.cursor.return_value.__enter__.return_value
+
+        with get_db_connection(readonly=True):
+            pass
+        with get_db_connection(readonly=True):
+            pass
+
+        self.assertEqual(set_cursor.execute.call_count, 1)
+
+        with get_db_connection(statement_timeout=500, lock_timeout=100):
+            pass
+
+        self.assertEqual(set_cursor.execute.call_count, 2)
+        self.assertEqual(set_cursor.execute.call_args[0][1], (False, 500, 100))
+
+    def test_dict_cursor_uses_lightweight_factory(self):
+        from api.lambda_layers.utils.python.utils.db_connection import dict_cursor, DictCursor
+        conn = make_conn()
+
+        dict_cursor(conn)
+
+        conn.cursor.assert_called_once_with(cursor_factory=DictCursor)
+
+
+class TestResilientConnectionPoolThreads(unittest.TestCase):
+
+    @patch(CONNECT)
+    def test_concurrent_checkouts_never_exceed_maxconn(self, mock_connect):
+        mock_connect.side_effect = lambda **kwargs: make_conn()
+        pool = ResilientConnectionPool(0, 3)
+        lock = threading.Lock()
+        in_use = []
+        peak = []
+
+        def worker():
+            for _ in range(50):
+                conn = pool.getconn()
+                with lock:
+                    in_use.append(conn)
+                    peak.append(len(in_use))
+                with lock:
+                    in_use.remove(conn)
+                pool.putconn(conn)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(max(peak), 3)
+        self.assertLessEqual(mock_connect.call_count, 3)
+
+    @patch.dict('os.environ', DB_ENV)
+    @patch('api.lambda_layers.utils.python.utils.db_connection._connection_pool', None)
+    @patch('api.lambda_layers.utils.python.utils.db_connection.ResilientConnectionPool')
+    def test_concurrent_first_requests_build_one_pool(self, mock_pool_class):
+        # A slow constructor widens the window in which threads could race.
+        mock_pool_class.side_effect = lambda *args, **kwargs: time.sleep(0.05) or MagicMock()
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def worker():
+            barrier.wait()
+            pools.append(init_connection_pool())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_pool_class.assert_called_once()
+        self.assertEqual(len({id(pool) for pool in pools}), 1)
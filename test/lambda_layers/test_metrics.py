@@ -0,0 +1,90 @@
+import io
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from api.lambda_layers.utils.python.utils import metrics
+from api.lambda_layers.utils.python.utils.metrics import (
+    start_invocation,
+    finish_invocation,
+    record_metric,
+    route_name,
+    instrument_connection,
+    InstrumentedConnection
+)
+
+EVENT = {'httpMethod': 'GET', 'resource': '/item/{id}'}
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_route_name_uses_method_and_resource(self):
+        self.assertEqual(route_name(EVENT), 'GET /item/{id}')
+        self.assertEqual(route_name({}), 'UNKNOWN unknown')
+
+    @patch.object(metrics, 'METRICS_MODE', 'off')
+    def test_off_mode_is_a_no_op(self):
+        conn = MagicMock()
+
+        token = start_invocation(EVENT)
+        record_metric('StatementTime', 1.0)
+
+        self.assertIsNone(token)
+        self.assertIs(instrument_connection(conn), conn)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch.object(metrics, 'METRICS_MODE', 'emf')
+    def test_emits_one_emf_line_per_invocation(self, mock_stdout):
+        token = start_invocation(EVENT)
+        record_metric('PoolWaitTime', 0.5)
+        record_metric('StatementTime', 2.0)
+        record_metric('StatementTime', 3.0)
+        record_metric('StatementCount', 1)
+        record_metric('StatementCount', 1)
+        finish_invocation(token)
+
+        lines = mock_stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        emf = json.loads(lines[0])
+        self.assertEqual(emf['Route'], 'GET /item/{id}')
+        self.assertEqual(emf['StatementTime'], [2.0, 3.0])
+        self.assertEqual(emf['StatementCount'], 2)
+        directive = emf['_aws']['CloudWatchMetrics'][0]
+        self.assertEqual(directive['Dimensions'], [['Route']])
+        self.assertIn({'Name': 'PoolWaitTime', 'Unit': 'Milliseconds'}, directive['Metrics'])
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch.object(metrics, 'METRICS_MODE', 'emf')
+    def test_instrumented_cursor_records_statements_and_rows(self, mock_stdout):
+        conn = MagicMock()
+        raw_cursor = conn.cursor.return_value
+        raw_cursor.__enter__.return_value = raw_cursor
+        raw_cursor.fetchall.return_value = [{'id': 1}, {'id': 2}]
+
+        token = start_invocation(EVENT)
+        wrapped = instrument_connection(conn)
+        with wrapped.cursor(cursor_factory='factory') as cursor:
+            cursor.execute('SELECT 1', (1,))
+            rows = cursor.fetchall()
+        finish_invocation(token)
+
+        self.assertIsInstance(wrapped, InstrumentedConnection)
+        conn.cursor.assert_called_once_with(cursor_factory='factory')
+        raw_cursor.execute.assert_called_once_with('SELECT 1', (1,))
+        self.assertEqual(rows, [{'id': 1}, {'id': 2}])
+        emf = json.loads(mock_stdout.getvalue())
+        self.assertEqual(emf['StatementCount'], 1)
+        self.assertEqual(emf['RowsReturned'], 2)
+        self.assertEqual(len(emf['StatementTime']), 1)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_wrapper_records_bytes_and_route(self, mock_stdout):
+        from utils import metrics as layer_metrics
+        from utils.lambda_exception_handler_wrapper import lambda_exception_handler_wrapper
+
+        with patch.object(layer_metrics, 'METRICS_MODE', 'emf'):
+            handler = lambda_exception_handler_wrapper(lambda event, context: {'statusCode': 200, 'body': '[1,2]'})
+            handler(EVENT, None)
+
+        emf = json.loads(mock_stdout.getvalue())
+        self.assertEqual(emf['BytesSerialized'], 5)
+        self.assertEqual(emf['Route'], 'GET /item/{id}')
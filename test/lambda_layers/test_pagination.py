@@ -0,0 +1,88 @@
+import unittest
+import datetime
+from unittest.mock import patch
+from api.lambda_layers.utils.python.utils.pagination import (
+    encode_cursor,
+    decode_cursor,
+    extract_pagination_params,
+    pagination_headers,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE
+)
+from api.lambda_layers.utils.python.utils.custom_exceptions import ValidationError
+
+
+class TestPagination(unittest.TestCase):
+
+    def test_cursor_round_trips_values(self):
+        cursor = encode_cursor([datetime.datetime(2025, 7, 2, 12, 0, 0, 123456), 7])
+
+        self.assertEqual(decode_cursor(cursor), ['2025-07-02T12:00:00.123456', 7])
+
+    def test_decode_cursor_rejects_tampered_payload(self):
+        cursor = encode_cursor(['2025-07-02T12:00:00', 7])
+        forged = encode_cursor(['2025-07-02T12:00:00', 8]).split('.')[0] + '.' + cursor.split('.')[1]
+
+        with self.assertRaises(ValidationError) as context:
+            decode_cursor(forged)
+        self.assertEqual(str(context.exception), 'Invalid pagination cursor')
+
+    def test_decode_cursor_rejects_garbage(self):
+        with self.assertRaises(ValidationError):
+            decode_cursor('not-a-cursor')
+
+    def test_decode_cursor_rejects_wrong_key_length(self):
+        with self.assertRaises(ValidationError):
+            decode_cursor(encode_cursor(['2025-07-02T12:00:00']), key_length=2)
+
+    def test_decode_cursor_rejects_cursor_signed_with_other_secret(self):
+        with patch.dict('os.environ', {'CURSOR_SECRET': 'one'}):
+            cursor = encode_cursor(['2025-07-02T12:00:00', 7])
+        with patch.dict('os.environ', {'CURSOR_SECRET': 'two'}):
+            with self.assertRaises(ValidationError):
+                decode_cursor(cursor)
+
+    def test_cursors_are_refused_without_a_secret(self):
+        cursor = encode_cursor(['2025-07-02T12:00:00', 7])
+        with patch.dict('os.environ', {'CURSOR_SECRET': ''}):
+            with self.assertRaises(RuntimeError):
+                encode_cursor(['2025-07-02T12:00:00', 7])
+            with self.assertRaises(RuntimeError):
+                decode_cursor(cursor)
+
+    def test_extract_pagination_params_defaults(self):
+        self.assertEqual(extract_pagination_params({}), (DEFAULT_PAGE_SIZE, None))
+
+    def test_extract_pagination_params_caps_limit(self):
+        event = {'queryStringParameters': {'limit': str(MAX_PAGE_SIZE + 1)}}
+
+        self.assertEqual(extract_pagination_params(event), (MAX_PAGE_SIZE, None))
+
+    def test_extract_pagination_params_rejects_non_integer_limit(self):
+        event = {'queryStringParameters': {'limit': 'abc'}}
+
+        with self.assertRaises(ValidationError) as context:
+            extract_pagination_params(event)
+        self.assertEqual(str(context.exception), 'limit must be an integer')
+
+    def test_extract_pagination_params_rejects_zero_limit(self):
+        event = {'queryStringParameters': {'limit': '0'}}
+
+        with self.assertRaises(ValidationError):
+            extract_pagination_params(event)
+
+    def test_extract_pagination_params_decodes_cursor(self):
+        event = {'queryStringParameters': {'limit': '10', 'cursor': encode_cursor(['2025-07-02T12:00:00', 7])}}
+
+        self.assertEqual(extract_pagination_params(event), (10, ['2025-07-02T12:00:00', 7]))
+
+    def test_pagination_headers_empty_without_next_cursor(self):
+        self.assertEqual(pagination_headers({}, 10, None), {})
+
+    def test_pagination_headers_include_next_link(self):
+        event = {'path': '/item', 'queryStringParameters': {'limit': '10'}}
+
+        headers = pagination_headers(event, 10, 'abc.def')
+
+        self.assertEqual(headers['X-Next-Cursor'], 'abc.def')
+        self.assertEqual(headers['Link'], '</item?limit=10&cursor=abc.def>; rel="next"')
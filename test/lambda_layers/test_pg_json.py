@@ -0,0 +1,73 @@
+import os
+import unittest
+import psycopg2
+import psycopg2.extras
+from api.lambda_layers.utils.python.utils import db_connection  # registers DEC2FLOAT
+from api.lambda_layers.utils.python.utils.serializer import dumps
+from api.lambda_layers.utils.python.utils.pg_json import json_price, json_timestamp, json_array
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+
+
+class TestPgJsonFragments(unittest.TestCase):
+
+    def test_fragments_contain_no_format_characters(self):
+        for fragment in (json_price('price'), json_timestamp('created_at'), json_array('row_to_json(r)', 'id')):
+            self.assertNotIn('%', fragment)
+
+    def test_json_array_applies_filter(self):
+        self.assertIn('FILTER (WHERE position <= %s)', json_array('row_to_json(r)', 'position', 'position <= %s'))
+
+
+@unittest.skipUnless(TEST_DATABASE_URL, 'TEST_DATABASE_URL is not set')
+class TestPgJsonMatchesSerializer(unittest.TestCase):
+
+    ROWS = [
+        ('Plain', '5.50', 'Simple', '2025-07-02 12:00:00'),
+        ('Whole price', '2.00', None, '2025-07-02 12:00:00.5'),
+        ('Café "crème" \\ /', '0.05', 'Line\nbreak\ttab\x01', '2025-07-02 12:00:00.000001'),
+        ('Emoji 😀', '99999999.99', '', '2025-12-31 23:59:59.123456'),
+        ('Cents', '10.10', 'x', '2025-01-01 00:00:00')
+    ]
+
+    def setUp(self):
+        self.conn = psycopg2.connect(TEST_DATABASE_URL)
+        with self.conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TEMP TABLE items (
+                    id SERIAL PRIMARY KEY,
+                    name VARCHAR(255) NOT NULL,
+                    price NUMERIC(10, 2) NOT NULL,
+                    description TEXT,
+                    created_at TIMESTAMP NOT NULL
+                );
+                """)
+            psycopg2.extras.execute_values(
+                cursor, 'INSERT INTO items (name, price, description, created_at) VALUES %s', self.ROWS)
+
+    def tearDown(self):
+        self.conn.rollback()
+        self.conn.close()
+
+    def test_rendered_body_is_byte_identical(self):
+        with self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            cursor.execute('SELECT id, name, price, description, created_at FROM items ORDER BY id;')
+            expected = dumps(cursor.fetchall())
+
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT {json_array('row_to_json(rendered)', 'items.id')}
+                FROM items
+                CROSS JOIN LATERAL (
+                    SELECT items.id, items.name, {json_price('items.price')} AS price,
+                        items.description, {json_timestamp('items.created_at')} AS created_at
+                ) AS rendered;
+                """)
+            rendered = cursor.fetchone()[0]
+
+        self.assertEqual(rendered.encode('utf-8'), expected.encode('utf-8'))
+
+    def test_empty_result_renders_empty_array(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"SELECT {json_array('row_to_json(items)', 'items.id')} FROM items WHERE false;")
+            self.assertEqual(cursor.fetchone()[0], dumps([]))
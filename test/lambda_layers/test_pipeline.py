@@ -0,0 +1,142 @@
+import os
+import time
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch, MagicMock, call
+from test.helper_funcs.setup_mock_db import setup_mock_db
+from utils.pipeline import execute_pipeline, init_pipeline_pool
+from utils.statements import register_statement
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+
+SELECT_NUMBER = register_statement('pipeline_test_select_number', 'SELECT %s::int AS n;')
+SELECT_PRICE = register_statement('pipeline_test_select_price', 'SELECT %s::numeric(10, 2) AS price;')
+INSERT_NOTE = register_statement('pipeline_test_insert_note', 'INSERT INTO pipeline_notes (note) VALUES (%s);')
+SELECT_NOTES = register_statement('pipeline_test_select_notes', 'SELECT note FROM pipeline_notes ORDER BY note;')
+DIVIDE_BY_ZERO = register_statement('pipeline_test_divide_by_zero', 'SELECT 1 / %s::int AS n;')
+
+
+class TestExecutePipeline(unittest.TestCase):
+
+    @patch('utils.pipeline.PIPELINE_ENABLED', False)
+    @patch('utils.pipeline.get_db_connection')
+    def test_psycopg2_runs_statements_in_order_on_one_connection(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection)
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchall.side_effect = [[{'n': 1}], [{'n': 2}]]
+
+        with patch('utils.pipeline.execute_statement') as mock_execute_statement:
+            results = execute_pipeline([(SELECT_NUMBER, (1,)), (SELECT_NUMBER, (2,))], readonly=True)
+
+        self.assertEqual(results, [[{'n': 1}], [{'n': 2}]])
+        mock_get_db_connection.assert_called_once_with(readonly=True)
+        self.assertEqual(mock_execute_statement.call_args_list, [
+            call(mock_cursor, SELECT_NUMBER, (1,)),
+            call(mock_cursor, SELECT_NUMBER, (2,))
+        ])
+
+    @patch('utils.pipeline.PIPELINE_ENABLED', False)
+    @patch('utils.pipeline.get_db_connection')
+    def test_psycopg2_statement_without_rows_returns_empty_list(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection)
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        mock_cursor.description = None
+
+        with patch('utils.pipeline.execute_statement'):
+            self.assertEqual(execute_pipeline([(INSERT_NOTE, ('a',))]), [[]])
+
+    @patch('utils.pipeline.PIPELINE_ENABLED', True)
+    @patch('utils.pipeline.get_pipeline_connection')
+    def test_psycopg_sends_statements_inside_one_transaction(self, mock_get_pipeline_connection):
+        mock_conn = MagicMock()
+        mock_get_pipeline_connection.return_value.__enter__.return_value = mock_conn
+        mock_conn.cursor.return_value.fetchall.return_value = [{'n': 1}]
+
+        results = execute_pipeline([(SELECT_NUMBER, (1,)), (SELECT_NUMBER, (2,))], readonly=True)
+
+        self.assertEqual(results, [[{'n': 1}], [{'n': 1}]])
+        mock_conn.pipeline.return_value.__enter__.assert_called_once()
+        self.assertEqual(mock_conn.execute.call_args_list, [call('BEGIN READ ONLY;'), call('COMMIT;')])
+        self.assertEqual(mock_conn.cursor.return_value.execute.call_args_list, [
+            call('SELECT %s::int AS n;', (1,)),
+            call('SELECT %s::int AS n;', (2,))
+        ])
+
+    @patch('utils.pipeline.PIPELINE_ENABLED', True)
+    @patch('utils.pipeline.get_pipeline_connection')
+    def test_psycopg_writes_begin_read_write_transaction(self, mock_get_pipeline_connection):
+        mock_conn = MagicMock()
+        mock_get_pipeline_connection.return_value.__enter__.return_value = mock_conn
+        mock_conn.cursor.return_value.description = None
+
+        self.assertEqual(execute_pipeline([(INSERT_NOTE, ('a',))]), [[]])
+        self.assertEqual(mock_conn.execute.call_args_list, [call('BEGIN;'), call('COMMIT;')])
+
+    @patch.dict('os.environ', {'DB_USER': 'user', 'DB_PASS': 'pass', 'DB_HOST': 'localhost', 'DB_PORT': '5432', 'DB_NAME': 'db'})
+    @patch('utils.pipeline._pipeline_pool', None)
+    @patch('utils.pipeline.ResilientConnectionPool')
+    def test_concurrent_first_requests_build_one_pipeline_pool(self, mock_pool_class):
+        # A slow constructor widens the window in which threads could race.
+        mock_pool_class.side_effect = lambda *args, **kwargs: time.sleep(0.05) or MagicMock()
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def worker():
+            barrier.wait()
+            pools.append(init_pipeline_pool())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_pool_class.assert_called_once()
+        self.assertEqual(len({id(pool) for pool in pools}), 1)
+
+
+@unittest.skipUnless(TEST_DATABASE_URL, 'TEST_DATABASE_URL is not set')
+class TestExecutePipelineAgainstPostgres(unittest.TestCase):
+
+    def setUp(self):
+        import psycopg
+        from psycopg.types.numeric import FloatLoader
+
+        psycopg.adapters.register_loader('numeric', FloatLoader)
+        self.conn = psycopg.connect(TEST_DATABASE_URL, autocommit=True)
+        self.conn.execute('CREATE TABLE pipeline_notes (note TEXT PRIMARY KEY);')
+
+        @contextmanager
+        def get_pipeline_connection():
+            yield self.conn
+
+        patcher = patch('utils.pipeline.get_pipeline_connection', get_pipeline_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        enabled = patch('utils.pipeline.PIPELINE_ENABLED', True)
+        enabled.start()
+        self.addCleanup(enabled.stop)
+
+    def tearDown(self):
+        self.conn.execute('DROP TABLE pipeline_notes;')
+        self.conn.close()
+
+    def test_results_come_back_in_order(self):
+        results = execute_pipeline([(SELECT_NUMBER, (1,)), (SELECT_PRICE, ('2.50',)), (SELECT_NUMBER, (3,))], readonly=True)
+
+        self.assertEqual(results, [[{'n': 1}], [{'price': 2.5}], [{'n': 3}]])
+
+    def test_writes_commit_together(self):
+        execute_pipeline([(INSERT_NOTE, ('a',)), (INSERT_NOTE, ('b',))])
+
+        self.assertEqual(execute_pipeline([(SELECT_NOTES, ())], readonly=True), [[{'note': 'a'}, {'note': 'b'}]])
+
+    def test_failed_statement_rolls_back_the_whole_pipeline(self):
+        import psycopg
+
+        with self.assertRaises(psycopg.Error):
+            execute_pipeline([(INSERT_NOTE, ('a',)), (DIVIDE_BY_ZERO, (0,)), (INSERT_NOTE, ('b',))])
+
+        self.conn.rollback()
+        self.assertEqual(self.conn.execute('SELECT count(*) FROM pipeline_notes;').fetchone()[0], 0)
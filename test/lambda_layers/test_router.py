@@ -0,0 +1,107 @@
+import os
+import re
+import json
+import unittest
+from unittest.mock import MagicMock
+from utils.router import Router, ROUTES
+from api.items.create_item.create_item import lambda_handler as create_item_handler
+
+API_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'api')
+TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'template.yml')
+ROUTER_TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'template.router.yml')
+
+
+def template_routes():
+    with open(TEMPLATE_PATH) as template_file:
+        template = template_file.read()
+
+    routes = {}
+    for body in re.findall(r'^    Type: AWS::Serverless::Function\n(.*?)(?=^  \w+:\n|^\S|\Z)', template, re.M | re.S):
+        code_uri = re.search(r'CodeUri: \./api/(\S+?)/?$', body, re.M).group(1)
+        module = re.search(r'Handler: (\w+)\.lambda_handler', body).group(1)
+        for path, method in re.findall(r'Path: (\S+)\n\s+Method: (\S+)', body):
+            routes[(method.upper(), path)] = f'{code_uri}/{module}'
+    return routes
+
+
+def template_function_bodies(path=TEMPLATE_PATH):
+    with open(path) as template_file:
+        template = template_file.read()
+
+    return re.findall(r'^    Type: AWS::Serverless::Function\n(.*?)(?=^  \w+:\n|^\S|\Z)', template, re.M | re.S)
+
+
+class TestRouter(unittest.TestCase):
+
+    def test_route_table_matches_template(self):
+        self.assertEqual(ROUTES, template_routes())
+
+    def test_router_sets_every_function_setting_to_the_same_value(self):
+        router_body, = template_function_bodies(ROUTER_TEMPLATE_PATH)
+        router_settings = dict(re.findall(r'^          (\w+): (.+)$', router_body, re.M))
+
+        for body in template_function_bodies():
+            for name, value in re.findall(r'^          (\w+): (.+)$', body, re.M):
+                with self.subTest(setting=name):
+                    self.assertEqual(router_settings.get(name), value)
+
+    def test_paginating_functions_set_cursor_secret(self):
+        api_dir = os.path.join(os.path.dirname(TEMPLATE_PATH), 'api')
+        for body in template_function_bodies():
+            code_uri = re.search(r'CodeUri: \./api/(\S+?)/?$', body, re.M).group(1)
+            module = re.search(r'Handler: (\w+)\.lambda_handler', body).group(1)
+            with open(os.path.join(api_dir, code_uri, f'{module}.py')) as handler_file:
+                if 'utils.pagination' not in handler_file.read():
+                    continue
+            with self.subTest(function=code_uri):
+                for setting in ('CURSOR_SECRET: !Ref CursorSecret', 'DEFAULT_PAGE_SIZE:', 'MAX_PAGE_SIZE:'):
+                    self.assertIn(setting, body)
+
+    def test_dispatches_to_handler_with_same_response(self):
+        router = Router(API_DIR)
+        event = {'httpMethod': 'POST', 'resource': '/item', 'body': json.dumps({'name': '', 'price': 1.5})}
+
+        self.assertEqual(router(event, None), create_item_handler(event, None))
+        self.assertEqual(router(event, None)['statusCode'], 400)
+
+    def test_handlers_are_loaded_once_on_first_use(self):
+        handler = MagicMock(return_value={'statusCode': 200, 'body': '[]'})
+        router = Router(API_DIR, routes={('GET', '/thing'): 'things/get_things/get_things'})
+        router._load_handler = MagicMock(return_value=handler)
+
+        event = {'httpMethod': 'GET', 'resource': '/thing'}
+        router(event, None)
+
+        router._load_handler.assert_called_once_with('things/get_things/get_things')
+        handler.assert_called_once_with(event, None)
+
+    def test_loaded_handlers_are_cached(self):
+        router = Router(API_DIR)
+
+        first = router.resolve('GET', '/item/{id}')
+        second = router.resolve('GET', '/item/{id}')
+
+        self.assertIs(first, second)
+        self.assertIsNone(router.resolve('GET', '/nothing'))
+
+    def test_unknown_resource_returns_404(self):
+        response = Router(API_DIR)({'httpMethod': 'GET', 'resource': '/nothing'}, None)
+
+        self.assertEqual(response['statusCode'], 404)
+        self.assertEqual(json.loads(response['body']), {'error': 'No route for GET /nothing'})
+
+    def test_unsupported_method_returns_405(self):
+        response = Router(API_DIR)({'httpMethod': 'PATCH', 'resource': '/item'}, None)
+
+        self.assertEqual(response['statusCode'], 405)
+        self.assertEqual(json.loads(response['body']), {'error': 'Method PATCH not allowed on /item'})
+
+    def test_match_path_extracts_path_parameters(self):
+        router = Router(API_DIR)
+
+        self.assertEqual(router.match_path('/item'), ('/item', None))
+        self.assertEqual(router.match_path('/item/7'), ('/item/{id}', {'id': '7'}))
+        self.assertEqual(router.match_path('/items/batch'), ('/items/batch', None))
+        self.assertEqual(router.match_path('/item/search'), ('/item/search', None))
+        self.assertEqual(router.match_path('/category/3/items'), ('/category/{id}/items', {'id': '3'}))
+        self.assertEqual(router.match_path('/item/7/extra'), (None, None))
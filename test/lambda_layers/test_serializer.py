@@ -0,0 +1,45 @@
+import sys
+import json
+import importlib
+import uuid
+import datetime
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+import api.lambda_layers.utils.python.utils.serializer as serializer
+from api.lambda_layers.utils.python.utils.serializer import dumps, _default
+
+class TestSerializer(unittest.TestCase):
+
+    def test_encodes_decimal_as_number(self):
+        self.assertEqual(json.loads(dumps({'price': Decimal('1.99')})), {'price': 1.99})
+
+    def test_encodes_datetime_and_date_as_isoformat(self):
+        created_at = datetime.datetime(2025, 7, 2, 12, 30, 15, 120)
+        body = json.loads(dumps({'created_at': created_at, 'day': created_at.date()}))
+
+        self.assertEqual(body, {'created_at': created_at.isoformat(), 'day': '2025-07-02'})
+
+    def test_matches_stdlib_output_for_rows(self):
+        rows = [
+            {'id': 1, 'name': 'Burger', 'price': 5.5, 'description': None,
+             'created_at': datetime.datetime(2025, 7, 2, 12, 0)},
+            {'id': 2, 'name': 'Café crème', 'price': 2.0, 'description': 'ünïcode',
+             'created_at': datetime.datetime(2025, 7, 3, 8, 15, 0, 500)}
+        ]
+
+        self.assertEqual(json.loads(dumps(rows)), json.loads(json.dumps(rows, default=_default)))
+
+    def test_unknown_types_fall_back_to_str(self):
+        value = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+        self.assertEqual(json.loads(dumps([value])), [str(value)])
+
+    def test_stdlib_fallback_returns_compact_unicode_json(self):
+        try:
+            with patch.dict(sys.modules, {'orjson': None}):
+                importlib.reload(serializer)
+                self.assertEqual(serializer.JSON_BACKEND, 'json')
+                self.assertEqual(serializer.dumps({'name': 'Café', 'price': Decimal('3.10')}), '{"name":"Café","price":3.1}')
+        finally:
+            importlib.reload(serializer)
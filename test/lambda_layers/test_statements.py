@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from api.lambda_layers.utils.python.utils import statements
+from api.lambda_layers.utils.python.utils.statements import (
+    register_statement,
+    get_statement,
+    execute_statement,
+    forget_prepared_statements
+)
+
+register_statement('test_get_item', 'SELECT id FROM items WHERE id = %s AND name = %s;')
+register_statement('test_get_all', 'SELECT id FROM items;')
+
+
+class TestStatements(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = MagicMock()
+        self.cursor = MagicMock()
+        self.cursor.connection = self.conn
+        self.prepare_cursor = self.conn.cursor.return_value
+
+    def test_register_converts_placeholders_to_positional(self):
+        self.assertEqual(get_statement('test_get_item').prepare_sql,
+                         'PREPARE test_get_item AS SELECT id FROM items WHERE id = $1 AND name = $2;')
+
+    def test_register_unescapes_literal_percent_for_prepare(self):
+        register_statement('test_word_similarity', 'SELECT id FROM items WHERE %s <%% name;')
+        statement = get_statement('test_word_similarity')
+
+        self.assertEqual(statement.param_count, 1)
+        self.assertEqual(statement.prepare_sql, 'PREPARE test_word_similarity AS SELECT id FROM items WHERE $1 <% name;')
+
+    def test_register_rejects_conflicting_sql(self):
+        with self.assertRaises(ValueError):
+            register_statement('test_get_item', 'SELECT 1;')
+
+    def test_register_rejects_unsafe_names(self):
+        with self.assertRaises(ValueError):
+            register_statement('drop table; --', 'SELECT 1;')
+
+    @patch.object(statements, 'PREPARED_STATEMENTS_ENABLED', True)
+    def test_prepares_once_per_connection_then_executes(self):
+        execute_statement(self.cursor, 'test_get_item', (1, 'Burger'))
+        execute_statement(self.cursor, 'test_get_item', (2, 'Fries'))
+
+        self.prepare_cursor.execute.assert_called_once_with(get_statement('test_get_item').prepare_sql)
+        self.cursor.execute.assert_called_with('EXECUTE test_get_item (%s, %s);', (2, 'Fries'))
+        self.assertEqual(self.cursor.execute.call_count, 2)
+
+    @patch.object(statements, 'PREPARED_STATEMENTS_ENABLED', True)
+    def test_prepares_again_on_new_connection(self):
+        other_cursor = MagicMock()
+
+        execute_statement(self.cursor, 'test_get_all')
+        execute_statement(other_cursor, 'test_get_all')
+
+        self.prepare_cursor.execute.assert_called_once()
+        other_cursor.connection.cursor.return_value.execute.assert_called_once()
+        other_cursor.execute.assert_called_once_with('EXECUTE test_get_all;')
+
+    @patch.object(statements, 'PREPARED_STATEMENTS_ENABLED', True)
+    def test_forget_forces_prepare_again(self):
+        execute_statement(self.cursor, 'test_get_all')
+        forget_prepared_statements(self.conn)
+        execute_statement(self.cursor, 'test_get_all')
+
+        self.assertEqual(self.prepare_cursor.execute.call_count, 2)
+
+    @patch.object(statements, 'PREPARED_STATEMENTS_ENABLED', False)
+    def test_disabled_sends_plain_sql(self):
+        execute_statement(self.cursor, 'test_get_item', (1, 'Burger'))
+
+        self.cursor.execute.assert_called_once_with('SELECT id FROM items WHERE id = %s AND name = %s;', (1, 'Burger'))
+        self.conn.cursor.assert_not_called()
+
+    def test_rejects_wrong_parameter_count(self):
+        with self.assertRaises(ValueError):
+            execute_statement(self.cursor, 'test_get_item', (1,))
@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from api.lambda_layers.utils.python.utils.table_versions import bump_table_version, get_table_versions
+from test.helper_funcs.setup_mock_db import setup_mock_db
+
+
+class TestTableVersions(unittest.TestCase):
+
+    def test_bump_table_version_upserts_counter(self):
+        mock_cursor = MagicMock()
+
+        bump_table_version(mock_cursor, 'items')
+
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ('items',))
+
+    def test_bump_table_version_rejects_unknown_table(self):
+        with self.assertRaises(ValueError):
+            bump_table_version(MagicMock(), 'users')
+
+    @patch('api.lambda_layers.utils.python.utils.table_versions.get_db_connection')
+    def test_get_table_versions_returns_versions_in_requested_order(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[('items', 4), ('categories', 2)])
+
+        self.assertEqual(get_table_versions(('categories', 'items', 'item_categories')), (2, 4, 0))
+
+    @patch('api.lambda_layers.utils.python.utils.table_versions.get_db_connection')
+    def test_get_table_versions_returns_none_on_db_error(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, side_effect=Exception('DB down'))
+
+        self.assertIsNone(get_table_versions(('items',)))
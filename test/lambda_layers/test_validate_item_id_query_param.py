@@ -32,3 +32,9 @@ class TestExtractItemIdFromQueryParam(unittest.TestCase):
         with self.assertRaises(ValidationError) as context:
             extract_item_id_from_query_param(event)
         self.assertIn('Invalid or missing ID in path', str(context.exception))
+
+    def test_raises_error_with_id_outside_int4(self):
+        event = {'queryStringParameters': {'itemID': '99999999999'}}
+        with self.assertRaises(ValidationError) as context:
+            extract_item_id_from_query_param(event)
+        self.assertIn('ID must be between', str(context.exception))
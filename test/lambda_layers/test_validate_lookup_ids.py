@@ -0,0 +1,54 @@
+import json
+import unittest
+from api.lambda_layers.utils.python.utils.validation import extract_ids_query_param, validate_lookup_event_body
+from api.lambda_layers.utils.python.utils.custom_exceptions import ValidationError
+
+class TestValidateLookupIds(unittest.TestCase):
+
+    def test_query_param_keeps_order_and_drops_duplicates(self):
+        event = {'queryStringParameters': {'ids': '3, 1,2,,3'}}
+        self.assertEqual(extract_ids_query_param(event, 10), [3, 1, 2])
+
+    def test_query_param_rejects_non_integer(self):
+        event = {'queryStringParameters': {'ids': '1,two'}}
+        with self.assertRaises(ValidationError) as context:
+            extract_ids_query_param(event, 10)
+        self.assertEqual(str(context.exception), 'ids must be a comma-separated list of integers')
+
+    def test_query_param_rejects_empty_list(self):
+        event = {'queryStringParameters': {'ids': ' , '}}
+        with self.assertRaises(ValidationError):
+            extract_ids_query_param(event, 10)
+
+    def test_query_param_enforces_maximum(self):
+        event = {'queryStringParameters': {'ids': ','.join(str(n) for n in range(1, 12))}}
+        with self.assertRaises(ValidationError) as context:
+            extract_ids_query_param(event, 10)
+        self.assertEqual(str(context.exception), 'Cannot look up more than 10 items in one request')
+
+    def test_query_param_rejects_ids_outside_int4(self):
+        event = {'queryStringParameters': {'ids': '1,99999999999'}}
+        with self.assertRaises(ValidationError) as context:
+            extract_ids_query_param(event, 10)
+        self.assertEqual(str(context.exception), 'ids must be between -2147483648 and 2147483647')
+
+    def test_body_rejects_ids_outside_int4(self):
+        event = {'body': json.dumps({'ids': [2 ** 31]})}
+        with self.assertRaises(ValidationError):
+            validate_lookup_event_body(event, 10)
+
+    def test_body_returns_ids(self):
+        event = {'body': json.dumps({'ids': [5, 4, 5]})}
+        self.assertEqual(validate_lookup_event_body(event, 10), [5, 4])
+
+    def test_body_rejects_non_integer_ids(self):
+        for ids in ([1, '2'], [True], [], None):
+            with self.subTest(ids=ids):
+                with self.assertRaises(ValidationError) as context:
+                    validate_lookup_event_body({'body': json.dumps({'ids': ids})}, 10)
+                self.assertEqual(str(context.exception), 'ids must be a non-empty list of integers')
+
+    def test_body_requires_body(self):
+        with self.assertRaises(ValidationError) as context:
+            validate_lookup_event_body({}, 10)
+        self.assertEqual(str(context.exception), 'Request body is required')
@@ -28,3 +28,11 @@ class TestExtractIdPathParam(unittest.TestCase):
             extract_id_path_param(event)
         self.assertIn('Invalid or missing path ID', str(context.exception))
 
+    def test_raises_error_with_id_outside_int4(self):
+        for raw_id in ('99999999999', '-2147483649'):
+            with self.assertRaises(ValidationError) as context:
+                extract_id_path_param({'pathParameters': {'id': raw_id}})
+            self.assertIn('ID must be between', str(context.exception))
+
+    def test_accepts_int4_limit(self):
+        self.assertEqual(extract_id_path_param({'pathParameters': {'id': '2147483647'}}), 2147483647)
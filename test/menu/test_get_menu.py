@@ -0,0 +1,183 @@
+import os
+import json
+import unittest
+import threading
+import psycopg2
+import psycopg2.errors
+from unittest.mock import patch
+from api.menu.get_menu.get_menu import lambda_handler, MENU_SQL, GET_MENU_SNAPSHOT_STATEMENT
+from utils.statements import get_statement
+from test.helper_funcs.setup_mock_db import setup_mock_db
+from db.migrate import migrate
+
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+
+MENU_BODY = '[{"id":1,"name":"Burgers","items":[{"id":2,"name":"Cheeseburger","price":5.5}]},{"id":3,"name":"Sides","items":[]}]'
+
+def executed_sql(mock_get_db_connection):
+    mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    return ' '.join(str(call.args[0]) for call in mock_cursor.execute.call_args_list)
+
+
+class TestGetMenu(unittest.TestCase):
+
+    @patch("api.menu.get_menu.get_menu.get_db_connection")
+    def test_lambda_handler_returns_snapshot_body(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchone=(MENU_BODY,))
+
+        response = lambda_handler({}, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertIs(response['body'], MENU_BODY)
+        self.assertEqual(json.loads(response['body'])[0]['items'][0]['price'], 5.5)
+        self.assertNotIn('EXECUTE get_menu;', executed_sql(mock_get_db_connection))
+
+    @patch("api.menu.get_menu.get_menu.get_db_connection")
+    def test_lambda_handler_renders_live_before_snapshot_table_exists(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchone=(MENU_BODY,))
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+
+        def execute(sql, params=None):
+            if 'get_menu_snapshot' in sql:
+                raise psycopg2.errors.UndefinedTable('relation "menu_category_snapshots" does not exist')
+
+        mock_cursor.execute.side_effect = execute
+
+        response = lambda_handler({}, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(response['body'], MENU_BODY)
+        self.assertIn('EXECUTE get_menu;', executed_sql(mock_get_db_connection))
+
+    @patch("api.menu.get_menu.get_menu.MENU_SNAPSHOT_ENABLED", False)
+    @patch("api.menu.get_menu.get_menu.get_db_connection")
+    def test_lambda_handler_skips_snapshot_when_disabled(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchone=('[]',))
+
+        response = lambda_handler({}, None)
+
+        self.assertEqual(response['body'], '[]')
+        self.assertNotIn('get_menu_snapshot', executed_sql(mock_get_db_connection))
+
+    @patch("api.menu.get_menu.get_menu.get_db_connection")
+    def test_lambda_handler_throws_database_error(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, side_effect=psycopg2.Error('DB Error'))
+
+        response = lambda_handler({}, None)
+
+        self.assertEqual(response['statusCode'], 500)
+        self.assertEqual(json.loads(response['body']), {'error': 'Database error'})
+
+
+@unittest.skipUnless(TEST_DATABASE_URL, 'TEST_DATABASE_URL is not set')
+class TestMenuSnapshotTriggers(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = psycopg2.connect(TEST_DATABASE_URL)
+        with self.conn.cursor() as cursor:
+            cursor.execute('CREATE SCHEMA menu_test; SET search_path TO menu_test, public;')
+        self.conn.commit()
+        migrate(self.conn, log=lambda message: None)
+
+        self.execute("""
+            INSERT INTO categories (name) VALUES ('Sides'), ('Burgers'), ('Drinks');
+            INSERT INTO items (name, price) VALUES ('Fries', 2.50), ('Cheeseburger', 5.00), ('Cola', 1.99), ('Onion Rings', 3.25);
+            INSERT INTO item_categories (item_id, category_id) VALUES (1, 1), (4, 1), (2, 2), (3, 3), (1, 3);
+            """)
+
+    def tearDown(self):
+        self.conn.rollback()
+        with self.conn.cursor() as cursor:
+            cursor.execute('DROP SCHEMA menu_test CASCADE;')
+        self.conn.commit()
+        self.conn.close()
+
+    def execute(self, sql):
+        with self.conn.cursor() as cursor:
+            cursor.execute(sql)
+        self.conn.commit()
+
+    def second_connection(self):
+        conn = psycopg2.connect(TEST_DATABASE_URL)
+        self.addCleanup(conn.close)
+        with conn.cursor() as cursor:
+            cursor.execute('SET search_path TO menu_test, public;')
+        conn.commit()
+        return conn
+
+    def snapshot_and_live(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute(get_statement(GET_MENU_SNAPSHOT_STATEMENT).sql)
+            snapshot = cursor.fetchone()[0]
+            cursor.execute(MENU_SQL)
+            live = cursor.fetchone()[0]
+        self.conn.commit()
+        return snapshot, live
+
+    def test_snapshot_matches_live_query(self):
+        snapshot, live = self.snapshot_and_live()
+
+        self.assertEqual(snapshot, live)
+        menu = json.loads(snapshot)
+        self.assertEqual([category['name'] for category in menu], ['Burgers', 'Drinks', 'Sides'])
+        self.assertEqual(menu[0]['items'], [{'id': 2, 'name': 'Cheeseburger', 'price': 5.0}])
+
+    def test_snapshot_follows_writes(self):
+        for sql in (
+            "UPDATE items SET price = 2.75 WHERE id = 1;",
+            "UPDATE items SET deleted = TRUE WHERE id = 4;",
+            "UPDATE item_categories SET deleted = TRUE WHERE item_id = 1 AND category_id = 3;",
+            "INSERT INTO categories (name) VALUES ('Desserts');",
+            "UPDATE categories SET deleted = TRUE WHERE id = 2;",
+            "UPDATE categories SET name = 'A Sides' WHERE id = 1;"
+        ):
+            with self.subTest(sql=sql):
+                self.execute(sql)
+                snapshot, live = self.snapshot_and_live()
+                self.assertEqual(snapshot, live)
+
+        self.assertEqual(json.loads(snapshot), [
+            {'id': 1, 'name': 'A Sides', 'items': [{'id': 1, 'name': 'Fries', 'price': 2.75}]},
+            {'id': 4, 'name': 'Desserts', 'items': []},
+            {'id': 3, 'name': 'Drinks', 'items': [{'id': 3, 'name': 'Cola', 'price': 1.99}]}
+        ])
+
+    def test_writers_of_different_categories_do_not_wait_for_each_other(self):
+        other = self.second_connection()
+        with self.conn.cursor() as cursor:
+            cursor.execute("UPDATE categories SET name = 'Mains' WHERE id = 2;")
+
+        with other.cursor() as cursor:
+            cursor.execute("SET lock_timeout = '1s';")
+            cursor.execute("UPDATE categories SET name = 'Soft Drinks' WHERE id = 3;")
+        other.commit()
+        self.conn.commit()
+
+        snapshot, live = self.snapshot_and_live()
+        self.assertEqual(snapshot, live)
+        self.assertEqual([category['name'] for category in json.loads(snapshot)], ['Mains', 'Sides', 'Soft Drinks'])
+
+    def test_concurrent_writers_of_one_category_both_reach_the_snapshot(self):
+        other = self.second_connection()
+        with self.conn.cursor() as cursor:
+            cursor.execute("UPDATE items SET price = 2.75 WHERE id = 1;")
+
+        # Fries and Onion Rings are both in Sides, so the second writer has to
+        # wait for the first and then render the category with its change.
+        second = threading.Thread(target=lambda: self.run_and_commit(other, "UPDATE items SET price = 3.50 WHERE id = 4;"))
+        second.start()
+        second.join(0.5)
+        self.assertTrue(second.is_alive())
+        self.conn.commit()
+        second.join()
+
+        snapshot, live = self.snapshot_and_live()
+        self.assertEqual(snapshot, live)
+        sides = next(category for category in json.loads(snapshot) if category['name'] == 'Sides')
+        self.assertEqual([item['price'] for item in sides['items']], [2.75, 3.5])
+
+    @staticmethod
+    def run_and_commit(conn, sql):
+        with conn.cursor() as cursor:
+            cursor.execute(sql)
+        conn.commit()
@@ -2,6 +2,7 @@ import unittest
 import psycopg2
 from unittest.mock import patch
 import json
+from decimal import Decimal
 from api.orders.create_order.create_order import lambda_handler, post_order_to_db
 from test.helper_funcs.setup_mock_db import setup_mock_db
 from utils.custom_exceptions import DatabaseInsertError
@@ -124,3 +125,108 @@ class TestCreateOrder(unittest.TestCase):
             post_order_to_db()
 
         self.assertEqual(str(context.exception), "Unexpected error")
+
+    @patch("api.orders.create_order.create_order.get_db_connection")
+    def test_lambda_handler_creates_order_with_lines_in_constant_round_trips(self, mock_get_db_connection):
+        created = {
+            'id': 2,
+            'status': 'pending',
+            'total': Decimal('26.00'),
+            'created_at': '2025-07-02T12:00:00',
+            'items': [
+                {'item_id': 1, 'quantity': 3, 'unit_price': 5.00},
+                {'item_id': 2, 'quantity': 1, 'unit_price': 11.00}
+            ]
+        }
+        setup_mock_db(
+            mock_get_db_connection,
+            fetchone=created,
+            fetchall=[{'id': 1, 'price': Decimal('5.00')}, {'id': 2, 'price': Decimal('11.00')}]
+        )
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+
+        event = {'body': json.dumps({'items': [
+            {'item_id': 1, 'quantity': 2},
+            {'item_id': 2, 'quantity': 1},
+            {'item_id': 1, 'quantity': 1}
+        ]})}
+
+        response = lambda_handler(event, None)
+        body = json.loads(response['body'])
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['total'], 26.0)
+        self.assertEqual(len(body['items']), 2)
+        self.assertEqual(mock_cursor.execute.call_count, 3)
+
+        insert_params = mock_cursor.execute.call_args_list[1][0][1]
+        self.assertEqual(insert_params, ([1, 2], [3, 1], [Decimal('5.00'), Decimal('11.00')]))
+
+    @patch("api.orders.create_order.create_order.get_db_connection")
+    def test_lambda_handler_returns_404_for_missing_items(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[{'id': 1, 'price': Decimal('5.00')}])
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+
+        event = {'body': json.dumps({'items': [{'item_id': 1, 'quantity': 1}, {'item_id': 7, 'quantity': 2}]})}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 404)
+        self.assertEqual(json.loads(response['body'])['error'], 'No Active items found at ID: 7')
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+
+    def test_lambda_handler_rejects_invalid_quantity(self):
+        event = {'body': json.dumps({'items': [{'item_id': 1, 'quantity': 0}]})}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertIn('quantity', json.loads(response['body'])['error'])
+
+    @patch("api.orders.create_order.create_order.MAX_ORDER_LINES", 2)
+    def test_lambda_handler_rejects_too_many_lines(self):
+        event = {'body': json.dumps({'items': [{'item_id': item_id, 'quantity': 1} for item_id in range(1, 4)]})}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body'])['error'], 'Cannot order more than 2 different items in one order')
+
+    def test_lambda_handler_rejects_out_of_range_line_values(self):
+        for line in ({'item_id': 2 ** 31, 'quantity': 1}, {'item_id': 1, 'quantity': 1001}):
+            with self.subTest(line=line):
+                response = lambda_handler({'body': json.dumps({'items': [line]})}, None)
+
+                self.assertEqual(response['statusCode'], 400)
+
+    def test_lambda_handler_rejects_repeated_lines_over_the_quantity_cap(self):
+        event = {'body': json.dumps({'items': [{'item_id': 1, 'quantity': 600}, {'item_id': 1, 'quantity': 600}]})}
+
+        response = lambda_handler(event, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body'])['error'], 'Cannot order more than 1000 of item 1 in one order')
+
+    @patch("api.orders.create_order.create_order.get_db_connection")
+    def test_lambda_handler_rejects_total_too_large_for_the_orders_table(self, mock_get_db_connection):
+        setup_mock_db(mock_get_db_connection, fetchall=[{'id': 1, 'price': Decimal('99999999.00')}])
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+
+        response = lambda_handler({'body': json.dumps({'items': [{'item_id': 1, 'quantity': 2}]})}, None)
+
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(json.loads(response['body'])['error'], 'Order total cannot exceed 99999999.99')
+        self.assertEqual(mock_cursor.execute.call_count, 1)
+
+    @patch("api.orders.create_order.create_order.get_db_connection")
+    def test_lambda_handler_totals_text_prices_as_decimals(self, mock_get_db_connection):
+        created = {'id': 3, 'status': 'pending', 'total': 99999999.99, 'created_at': '2025-07-02T12:00:00', 'items': []}
+        setup_mock_db(mock_get_db_connection, fetchone=created, fetchall=[{'id': 1, 'price': '33333333.33'}])
+        mock_cursor = mock_get_db_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+
+        response = lambda_handler({'body': json.dumps({'items': [{'item_id': 1, 'quantity': 3}]})}, None)
+
+        self.assertEqual(response['statusCode'], 200)
+        self.assertIn('price::text', mock_cursor.execute.call_args_list[0][0][0])
+        insert_params = mock_cursor.execute.call_args_list[1][0][1]
+        self.assertEqual(insert_params, ([1], [3], [Decimal('33333333.33')]))
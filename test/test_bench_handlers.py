@@ -0,0 +1,34 @@
+import os
+import sys
+import json
+import unittest
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# The benchmark sets its own environment on import, so it runs in a separate
+# interpreter rather than leaking CACHE_TTL_SECONDS and friends into the suite.
+SMOKE_SCRIPT = """
+import json, logging
+logging.disable(logging.CRITICAL)
+from benchmarks.bench_handlers import build_cases, run_case
+print(json.dumps({name: run_case(module_name, event, fetchone, fetchall, 2)['status']
+                  for name, module_name, event, fetchone, fetchall in build_cases()}))
+"""
+
+
+class TestBenchHandlers(unittest.TestCase):
+
+    def test_every_case_runs_against_the_current_handlers(self):
+        result = subprocess.run(
+            [sys.executable, '-c', SMOKE_SCRIPT], cwd=ROOT, env={**os.environ, 'PYTHONPATH': ROOT},
+            capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        statuses = json.loads(result.stdout.strip().splitlines()[-1])
+        for name, status in statuses.items():
+            with self.subTest(case=name):
+                if name.startswith('error:'):
+                    self.assertEqual(status, 400)
+                else:
+                    self.assertLess(status, 300)
@@ -0,0 +1,96 @@
+import json
+import email.message
+import threading
+import unittest
+import http.client
+from api.local_server import build_event, create_server
+
+
+def make_headers(pairs):
+    headers = email.message.Message()
+    for name, value in pairs:
+        headers[name] = value
+    return headers
+
+
+class TestBuildEvent(unittest.TestCase):
+
+    def setUp(self):
+        self.server = create_server(port=0, workers=2, quiet=True, preload=False)
+
+    def tearDown(self):
+        self.server.server_close()
+
+    def test_builds_api_gateway_event_for_templated_route(self):
+        headers = make_headers([('Accept-Encoding', 'gzip'), ('X-Tag', 'a'), ('X-Tag', 'b')])
+
+        event = build_event(self.server.router, 'GET', '/category/3/items?limit=5&tag=a&tag=b', headers, b'')
+
+        self.assertEqual(event['resource'], '/category/{id}/items')
+        self.assertEqual(event['pathParameters'], {'id': '3'})
+        self.assertEqual(event['queryStringParameters'], {'limit': '5', 'tag': 'b'})
+        self.assertEqual(event['multiValueQueryStringParameters'], {'limit': ['5'], 'tag': ['a', 'b']})
+        self.assertEqual(event['multiValueHeaders']['X-Tag'], ['a', 'b'])
+        self.assertIsNone(event['body'])
+
+    def test_builds_event_without_parameters(self):
+        event = build_event(self.server.router, 'POST', '/item', make_headers([]), b'{"name": "Burger"}')
+
+        self.assertEqual(event['resource'], '/item')
+        self.assertIsNone(event['pathParameters'])
+        self.assertIsNone(event['queryStringParameters'])
+        self.assertEqual(event['body'], '{"name": "Burger"}')
+
+
+class TestLocalServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = create_server(port=0, workers=4, quiet=True, preload=False)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, method, path, body=None):
+        conn = http.client.HTTPConnection('127.0.0.1', self.server.server_address[1], timeout=5)
+        try:
+            conn.request(method, path, body=body, headers={'Connection': 'close'})
+            response = conn.getresponse()
+            return response.status, response.getheader('Content-Type'), response.read()
+        finally:
+            conn.close()
+
+    def test_serves_handler_responses_over_http(self):
+        status, content_type, body = self.request('POST', '/item', json.dumps({'name': '', 'price': 1.5}))
+
+        self.assertEqual(status, 400)
+        self.assertEqual(content_type, 'application/json')
+        self.assertEqual(json.loads(body), {'error': 'Value error, Name field must not be empty'})
+
+    def test_unknown_path_returns_404(self):
+        status, _, body = self.request('GET', '/nothing')
+
+        self.assertEqual(status, 404)
+        self.assertEqual(json.loads(body), {'error': 'No route for GET /nothing'})
+
+    def test_undecodable_body_returns_400(self):
+        status, _, body = self.request('POST', '/item', b'\x1f\x8b\x08\x00\xff')
+
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(body), {'error': 'Request body could not be decoded'})
+
+    def test_handles_concurrent_requests(self):
+        results = []
+
+        def call():
+            results.append(self.request('DELETE', '/item')[0])
+
+        threads = [threading.Thread(target=call) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [405] * 16)